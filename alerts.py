@@ -23,7 +23,7 @@ SETUP:
        - Generate a password for "Mail"
     2. Set environment variables:
        - EMAIL_SMTP_SERVER (default: smtp.gmail.com)
-       - EMAIL_SMTP_PORT (default: 587)
+       - EMAIL_SMTP_PORT (default: 587; use 465 for implicit TLS)
        - EMAIL_USERNAME (your email)
        - EMAIL_PASSWORD (your app password)
        - EMAIL_TO (recipient email)
@@ -51,14 +51,27 @@ HOW TO USE:
 
 import os
 import json
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import time
+import atexit
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from collections import OrderedDict, deque
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
 import logging
 
 logger = logging.getLogger(__name__)
 
+# requests is optional - only needed for Slack alerts
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+except ImportError:
+    requests = None
+
 
 # =============================================================================
 # CONFIGURATION
@@ -75,14 +88,83 @@ EMAIL_USERNAME = os.environ.get('EMAIL_USERNAME', '')
 EMAIL_PASSWORD = os.environ.get('EMAIL_PASSWORD', '')
 EMAIL_TO = os.environ.get('EMAIL_TO', '')
 
+# Seconds to wait on the SMTP server before giving up (never hang a scrape)
+SMTP_TIMEOUT = 10
+
 # Enable/disable alerts
 ALERTS_ENABLED = os.environ.get('ALERTS_ENABLED', 'true').lower() == 'true'
 
+# Suppress repeat failure alerts with the same job + error for this many seconds
+ALERT_DEDUP_TTL = int(os.environ.get('ALERT_DEDUP_TTL', '600'))
+
+# Buffer success messages and post them to Slack in one request
+ALERTS_BATCH = os.environ.get('ALERTS_BATCH', 'false').lower() == 'true'
+
+
+def _now_str():
+    """Current time as 'YYYY-MM-DD HH:MM:SS' (cheaper than strftime)."""
+    return datetime.now().replace(microsecond=0).isoformat(sep=' ')
+
 
 # =============================================================================
 # SLACK ALERTS
 # =============================================================================
 
+# Shared HTTP session so repeated Slack posts reuse one keep-alive
+# connection instead of paying a fresh TLS handshake every time.
+if requests is not None:
+    _SESSION = requests.Session()
+    _SESSION.mount('https://', HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=4,
+        max_retries=Retry(total=2, backoff_factor=0.2),
+    ))
+    atexit.register(_SESSION.close)
+else:
+    _SESSION = None
+
+# Circuit breaker: once a third of recent Slack posts have failed, stop
+# posting (each failure can cost a full timeout) until the window resets.
+_slack_results = deque(maxlen=30)
+_SLACK_CIRCUIT_MIN_SAMPLES = 10
+_SLACK_CIRCUIT_RESET_SECONDS = 300
+_slack_window_start = time.monotonic()
+
+
+def _slack_circuit_open():
+    """
+    Check whether Slack posting should be skipped due to recent failures.
+
+    RETURNS:
+        bool: True if at least 1/3 of the recent posts failed
+    """
+    global _slack_window_start
+
+    now = time.monotonic()
+    if now - _slack_window_start >= _SLACK_CIRCUIT_RESET_SECONDS:
+        _slack_results.clear()
+        _slack_window_start = now
+
+    total = len(_slack_results)
+    if total < _SLACK_CIRCUIT_MIN_SAMPLES:
+        return False
+
+    return _slack_results.count(False) * 3 >= total
+
+
+_SLACK_HEADERS = {'Content-Type': 'application/json'}
+
+
+@lru_cache(maxsize=32)
+def _serialize_slack(message):
+    """
+    Encode a Slack webhook payload as compact JSON bytes.
+
+    Cached so retries and repeated identical messages skip re-serializing.
+    """
+    return json.dumps({'text': message}, separators=(',', ':')).encode('utf-8')
+
+
 def send_slack_message(message, webhook_url=None):
     """
     Send a message to Slack via webhook.
@@ -103,72 +185,239 @@ def send_slack_message(message, webhook_url=None):
         logger.warning("Slack webhook URL not configured")
         return False
 
-    try:
-        import requests
+    if _SESSION is None:
+        logger.error("requests library not installed. Run: pip install requests")
+        return False
+
+    if _slack_circuit_open():
+        logger.error("Slack circuit open (too many recent failures), dropping alert")
+        return False
 
-        payload = {'text': message}
-        response = requests.post(url, json=payload, timeout=10)
+    try:
+        response = _SESSION.post(
+            url,
+            data=_serialize_slack(message),
+            headers=_SLACK_HEADERS,
+            timeout=10,
+        )
 
         if response.status_code == 200:
             logger.info("Slack message sent successfully")
-            return True
+            ok = True
         else:
             logger.error(f"Slack error: {response.status_code} - {response.text}")
-            return False
+            ok = False
 
-    except ImportError:
-        logger.error("requests library not installed. Run: pip install requests")
-        return False
     except Exception as e:
         logger.error(f"Slack error: {e}")
-        return False
+        ok = False
+
+    _slack_results.append(ok)
+    return ok
+
+
+class AlertBatcher:
+    """
+    Buffer Slack messages and post them together in a single webhook call.
+
+    Messages are flushed when max_size is reached or max_wait seconds after
+    the first buffered message, whichever comes first.
+
+    EXAMPLE:
+        >>> batcher = AlertBatcher(max_wait=2.0, max_size=10)
+        >>> batcher.add("Clubs done")
+        >>> batcher.add("Players done")   # both go out in one POST
+    """
+
+    def __init__(self, max_wait=2.0, max_size=10):
+        self.max_wait = max_wait
+        self.max_size = max_size
+        self._buf = []
+        self._timer = None
+        self._lock = threading.Lock()
+
+    def add(self, message):
+        """Queue a message, flushing immediately if the batch is full."""
+        with self._lock:
+            self._buf.append(message)
+            full = len(self._buf) >= self.max_size
+
+            if not full and self._timer is None:
+                self._timer = threading.Timer(self.max_wait, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+        if full:
+            self.flush()
+
+    def flush(self):
+        """
+        Send everything buffered so far as one Slack message.
+
+        RETURNS:
+            bool: True if sent (or nothing to send), False otherwise
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            messages, self._buf = self._buf, []
+
+        if not messages:
+            return True
+
+        return send_slack_message("\n---\n".join(messages))
+
+
+_batcher = AlertBatcher()
+atexit.register(_batcher.flush)
 
 
-def format_slack_success(job_name, stats=None):
+def format_slack_success(job_name, stats=None, ts=None):
     """
     Format a success message for Slack.
 
     PARAMETERS:
         job_name (str): Name of the job (e.g., "Daily Scrape")
         stats (dict, optional): Statistics to include
+        ts (str, optional): Timestamp to show. Defaults to now.
 
     RETURNS:
         str: Formatted message
     """
-    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    message = f":white_check_mark: *{job_name} Completed*\n"
-    message += f"_Time: {timestamp}_\n"
+    timestamp = ts or _now_str()
+    parts = [
+        f":white_check_mark: *{job_name} Completed*",
+        f"_Time: {timestamp}_",
+    ]
 
     if stats:
-        message += "\n*Stats:*\n"
-        for key, value in stats.items():
-            message += f"  - {key}: {value}\n"
+        parts.extend(["", "*Stats:*"])
+        parts.extend(f"  - {key}: {value}" for key, value in stats.items())
 
-    return message
+    parts.append("")  # Trailing newline
+    return "\n".join(parts)
 
 
-def format_slack_failure(job_name, error):
+def format_slack_failure(job_name, error, ts=None):
     """
     Format a failure message for Slack.
 
     PARAMETERS:
         job_name (str): Name of the job
         error (str): Error message or description
+        ts (str, optional): Timestamp to show. Defaults to now.
 
     RETURNS:
         str: Formatted message
     """
-    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    message = f":x: *{job_name} Failed*\n"
-    message += f"_Time: {timestamp}_\n"
-    message += f"\n*Error:*\n```{error}```"
-    return message
+    timestamp = ts or _now_str()
+    return "\n".join([
+        f":x: *{job_name} Failed*",
+        f"_Time: {timestamp}_",
+        "",
+        "*Error:*",
+        f"```{error}```",
+    ])
 
 
 # =============================================================================
 # EMAIL ALERTS
 # =============================================================================
 
+# One authenticated SMTP connection shared by every thread, reused across
+# send_email() calls so a batch of alerts pays the TCP + STARTTLS + LOGIN
+# cost only once. Sends run on _ALERT_POOL workers while close_smtp() is
+# usually called from the main thread, so all access goes through the lock.
+_smtp_server = None
+_smtp_lock = threading.Lock()
+
+
+def _get_smtp():
+    """
+    Get the shared SMTP connection, connecting if needed.
+
+    A cached connection is health-checked with NOOP first; if the server
+    has dropped it we open a fresh one. Caller must hold _smtp_lock.
+
+    RETURNS:
+        smtplib.SMTP: A connected, logged-in SMTP client
+    """
+    global _smtp_server
+    import smtplib
+
+    if _smtp_server is not None:
+        try:
+            _smtp_server.noop()
+            return _smtp_server
+        except smtplib.SMTPServerDisconnected:
+            _close_smtp_locked()
+
+    if EMAIL_SMTP_PORT == 465:
+        # Implicit TLS - encrypted from the start, no STARTTLS round-trip
+        server = smtplib.SMTP_SSL(EMAIL_SMTP_SERVER, EMAIL_SMTP_PORT, timeout=SMTP_TIMEOUT)
+    else:
+        server = smtplib.SMTP(EMAIL_SMTP_SERVER, EMAIL_SMTP_PORT, timeout=SMTP_TIMEOUT)
+        server.starttls()  # Enable TLS encryption
+    server.login(EMAIL_USERNAME, EMAIL_PASSWORD)
+    _smtp_server = server
+    return server
+
+
+def _close_smtp_locked():
+    """Close the shared SMTP connection. Caller must hold _smtp_lock."""
+    global _smtp_server
+    server, _smtp_server = _smtp_server, None
+
+    if server is None:
+        return
+
+    try:
+        server.quit()
+    except Exception:
+        # Connection already gone - nothing left to clean up
+        try:
+            server.close()
+        except Exception:
+            pass
+
+
+def close_smtp():
+    """
+    Close the shared SMTP connection, if one is open.
+
+    Waits for a send in progress to finish first. Safe to call multiple
+    times and from any thread. Runs automatically at interpreter exit.
+    """
+    with _smtp_lock:
+        _close_smtp_locked()
+
+
+def _close_smtp_when_done(futures):
+    """Close the shared SMTP connection once the given sends have finished."""
+    wait(futures)
+    close_smtp()
+
+
+atexit.register(close_smtp)
+
+
+@contextmanager
+def smtp_session():
+    """
+    Send several emails over one SMTP connection, then close it.
+
+    USAGE:
+        with smtp_session():
+            for subject, body in reports:
+                send_email(subject, body)
+    """
+    try:
+        yield
+    finally:
+        close_smtp()
+
+
 def send_email(subject, body, to_address=None):
     """
     Send an email notification.
@@ -190,71 +439,89 @@ def send_email(subject, body, to_address=None):
         logger.warning("Email not configured. Set EMAIL_USERNAME, EMAIL_PASSWORD, EMAIL_TO")
         return False
 
+    # Imported here so scripts that never send email don't pay for it
+    import smtplib
+    from email.message import EmailMessage
+
     try:
-        # Create message
-        msg = MIMEMultipart()
+        # Create message (single plain-text part, no multipart wrapper)
+        msg = EmailMessage()
         msg['From'] = EMAIL_USERNAME
         msg['To'] = to_addr
         msg['Subject'] = subject
-        msg.attach(MIMEText(body, 'plain'))
+        msg.set_content(body)
 
-        # Connect and send
-        with smtplib.SMTP(EMAIL_SMTP_SERVER, EMAIL_SMTP_PORT) as server:
-            server.starttls()  # Enable TLS encryption
-            server.login(EMAIL_USERNAME, EMAIL_PASSWORD)
-            server.send_message(msg)
+        # Send over the shared connection (reconnect once if it went stale)
+        with _smtp_lock:
+            try:
+                _get_smtp().send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                _close_smtp_locked()
+                _get_smtp().send_message(msg)
 
         logger.info(f"Email sent to {to_addr}")
         return True
 
     except Exception as e:
         logger.error(f"Email error: {e}")
+        close_smtp()
         return False
 
 
-def format_email_success(job_name, stats=None):
+def format_email_success(job_name, stats=None, ts=None):
     """
     Format a success email body.
 
     PARAMETERS:
         job_name (str): Name of the job
         stats (dict, optional): Statistics to include
+        ts (str, optional): Timestamp to show. Defaults to now.
 
     RETURNS:
         tuple: (subject, body)
     """
-    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    timestamp = ts or _now_str()
     subject = f"[SUCCESS] {job_name}"
 
-    body = f"{job_name} completed successfully.\n\n"
-    body += f"Time: {timestamp}\n"
+    parts = [
+        f"{job_name} completed successfully.",
+        "",
+        f"Time: {timestamp}",
+    ]
 
     if stats:
-        body += "\nStatistics:\n"
-        for key, value in stats.items():
-            body += f"  - {key}: {value}\n"
+        parts.extend(["", "Statistics:"])
+        parts.extend(f"  - {key}: {value}" for key, value in stats.items())
 
-    return subject, body
+    parts.append("")  # Trailing newline
+    return subject, "\n".join(parts)
 
 
-def format_email_failure(job_name, error):
+def format_email_failure(job_name, error, ts=None):
     """
     Format a failure email body.
 
     PARAMETERS:
         job_name (str): Name of the job
         error (str): Error message
+        ts (str, optional): Timestamp to show. Defaults to now.
 
     RETURNS:
         tuple: (subject, body)
     """
-    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    timestamp = ts or _now_str()
     subject = f"[FAILED] {job_name}"
 
-    body = f"{job_name} failed!\n\n"
-    body += f"Time: {timestamp}\n"
-    body += f"\nError:\n{error}\n"
-    body += "\nPlease investigate and fix the issue."
+    body = "\n".join([
+        f"{job_name} failed!",
+        "",
+        f"Time: {timestamp}",
+        "",
+        "Error:",
+        str(error),
+        "",
+        "Please investigate and fix the issue.",
+    ])
 
     return subject, body
 
@@ -263,6 +530,43 @@ def format_email_failure(job_name, error):
 # HIGH-LEVEL ALERT FUNCTIONS
 # =============================================================================
 
+# Alert I/O runs in the background so the scraper doesn't wait on Slack/SMTP.
+# Two workers let the Slack post and the email go out in parallel.
+_ALERT_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix='alerts')
+atexit.register(_ALERT_POOL.shutdown, wait=True)
+
+# Recently sent failure alerts: hash of (job_name, error) -> expiry time.
+# Oldest entries are evicted once we hold _RECENT_MAX of them.
+_RECENT = OrderedDict()
+_RECENT_MAX = 256
+# Failure alerts can be raised from several threads at once
+_RECENT_LOCK = threading.Lock()
+
+
+def _is_duplicate_failure(job_name, error):
+    """
+    Check whether this failure was already alerted within ALERT_DEDUP_TTL.
+
+    Records the alert as sent if it is not a duplicate.
+
+    RETURNS:
+        bool: True if the alert should be suppressed
+    """
+    key = hashlib.blake2b(f"{job_name}|{error}".encode('utf-8'), digest_size=16).digest()
+    now = time.monotonic()
+
+    with _RECENT_LOCK:
+        if _RECENT.get(key, 0) > now:
+            return True
+
+        _RECENT[key] = now + ALERT_DEDUP_TTL
+        _RECENT.move_to_end(key)
+        while len(_RECENT) > _RECENT_MAX:
+            _RECENT.popitem(last=False)
+
+    return False
+
+
 def send_success_alert(job_name, stats=None):
     """
     Send a success notification via all configured channels.
@@ -277,20 +581,40 @@ def send_success_alert(job_name, stats=None):
         ...     "Games scraped": 20,
         ...     "New hometowns found": 5
         ... })
+
+    RETURNS:
+        list: Futures for the submitted sends. Alerts are delivered in the
+              background; call .result() on these to wait for them.
     """
+    futures = []
+
     if not ALERTS_ENABLED:
         logger.info("Alerts disabled")
-        return
+        return futures
+
+    # Nothing configured (typical in dev) - skip building the messages
+    do_slack = bool(SLACK_WEBHOOK_URL)
+    do_email = bool(EMAIL_USERNAME and EMAIL_TO)
+    if not (do_slack or do_email):
+        return futures
+
+    # One timestamp shared by both channels
+    ts = _now_str()
 
     # Send Slack alert
-    if SLACK_WEBHOOK_URL:
-        message = format_slack_success(job_name, stats)
-        send_slack_message(message)
+    if do_slack:
+        message = format_slack_success(job_name, stats, ts)
+        if ALERTS_BATCH:
+            _batcher.add(message)
+        else:
+            futures.append(_ALERT_POOL.submit(send_slack_message, message))
 
     # Send email alert
-    if EMAIL_USERNAME and EMAIL_TO:
-        subject, body = format_email_success(job_name, stats)
-        send_email(subject, body)
+    if do_email:
+        subject, body = format_email_success(job_name, stats, ts)
+        futures.append(_ALERT_POOL.submit(send_email, subject, body))
+
+    return futures
 
 
 def send_failure_alert(job_name, error):
@@ -303,20 +627,44 @@ def send_failure_alert(job_name, error):
 
     EXAMPLE:
         >>> send_failure_alert("Daily Scrape", "API returned 500 error")
+
+    RETURNS:
+        list: Futures for the submitted sends (see send_success_alert)
+
+    NOTE:
+        The same job_name + error is only alerted once per ALERT_DEDUP_TTL
+        seconds, so retry loops don't flood Slack/email.
     """
+    futures = []
+
     if not ALERTS_ENABLED:
         logger.info("Alerts disabled")
-        return
+        return futures
+
+    # Nothing configured (typical in dev) - skip building the messages
+    do_slack = bool(SLACK_WEBHOOK_URL)
+    do_email = bool(EMAIL_USERNAME and EMAIL_TO)
+    if not (do_slack or do_email):
+        return futures
+
+    if _is_duplicate_failure(job_name, error):
+        logger.info(f"Suppressed duplicate failure alert for {job_name}")
+        return futures
+
+    # One timestamp shared by both channels
+    ts = _now_str()
 
     # Send Slack alert
-    if SLACK_WEBHOOK_URL:
-        message = format_slack_failure(job_name, error)
-        send_slack_message(message)
+    if do_slack:
+        message = format_slack_failure(job_name, error, ts)
+        futures.append(_ALERT_POOL.submit(send_slack_message, message))
 
     # Send email alert
-    if EMAIL_USERNAME and EMAIL_TO:
-        subject, body = format_email_failure(job_name, error)
-        send_email(subject, body)
+    if do_email:
+        subject, body = format_email_failure(job_name, error, ts)
+        futures.append(_ALERT_POOL.submit(send_email, subject, body))
+
+    return futures
 
 
 # =============================================================================
@@ -338,19 +686,25 @@ def alert_on_completion(job_name):
     """
     def decorator(func):
         def wrapper(*args, **kwargs):
+            futures = []
             try:
                 result = func(*args, **kwargs)
 
                 # If result is a dict, use it as stats
                 stats = result if isinstance(result, dict) else None
-                send_success_alert(job_name, stats)
+                futures = send_success_alert(job_name, stats)
 
                 return result
 
             except Exception as e:
-                send_failure_alert(job_name, str(e))
+                futures = send_failure_alert(job_name, str(e))
                 raise  # Re-raise the exception
 
+            finally:
+                # The sends are still queued on _ALERT_POOL, so close the
+                # connection from there once they're done
+                _ALERT_POOL.submit(_close_smtp_when_done, futures)
+
         return wrapper
     return decorator
 
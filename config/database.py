@@ -1,17 +1,26 @@
 """
 Database configuration module.
 """
+from functools import cache
+from types import MappingProxyType
+
 from .settings import DB_CONFIG
 
+_CONNECTION_TEMPLATE = (
+    "mysql+mysqlconnector://{user}:{password}@{host}:{port}/{database}"
+)
+
 
+@cache
 def get_connection_string():
-    """Get MySQL connection string."""
-    return (
-        f"mysql+mysqlconnector://{DB_CONFIG['user']}:{DB_CONFIG['password']}"
-        f"@{DB_CONFIG['host']}:{DB_CONFIG['port']}/{DB_CONFIG['database']}"
-    )
+    """Get MySQL connection string (built once per process)."""
+    return _CONNECTION_TEMPLATE.format_map(DB_CONFIG)
 
 
 def get_connection_params():
-    """Get connection parameters as dict."""
-    return DB_CONFIG.copy()
+    """
+    Get connection parameters as a read-only mapping.
+
+    Copy it with dict(...) if you need to change anything.
+    """
+    return MappingProxyType(DB_CONFIG)
@@ -26,10 +26,50 @@ WHY USE FILE LOGGING:
     4. Audit trail for data changes
 """
 
+import atexit
 import logging
 import os
+import queue
 from datetime import datetime
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
+
+# Our log format never shows thread/process info, so skip collecting it on
+# every LogRecord.
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+
+# Loggers already configured by setup_logging(), keyed by (script_name, log_level).
+# Calling setup_logging() again returns the same logger without reopening files.
+_CONFIGURED = {}
+
+# Separator line used around scrape start/end messages
+_BANNER = "=" * 60
+
+
+class FastFormatter(logging.Formatter):
+    """
+    Formatter for 'timestamp - name - level - message' lines.
+
+    Builds the line with a single f-string instead of going through the
+    generic %-style machinery. Exceptions and stack info are still appended.
+    """
+
+    def format(self, record):
+        line = (
+            f"{self.formatTime(record, self.datefmt)} - {record.name} - "
+            f"{record.levelname} - {record.getMessage()}"
+        )
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            line = f"{line}\n{record.exc_text}"
+        if record.stack_info:
+            line = f"{line}\n{self.formatStack(record.stack_info)}"
+
+        return line
 
 
 def setup_logging(script_name, log_level=logging.INFO):
@@ -54,7 +94,16 @@ def setup_logging(script_name, log_level=logging.INFO):
         Saved to: logs/<script_name>_YYYY-MM-DD.log
         Rotates: Daily at midnight
         Keeps: Last 7 days of logs
+
+    NOTE:
+        Repeat calls with the same script_name and log_level return the
+        already-configured logger instead of rebuilding its handlers.
     """
+    key = (script_name, log_level)
+    existing = _CONFIGURED.get(key)
+    if existing is not None:
+        return existing
+
     # Create logs directory if it doesn't exist
     # We use the parent directory of config/ (project root)
     project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -66,14 +115,15 @@ def setup_logging(script_name, log_level=logging.INFO):
     logger.setLevel(log_level)
 
     # Clear any existing handlers (prevents duplicate logs)
+    old_listener = getattr(logger, '_listener', None)
+    if old_listener is not None:
+        old_listener.stop()
+        atexit.unregister(old_listener.stop)
     logger.handlers = []
 
     # Define log format
     # Format: timestamp - script name - level - message
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    formatter = FastFormatter(datefmt='%Y-%m-%d %H:%M:%S')
 
     # =========================================================================
     # Console Handler - outputs to terminal
@@ -81,7 +131,6 @@ def setup_logging(script_name, log_level=logging.INFO):
     console_handler = logging.StreamHandler()
     console_handler.setLevel(log_level)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
 
     # =========================================================================
     # File Handler - outputs to dated log file
@@ -103,12 +152,28 @@ def setup_logging(script_name, log_level=logging.INFO):
     )
     file_handler.setLevel(log_level)
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+
+    # =========================================================================
+    # Queue Handler - hands records to a background thread
+    # =========================================================================
+    # The scraper thread only puts records on a queue; a QueueListener thread
+    # does the actual console/file writes (and rotation) off the hot path.
+    log_queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+
+    listener = QueueListener(
+        log_queue, console_handler, file_handler,
+        respect_handler_level=True
+    )
+    listener.start()
+    logger._listener = listener
+    atexit.register(listener.stop)
 
     # Log that we started
     logger.info(f"Logging initialized for {script_name}")
     logger.info(f"Log file: {log_filename}")
 
+    _CONFIGURED[key] = logger
     return logger
 
 
@@ -139,9 +204,7 @@ def log_scrape_start(logger, mode='all'):
         logger: The logger instance
         mode: The scraping mode (all, recent, today)
     """
-    logger.info("=" * 60)
-    logger.info(f"SCRAPE STARTED - Mode: {mode.upper()}")
-    logger.info("=" * 60)
+    logger.info(f"{_BANNER}\nSCRAPE STARTED - Mode: {mode.upper()}\n{_BANNER}")
 
 
 def log_scrape_end(logger, stats):
@@ -153,11 +216,10 @@ def log_scrape_end(logger, stats):
         stats (dict): Statistics about the scrape
                       Example: {'clubs': 18, 'players': 100, 'games': 200}
     """
-    logger.info("=" * 60)
-    logger.info("SCRAPE COMPLETED")
-    logger.info("=" * 60)
-    for key, value in stats.items():
-        logger.info(f"  {key}: {value}")
+    # One log record for the whole block instead of one per line
+    lines = [_BANNER, "SCRAPE COMPLETED", _BANNER]
+    lines.extend(f"  {key}: {value}" for key, value in stats.items())
+    logger.info("\n".join(lines))
 
 
 def log_error(logger, error, context=""):
@@ -46,7 +46,8 @@ API DOCUMENTATION:
     - /v2/competitions/E/seasons/E2024/games/{code}/stats - Get box score
 
 IMPORTANT NOTES FOR MAINTAINERS:
-    - The API has rate limits, so we add 0.2 second delays between requests
+    - The API has rate limits, so box scores are fetched with a small thread pool
+      (see fetch_all_game_stats) rather than all at once
     - Stats are NESTED under a 'stats' key in the API response
     - Some field names are different: 'assistances' not 'assists', 'valuation' not 'pir'
     - Time played is in SECONDS, must convert to minutes
@@ -59,15 +60,28 @@ IMPORTANT NOTES FOR MAINTAINERS:
 # argparse: Lets us handle command-line arguments like --recent and --today
 import argparse
 
+# ThreadPoolExecutor: For fetching many box scores concurrently instead of one at a time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 # json: For reading and writing JSON files (our data format)
 import json
 
+# orjson (optional): A much faster JSON library written in C/Rust
+# Used for the big output files when installed; falls back to json if not.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # os: For file and directory operations (creating output folders, etc.)
 import os
 
+
 # requests: For making HTTP requests to the EuroLeague API
 # If you get "ModuleNotFoundError", run: pip install requests
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # datetime, timedelta: For working with dates (filtering recent games)
 from datetime import datetime, timedelta
@@ -75,8 +89,8 @@ from datetime import datetime, timedelta
 # logging: For printing status messages with timestamps
 import logging
 
-# time: For adding delays between API requests (rate limiting)
-import time
+# TokenBucket: Rate limiter shared by the box score threads
+from utils.rate_limit import TokenBucket
 
 # =============================================================================
 # LOGGING CONFIGURATION
@@ -104,10 +118,77 @@ SEASON = 'E2025'
 # COMPETITION: Competition code ("E" for EuroLeague, "U" for EuroCup)
 COMPETITION = 'E'
 
+# STAT_FIELDS: (our field name, API field name) for every counting stat we
+# copy out of a box score. Note the API's unusual names like 'assistances'.
+STAT_FIELDS = (
+    # Basic stats
+    ('points', 'points'),
+    ('rebounds', 'totalRebounds'),
+    ('assists', 'assistances'),
+    ('steals', 'steals'),
+    ('blocks', 'blocksFavour'),
+    ('turnovers', 'turnovers'),
+    # Shooting stats
+    ('fg_made', 'fieldGoalsMadeTotal'),
+    ('fg_attempted', 'fieldGoalsAttemptedTotal'),
+    ('three_made', 'fieldGoalsMade3'),
+    ('three_attempted', 'fieldGoalsAttempted3'),
+    ('ft_made', 'freeThrowsMade'),
+    ('ft_attempted', 'freeThrowsAttempted'),
+    # Advanced stats
+    ('plus_minus', 'plusMinus'),
+    ('pir', 'valuation'),  # PIR = 'valuation' in API
+)
+
 # AMERICAN_CODES: Country codes that indicate American nationality
 # Some records use 'USA', others use 'US'
 AMERICAN_CODES = ['USA', 'US']
 
+# STATS_CACHE_DIR: Where box scores of finished games are cached on disk
+# A finished game's box score never changes, so reruns can skip the API call
+STATS_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'stats')
+
+# BOX_SCORE_RATE: Max box score requests per second sent to the API
+# Cached games don't count - only real network calls take a token.
+BOX_SCORE_RATE = 8
+
+# HTTP session shared by every API call
+# Reusing one session keeps the TCP/TLS connection to the API open between
+# requests, so only the first call pays for the handshake.
+_session = requests.Session()
+
+# Default headers sent with every API call
+# - Accept-Encoding: let the API gzip its JSON (requests decompresses it)
+# - Connection: keep the socket open for the next request
+# - User-Agent: identify the scraper instead of 'python-requests/x.y'
+_session.headers.update({
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+    'User-Agent': 'euroleague-scraper/1.0',
+})
+
+# Connection pool + automatic retries
+# - pool_maxsize=20: enough sockets for the concurrent box score fetches
+# - Retry: transient errors (429, 5xx) are retried with backoff instead of
+#   silently dropping that game
+_session.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=20,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+    ),
+))
+
+
+# =============================================================================
+# RATE LIMITING
+# =============================================================================
+
+# Shared by all box score worker threads
+_box_score_bucket = TokenBucket(BOX_SCORE_RATE)
+
 
 # =============================================================================
 # HELPER FUNCTIONS
@@ -148,7 +229,53 @@ def is_american(country_data):
     return code in AMERICAN_CODES
 
 
-def save_json(data, filename):
+def _dumps_compact(obj):
+    """Serialize one value to compact UTF-8 JSON bytes (no indentation)."""
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+        )
+    return json.dumps(obj, default=str, ensure_ascii=False,
+                      separators=(',', ':')).encode('utf-8')
+
+
+def _write_compact_json(f, data):
+    """
+    Write data as compact JSON, streaming top-level lists one row at a time.
+
+    Only one row is serialized at once, so a big list (like thousands of
+    performances) never has to exist as one giant string in memory.
+
+    PARAMETERS:
+        f: A file opened in binary mode ('wb')
+        data (dict): The data to write
+    """
+    if not isinstance(data, dict):
+        f.write(_dumps_compact(data))
+        return
+
+    f.write(b'{')
+    for i, (key, value) in enumerate(data.items()):
+        if i:
+            f.write(b',')
+        f.write(_dumps_compact(str(key)))
+        f.write(b':')
+
+        if isinstance(value, list):
+            f.write(b'[')
+            for j, row in enumerate(value):
+                if j:
+                    f.write(b',')
+                f.write(_dumps_compact(row))
+            f.write(b']')
+        else:
+            f.write(_dumps_compact(value))
+    f.write(b'}')
+
+
+def save_json(data, filename, compact=False):
     """
     Save a Python dictionary to a JSON file.
 
@@ -159,6 +286,8 @@ def save_json(data, filename):
     PARAMETERS:
         data (dict): The data to save (usually a dictionary)
         filename (str): The name of the file (e.g., 'clubs_20240115.json')
+        compact (bool): Skip indentation and stream top-level lists row by
+                        row. Use for big files that are only read by code.
 
     RETURNS:
         str: The full file path where the data was saved
@@ -169,9 +298,10 @@ def save_json(data, filename):
 
     NOTES:
         - Creates the output/json directory if it doesn't exist
-        - Uses indent=2 for readable formatting
+        - Uses indent=2 for readable formatting (unless compact=True)
         - Uses ensure_ascii=False to properly save non-English characters
           (important for European player names like "Ndi??ye")
+        - Uses orjson when installed (several times faster for big files)
     """
     # Build the path to the output directory
     # __file__ is the path to this script
@@ -185,6 +315,26 @@ def save_json(data, filename):
     # Build the full file path
     filepath = os.path.join(output_dir, filename)
 
+    if compact:
+        with open(filepath, 'wb') as f:
+            _write_compact_json(f, data)
+        logger.info(f"Saved: {filepath}")
+        return filepath
+
+    if orjson is not None:
+        # Fast path: orjson writes UTF-8 bytes directly
+        # OPT_PASSTHROUGH_DATETIME sends datetimes to default=str, so the
+        # output matches the json.dump path below
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(
+                data,
+                default=str,
+                option=(orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                        | orjson.OPT_PASSTHROUGH_DATETIME),
+            ))
+        logger.info(f"Saved: {filepath}")
+        return filepath
+
     # Open the file and write the JSON
     # encoding='utf-8' ensures special characters are handled correctly
     with open(filepath, 'w', encoding='utf-8') as f:
@@ -198,6 +348,24 @@ def save_json(data, filename):
     return filepath
 
 
+def parse_json(raw):
+    """
+    Parse JSON from raw bytes.
+
+    Uses orjson when installed (several times faster on big box scores),
+    otherwise the standard json module. Both raise ValueError on bad input.
+
+    PARAMETERS:
+        raw (bytes): The JSON document, e.g. an HTTP response body
+
+    RETURNS:
+        The parsed data (usually a dict)
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 def api_get(endpoint, params=None):
     """
     Make a GET request to the EuroLeague API.
@@ -228,13 +396,14 @@ def api_get(endpoint, params=None):
     try:
         # Make the HTTP GET request
         # timeout=30 means give up after 30 seconds
-        resp = requests.get(url, params=params, timeout=30)
+        resp = _session.get(url, params=params, timeout=30)
 
         # raise_for_status() throws an exception if we get a 4xx or 5xx error
         resp.raise_for_status()
 
         # Parse the JSON response and return it
-        return resp.json()
+        # (parse the raw bytes ourselves so orjson can be used if installed)
+        return parse_json(resp.content)
 
     except Exception as e:
         # Log the error but don't crash - return None instead
@@ -373,7 +542,7 @@ def fetch_games():
     return []
 
 
-def fetch_game_stats(game_code):
+def fetch_game_stats(game_code, final=False):
     """
     Fetch detailed box score statistics for a specific game.
 
@@ -383,6 +552,9 @@ def fetch_game_stats(game_code):
 
     PARAMETERS:
         game_code (int or str): The unique identifier for the game
+        final (bool): True if the game is finished (played=True). Finished
+                      games are cached in STATS_CACHE_DIR and read from
+                      there on later runs instead of calling the API.
 
     RETURNS:
         dict or None: The full game stats, or None if error/not available
@@ -427,10 +599,83 @@ def fetch_game_stats(game_code):
             'road': { ... same structure ... }
         }
     """
+    cache_path = os.path.join(STATS_CACHE_DIR, f'{SEASON}_{game_code}.json')
+
+    # Finished games never change - use the cached copy if we have one
+    if final and os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'rb') as f:
+                return parse_json(f.read())
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache {cache_path}: {e}")
+
+    # Stay under BOX_SCORE_RATE requests/second across all threads
+    _box_score_bucket.take()
     data = api_get(f'/v2/competitions/{COMPETITION}/seasons/{SEASON}/games/{game_code}/stats')
+
+    if final and data:
+        # Write to a temp file then rename, so a crash never leaves a
+        # half-written cache file behind. The cache is best-effort: if it
+        # can't be written (disk full, read-only dir) we still return the stats
+        tmp_path = f'{cache_path}.tmp'
+        try:
+            os.makedirs(STATS_CACHE_DIR, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Could not cache box score {game_code}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
     return data
 
 
+def fetch_all_game_stats(games, max_workers=8):
+    """
+    Fetch box scores for many games concurrently.
+
+    WHAT IT DOES:
+        Runs fetch_game_stats() for every game on a pool of worker threads,
+        with up to max_workers requests in flight at once. Each request is
+        network-bound (waiting on the API), so overlapping them turns
+        minutes into seconds. Threads work well here because requests
+        releases the GIL while it waits on the network.
+
+    PARAMETERS:
+        games (list): Game dictionaries (each must have 'gameCode')
+        max_workers (int): Max simultaneous API requests (default: 8)
+
+    RETURNS:
+        list: (game, stats) tuples in the same order as the input games.
+              stats is None if that game's box score couldn't be fetched.
+
+    RATE LIMITING:
+        The worker count caps how many requests hit the API at once, and
+        a shared TokenBucket caps them at BOX_SCORE_RATE per second. All
+        workers share the pooled API session.
+    """
+    results = [None] * len(games)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(fetch_game_stats, game.get('gameCode'), bool(game.get('played'))): i
+            for i, game in enumerate(games)
+        }
+
+        for done, future in enumerate(as_completed(futures), start=1):
+            i = futures[future]
+            results[i] = (games[i], future.result())
+
+            # Show progress every 20 games
+            if done % 20 == 0:
+                logger.info(f"  Progress: {done}/{len(games)}")
+
+    return results
+
+
 # =============================================================================
 # DATA PROCESSING FUNCTIONS
 # =============================================================================
@@ -461,18 +706,19 @@ def process_games(games, mode='all'):
 
     if mode == 'today':
         # Filter to only today's games
-        today = now.date()
-        # Compare just the date part (first 10 characters of ISO string)
-        filtered = [g for g in games if g.get('date', '')[:10] == str(today)]
+        # Game dates are ISO strings, so today's games start with 'YYYY-MM-DD'
+        today_str = now.date().isoformat()
+        filtered = [g for g in games if (g.get('date') or '').startswith(today_str)]
         logger.info(f"  Today's games: {len(filtered)}")
         return filtered
 
     elif mode == 'recent':
         # Filter to games from the last 7 days
-        week_ago = now - timedelta(days=7)
+        # ISO date strings sort chronologically, so compare them as strings
+        week_ago_str = (now - timedelta(days=7)).isoformat()
         # Only include games that are played AND within the time window
         filtered = [g for g in games
-                   if g.get('played') and g.get('date', '') >= week_ago.isoformat()]
+                   if g.get('played') and (g.get('date') or '') >= week_ago_str]
         logger.info(f"  Recent games (7 days): {len(filtered)}")
         return filtered
 
@@ -481,7 +727,7 @@ def process_games(games, mode='all'):
         return games
 
 
-def extract_american_performances(game, stats):
+def extract_american_performances(game, stats, american_codes=None):
     """
     Extract performance data for American players from a game's box score.
 
@@ -492,6 +738,10 @@ def extract_american_performances(game, stats):
     PARAMETERS:
         game (dict): The game info (date, teams, scores)
         stats (dict): The box score data from fetch_game_stats()
+        american_codes (set, optional): Player codes already known to be
+            American. When given, everyone else is skipped with a single
+            set lookup instead of checking their country data. An empty
+            set counts as not given, so every player is still checked.
 
     RETURNS:
         list: A list of performance dictionaries for American players
@@ -503,7 +753,7 @@ def extract_american_performances(game, stats):
         4. Return the list of all American performances
 
     THE RETURNED DATA INCLUDES:
-        - Game info: date, teams, scores, round
+        - Game info: date, teams, scores, round, opponent
         - Player info: name, code, position, jersey number
         - Stats: points, rebounds, assists, steals, blocks, etc.
         - Advanced: field goal attempts/makes, three-pointers, free throws
@@ -528,11 +778,19 @@ def extract_american_performances(game, stats):
         'road_score': game.get('road', {}).get('score'),
     }
 
+    # Each side's opponent is the other team - work it out once per game
+    # instead of once per player row
+    opponent_of = {
+        'local': game_info['road_team'],
+        'road': game_info['local_team'],
+    }
+
     # Loop through both teams: 'local' (home) and 'road' (away)
     for side in ['local', 'road']:
         # Get the team's stats data
         team_data = stats.get(side, {})
         team_name = game.get(side, {}).get('club', {}).get('name', 'Unknown')
+        opponent = opponent_of[side]
 
         # Loop through each player in the team's box score
         for player_stat in team_data.get('players', []):
@@ -540,6 +798,10 @@ def extract_american_performances(game, stats):
             player = player_stat.get('player', {})
             person = player.get('person', {})
 
+            # Fast skip: most players in a box score aren't American
+            if american_codes and person.get('code') not in american_codes:
+                continue
+
             # IMPORTANT: Stats are nested under 'stats' key!
             stat = player_stat.get('stats', {})
 
@@ -562,6 +824,7 @@ def extract_american_performances(game, stats):
                     **game_info,
                     # Add player info
                     'team': team_name,
+                    'opponent': opponent,
                     'player_code': person.get('code'),
                     'player_name': person.get('name'),
                     'nationality': country.get('name') if country else None,
@@ -570,29 +833,87 @@ def extract_american_performances(game, stats):
                     'position': player.get('positionName'),
                     'starter': stat.get('startFive', False),
                     'minutes': minutes,
-                    # Basic stats - use int() and handle None values
-                    'points': int(stat.get('points', 0) or 0),
-                    'rebounds': int(stat.get('totalRebounds', 0) or 0),
-                    'assists': int(stat.get('assistances', 0) or 0),  # Note: 'assistances'!
-                    'steals': int(stat.get('steals', 0) or 0),
-                    'blocks': int(stat.get('blocksFavour', 0) or 0),
-                    'turnovers': int(stat.get('turnovers', 0) or 0),
-                    # Shooting stats
-                    'fg_made': int(stat.get('fieldGoalsMadeTotal', 0) or 0),
-                    'fg_attempted': int(stat.get('fieldGoalsAttemptedTotal', 0) or 0),
-                    'three_made': int(stat.get('fieldGoalsMade3', 0) or 0),
-                    'three_attempted': int(stat.get('fieldGoalsAttempted3', 0) or 0),
-                    'ft_made': int(stat.get('freeThrowsMade', 0) or 0),
-                    'ft_attempted': int(stat.get('freeThrowsAttempted', 0) or 0),
-                    # Advanced stats
-                    'plus_minus': int(stat.get('plusMinus', 0) or 0),
-                    'pir': int(stat.get('valuation', 0) or 0),  # PIR = 'valuation' in API
+                    # Counting stats - int() with None treated as 0
+                    **{out_key: int(stat.get(api_key) or 0)
+                       for out_key, api_key in STAT_FIELDS},
                 }
                 performances.append(perf)
 
     return performances
 
 
+def summarize_player_stats(performances):
+    """
+    Aggregate game performances into season totals and averages per player.
+
+    WHAT IT DOES:
+        Groups the performances by player, adds up points/rebounds/assists,
+        keeps a short game log, and calculates per-game averages.
+
+    PARAMETERS:
+        performances (list): Performance dicts from extract_american_performances()
+
+    RETURNS:
+        list: One summary dict per player, sorted by PPG (highest first)
+
+    HOW IT WORKS:
+        A single pass over the performances. Each player's running totals
+        live in one dict, so a row costs one dict lookup plus three adds.
+        (A pandas groupby was considered, but importing pandas takes longer
+        than this loop does for a full season of ~5,000 rows.)
+    """
+    player_stats = {}
+
+    for perf in performances:
+        code = perf['player_code']
+        ps = player_stats.get(code)
+
+        # Initialize player if first time seeing them
+        if ps is None:
+            ps = player_stats[code] = {
+                'player_code': code,
+                'player_name': perf['player_name'],
+                'team': perf['team'],
+                'nationality': perf['nationality'],
+                'games_played': 0,
+                'total_points': 0,
+                'total_rebounds': 0,
+                'total_assists': 0,
+                'performances': []  # Keep list of individual games
+            }
+
+        points = perf.get('points')
+        rebounds = perf.get('rebounds')
+        assists = perf.get('assists')
+
+        # Add this game's stats to their totals
+        ps['games_played'] += 1
+        ps['total_points'] += points or 0
+        ps['total_rebounds'] += rebounds or 0
+        ps['total_assists'] += assists or 0
+
+        # Store the individual game performance
+        ps['performances'].append({
+            'date': perf['date'],
+            'opponent': perf['opponent'],
+            'points': points,
+            'rebounds': rebounds,
+            'assists': assists,
+            'minutes': perf.get('minutes'),
+        })
+
+    # Calculate per-game averages (PPG, RPG, APG)
+    # Every player here has at least one game, so no divide-by-zero
+    for ps in player_stats.values():
+        gp = ps['games_played']
+        ps['ppg'] = round(ps['total_points'] / gp, 1)
+        ps['rpg'] = round(ps['total_rebounds'] / gp, 1)
+        ps['apg'] = round(ps['total_assists'] / gp, 1)
+
+    # Sort by PPG (highest first)
+    return sorted(player_stats.values(), key=lambda x: x['ppg'], reverse=True)
+
+
 # =============================================================================
 # MAIN FUNCTION
 # =============================================================================
@@ -660,9 +981,12 @@ def main():
     # =========================================================================
     people = fetch_players()
 
-    # Process players and identify Americans
+    # Process players and identify Americans in a single pass
+    # Some players appear multiple times if they changed teams, so
+    # Americans are deduplicated by player code as we go
     all_players = []
-    american_players = []
+    unique_americans = []
+    seen_codes = set()
 
     for record in people:
         # Extract data from nested structure
@@ -696,19 +1020,18 @@ def main():
 
         # Check if American (by nationality or birth country)
         if is_american(country) or is_american(birth_country):
-            american_players.append(player)
-
-    # Deduplicate American players
-    # Some players appear multiple times if they changed teams
-    seen_codes = set()
-    unique_americans = []
-    for p in american_players:
-        if p['code'] not in seen_codes:
-            seen_codes.add(p['code'])
-            unique_americans.append(p)
+            code = player['code']
+            if code not in seen_codes:
+                seen_codes.add(code)
+                unique_americans.append(player)
 
     logger.info(f"  American players: {len(unique_americans)}")
 
+    # Codes of every American, for fast lookups while scanning box scores.
+    # None when the player fetch came back empty, so the box score scan
+    # falls back to checking each player's country
+    american_codes = seen_codes or None
+
     # Save all players
     save_json({
         'export_date': datetime.now().isoformat(),
@@ -746,7 +1069,7 @@ def main():
         'played': len(played_games),
         'upcoming': len(upcoming_games),
         'games': games
-    }, f'schedule_{timestamp}.json')
+    }, f'schedule_{timestamp}.json', compact=True)
 
     # =========================================================================
     # Step 4: Fetch Box Scores for Played Games
@@ -758,20 +1081,13 @@ def main():
     if not args.no_boxscores and played_games:
         logger.info(f"\nFetching box scores for {len(played_games)} played games...")
 
-        # Loop through each played game
-        for i, game in enumerate(played_games):
+        # Fetch all box scores concurrently, then process them in order
+        for game, stats in fetch_all_game_stats(played_games):
             game_code = game.get('gameCode')
 
-            # Show progress every 20 games
-            if (i + 1) % 20 == 0:
-                logger.info(f"  Progress: {i+1}/{len(played_games)}")
-
-            # Fetch the box score for this game
-            stats = fetch_game_stats(game_code)
-
             if stats:
                 # Extract American player performances
-                perfs = extract_american_performances(game, stats)
+                perfs = extract_american_performances(game, stats, american_codes)
                 all_american_performances.extend(perfs)
 
                 # Create a game recap summary
@@ -796,10 +1112,6 @@ def main():
                 }
                 game_recaps.append(recap)
 
-            # IMPORTANT: Rate limiting!
-            # Add a small delay between requests to avoid overwhelming the API
-            time.sleep(0.2)
-
     # Save game recaps
     if game_recaps:
         save_json({
@@ -821,58 +1133,10 @@ def main():
             'mode': mode,
             'performance_count': len(all_american_performances),
             'performances': all_american_performances
-        }, f'american_performances_{timestamp}.json')
+        }, f'american_performances_{timestamp}.json', compact=True)
 
         # Calculate season averages for each player
-        # We'll aggregate all their games into totals, then calculate averages
-        player_stats = {}
-
-        for perf in all_american_performances:
-            code = perf['player_code']
-
-            # Initialize player if first time seeing them
-            if code not in player_stats:
-                player_stats[code] = {
-                    'player_code': code,
-                    'player_name': perf['player_name'],
-                    'team': perf['team'],
-                    'nationality': perf['nationality'],
-                    'games_played': 0,
-                    'total_points': 0,
-                    'total_rebounds': 0,
-                    'total_assists': 0,
-                    'performances': []  # Keep list of individual games
-                }
-
-            # Add this game's stats to their totals
-            ps = player_stats[code]
-            ps['games_played'] += 1
-            ps['total_points'] += perf.get('points') or 0
-            ps['total_rebounds'] += perf.get('rebounds') or 0
-            ps['total_assists'] += perf.get('assists') or 0
-
-            # Store the individual game performance
-            ps['performances'].append({
-                'date': perf['date'],
-                'opponent': perf['road_team'] if perf['team'] == perf['local_team'] else perf['local_team'],
-                'points': perf.get('points'),
-                'rebounds': perf.get('rebounds'),
-                'assists': perf.get('assists'),
-                'minutes': perf.get('minutes'),
-            })
-
-        # Calculate per-game averages (PPG, RPG, APG)
-        for ps in player_stats.values():
-            gp = ps['games_played']
-            if gp > 0:
-                ps['ppg'] = round(ps['total_points'] / gp, 1)
-                ps['rpg'] = round(ps['total_rebounds'] / gp, 1)
-                ps['apg'] = round(ps['total_assists'] / gp, 1)
-
-        # Sort by PPG (highest first)
-        player_summary = sorted(player_stats.values(),
-                               key=lambda x: x.get('ppg', 0),
-                               reverse=True)
+        player_summary = summarize_player_stats(all_american_performances)
 
         # Save player season stats
         save_json({
@@ -902,9 +1166,7 @@ def main():
                           reverse=True)[:5]
         logger.info("\nTop American performances:")
         for p in top_games:
-            # Determine opponent (the other team)
-            opponent = p['road_team'] if p['team'] == p['local_team'] else p['local_team']
-            logger.info(f"  {p['player_name']}: {p['points']} pts vs {opponent} ({p['date'][:10]})")
+            logger.info(f"  {p['player_name']}: {p['points']} pts vs {p['opponent']} ({p['date'][:10]})")
 
 
 # =============================================================================
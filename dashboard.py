@@ -31,10 +31,20 @@ WHY A SIMPLE DASHBOARD:
     - Runs locally for development/testing
 """
 
+import gzip
 import json
 import os
+from dataclasses import dataclass, field
+from functools import lru_cache
 from glob import glob
-from flask import Flask, render_template_string, request
+from flask import Flask, request, send_from_directory
+from jinja2 import DictLoader
+
+# orjson is optional - much faster parsing for the large JSON files
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # =============================================================================
 # FLASK APP SETUP
@@ -69,21 +79,130 @@ app.jinja_env.filters['position_name'] = get_position_name
 # DATA LOADING
 # =============================================================================
 
+OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'output', 'json')
+
+# Pre-rendered pages written by render_static.py
+STATIC_HTML_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'output', 'html')
+
+
+def latest_output_file(pattern):
+    """
+    Find the newest output file matching a pattern.
+
+    Gzip-compressed copies (pattern + '.gz', written by join_data.py
+    with COMPRESS_OUTPUT=true) count as matches too.
+
+    PARAMETERS:
+        pattern (str): Glob pattern inside output/json, e.g. 'unified_*.json'
+
+    RETURNS:
+        str or None: Full path of the newest file, or None if there are none
+    """
+    pattern = os.path.join(OUTPUT_DIR, pattern)
+    files = sorted(glob(pattern) + glob(pattern + '.gz'))
+    return files[-1] if files else None
+
+
+def _read_json(path):
+    """Read and parse a JSON or .json.gz file (with orjson when available)."""
+    opener = gzip.open if path.endswith('.gz') else open
+
+    if orjson is not None:
+        with opener(path, 'rb') as f:
+            return orjson.loads(f.read())
+
+    with opener(path, 'rt', encoding='utf-8') as f:
+        return json.load(f)
+
+
+@dataclass
+class Snapshot:
+    """
+    One loaded data file plus lookups derived from it.
+
+    Everything here is built once when the file is loaded, so requests
+    only read from it. Don't modify it - it's shared between requests.
+
+    FIELDS:
+        players: All players, in file order
+        export_date: When the scraper wrote the file
+        teams: Sorted team names (for the filter dropdown)
+        states: Sorted hometown states (for the filter dropdown)
+        names_lower: Lowercased player names, same order as players
+        by_team: team name -> indexes into players
+        by_state: hometown state -> indexes into players
+    """
+    players: list = field(default_factory=list)
+    export_date: str = 'Unknown'
+    teams: list = field(default_factory=list)
+    states: list = field(default_factory=list)
+    names_lower: list = field(default_factory=list)
+    by_team: dict = field(default_factory=dict)
+    by_state: dict = field(default_factory=dict)
+
+
+def build_snapshot(data):
+    """Build a Snapshot (with filter lookups) from a loaded summary file."""
+    players = data.get('players', [])
+
+    by_team = {}
+    by_state = {}
+    for i, p in enumerate(players):
+        if p.get('team'):
+            by_team.setdefault(p['team'], []).append(i)
+        if p.get('hometown_state'):
+            by_state.setdefault(p['hometown_state'], []).append(i)
+
+    return Snapshot(
+        players=players,
+        export_date=data.get('export_date', 'Unknown'),
+        teams=sorted(by_team),
+        states=sorted(by_state),
+        names_lower=[p.get('name', '').lower() for p in players],
+        by_team=by_team,
+        by_state=by_state,
+    )
+
+
+@lru_cache(maxsize=4)
+def _load_snapshot(path, mtime):
+    """
+    Load a summary file into a Snapshot, cached by (path, modification time).
+
+    mtime is part of the cache key so a file rewritten by the scraper
+    is re-read automatically.
+    """
+    return build_snapshot(_read_json(path))
+
+
 def load_latest_data():
     """
     Load the most recent unified player data.
 
-    Returns the data from american_players_summary_*.json
+    Returns a Snapshot of american_players_summary_*.json
     (uses summary version because it's smaller and faster to load)
+
+    The Snapshot is cached until a newer file appears or it changes
+    on disk, so repeat page views don't re-read or re-index it.
     """
-    output_dir = os.path.join(os.path.dirname(__file__), 'output', 'json')
-    files = sorted(glob(os.path.join(output_dir, 'american_players_summary_*.json')))
+    path = latest_output_file('american_players_summary_*.json')
 
-    if not files:
-        return {'players': [], 'export_date': 'No data'}
+    if not path:
+        return Snapshot(export_date='No data')
+
+    return _load_snapshot(path, os.path.getmtime(path))
 
-    with open(files[-1], 'r', encoding='utf-8') as f:
-        return json.load(f)
+
+@lru_cache(maxsize=2)
+def _load_players_by_code(path, mtime):
+    """
+    Load a unified file as a player code -> player dict.
+
+    Cached by (path, modification time) like _load_snapshot(), so player
+    pages are a dict lookup instead of re-reading the whole file.
+    """
+    players = _read_json(path).get('players', [])
+    return {p['code']: p for p in players if p.get('code')}
 
 
 def load_player_detail(player_code):
@@ -92,21 +211,50 @@ def load_player_detail(player_code):
 
     Uses unified_american_players_*.json for the full game log.
     """
-    output_dir = os.path.join(os.path.dirname(__file__), 'output', 'json')
-    files = sorted(glob(os.path.join(output_dir, 'unified_american_players_*.json')))
+    path = latest_output_file('unified_american_players_*.json')
 
-    if not files:
+    if not path:
         return None
 
-    with open(files[-1], 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    return _load_players_by_code(path, os.path.getmtime(path)).get(player_code)
+
 
-    # Find the specific player
-    for player in data.get('players', []):
-        if player.get('code') == player_code:
-            return player
+def load_unified_players():
+    """
+    Load every player (with full game logs) from the newest unified file.
+
+    RETURNS:
+        list: Player dicts, or an empty list if there is no unified file
+    """
+    path = latest_output_file('unified_american_players_*.json')
+
+    if not path:
+        return []
+
+    return _read_json(path).get('players', [])
+
+
+def static_page_if_fresh(relative_path, data_pattern):
+    """
+    Find a pre-rendered page that is at least as new as its data file.
+
+    PARAMETERS:
+        relative_path (str): Page path inside output/html, e.g. 'index.html'
+        data_pattern (str): Glob pattern of the data file the page came from
+
+    RETURNS:
+        str or None: relative_path if the page can be served as-is, else None
+    """
+    page = os.path.join(STATIC_HTML_DIR, relative_path)
+    data_path = latest_output_file(data_pattern)
+
+    if not data_path or not os.path.exists(page):
+        return None
 
-    return None
+    if os.path.getmtime(page) < os.path.getmtime(data_path):
+        return None  # Data changed since the page was rendered
+
+    return relative_path
 
 
 # =============================================================================
@@ -208,7 +356,7 @@ BASE_TEMPLATE = """
 """
 
 HOME_TEMPLATE = """
-{% extends "base" %}
+{% extends "base.html" %}
 {% block content %}
 <p class="last-updated">Last updated: {{ export_date }}</p>
 
@@ -278,7 +426,7 @@ HOME_TEMPLATE = """
 """
 
 PLAYER_TEMPLATE = """
-{% extends "base" %}
+{% extends "base.html" %}
 {% block content %}
 <a href="/">&larr; Back to all players</a>
 
@@ -391,47 +539,64 @@ PLAYER_TEMPLATE = """
 """
 
 
+# Compile the templates once at startup instead of on every request.
+# The templates live in Flask's Jinja environment so the position_name
+# filter is available and "base.html" can be extended by name.
+# (The .html names matter: Flask only autoescapes .html templates.)
+app.jinja_loader = DictLoader({
+    'base.html': BASE_TEMPLATE,
+    'home.html': HOME_TEMPLATE,
+    'player.html': PLAYER_TEMPLATE,
+})
+HOME_TPL = app.jinja_env.get_template('home.html')
+PLAYER_TPL = app.jinja_env.get_template('player.html')
+
+
 # =============================================================================
 # ROUTES
 # =============================================================================
 
-@app.route('/')
-def home():
-    """
-    Main page showing all players with filtering options.
+def render_home(snapshot, search='', selected_team='', selected_state='', sort_by='ppg'):
     """
-    # Load data
-    data = load_latest_data()
-    players = data.get('players', [])
-    export_date = data.get('export_date', 'Unknown')
+    Render the player list page.
 
-    # Get filter parameters from URL
-    search = request.args.get('search', '').lower()
-    selected_team = request.args.get('team', '')
-    selected_state = request.args.get('state', '')
-    sort_by = request.args.get('sort', 'ppg')
+    PARAMETERS:
+        snapshot (Snapshot): Data from load_latest_data()
+        search (str): Lowercased name substring to filter by
+        selected_team (str): Team name to filter by ('' for all)
+        selected_state (str): Hometown state to filter by ('' for all)
+        sort_by (str): One of name, team, ppg, rpg, apg
 
+    RETURNS:
+        str: The page HTML
+    """
     # Apply filters
-    if search:
-        players = [p for p in players if search in p.get('name', '').lower()]
+    # Team/state filters are index lookups; the name search then only
+    # checks the players that are left
+    matches = range(len(snapshot.players))
 
     if selected_team:
-        players = [p for p in players if p.get('team') == selected_team]
+        matches = snapshot.by_team.get(selected_team, [])
 
     if selected_state:
-        players = [p for p in players if p.get('hometown_state') == selected_state]
+        state_matches = snapshot.by_state.get(selected_state, [])
+        if selected_team:
+            state_set = set(state_matches)
+            matches = [i for i in matches if i in state_set]
+        else:
+            matches = state_matches
+
+    if search:
+        names = snapshot.names_lower
+        matches = [i for i in matches if search in names[i]]
+
+    players = [snapshot.players[i] for i in matches]
 
     # Sort
     sort_key = sort_by if sort_by in ['name', 'team', 'ppg', 'rpg', 'apg'] else 'ppg'
     reverse = sort_by in ['ppg', 'rpg', 'apg']  # Numeric sorts are descending
     players = sorted(players, key=lambda p: p.get(sort_key) or 0, reverse=reverse)
 
-    # Get unique teams and states for filter dropdowns
-    all_data = load_latest_data()
-    all_players = all_data.get('players', [])
-    teams = sorted(set(p.get('team') for p in all_players if p.get('team')))
-    states = sorted(set(p.get('hometown_state') for p in all_players if p.get('hometown_state')))
-
     # Build query string for sort links (preserving other filters)
     query_parts = []
     if search:
@@ -442,13 +607,11 @@ def home():
         query_parts.append(f"state={selected_state}")
     query_string = '&'.join(query_parts)
 
-    return render_template_string(
-        BASE_TEMPLATE.replace('{% block content %}{% endblock %}',
-                              HOME_TEMPLATE.replace('{% extends "base" %}', '')),
+    return HOME_TPL.render(
         players=players,
-        export_date=export_date,
-        teams=teams,
-        states=states,
+        export_date=snapshot.export_date,
+        teams=snapshot.teams,
+        states=snapshot.states,
         search=search,
         selected_team=selected_team,
         selected_state=selected_state,
@@ -456,21 +619,43 @@ def home():
     )
 
 
+@app.route('/')
+def home():
+    """
+    Main page showing all players with filtering options.
+    """
+    # The unfiltered page doesn't depend on the request, so serve the
+    # pre-rendered copy from render_static.py when it's up to date
+    if not request.args:
+        page = static_page_if_fresh('index.html', 'american_players_summary_*.json')
+        if page:
+            return send_from_directory(STATIC_HTML_DIR, page)
+
+    # Get filter parameters from URL
+    return render_home(
+        load_latest_data(),
+        search=request.args.get('search', '').lower(),
+        selected_team=request.args.get('team', ''),
+        selected_state=request.args.get('state', ''),
+        sort_by=request.args.get('sort', 'ppg'),
+    )
+
+
 @app.route('/player/<code>')
 def player_detail(code):
     """
     Player detail page with full game log.
     """
+    page = static_page_if_fresh(f'player/{code}.html', 'unified_american_players_*.json')
+    if page:
+        return send_from_directory(STATIC_HTML_DIR, page)
+
     player = load_player_detail(code)
 
     if not player:
         return "Player not found", 404
 
-    return render_template_string(
-        BASE_TEMPLATE.replace('{% block content %}{% endblock %}',
-                              PLAYER_TEMPLATE.replace('{% extends "base" %}', '')),
-        player=player
-    )
+    return PLAYER_TPL.render(player=player)
 
 
 # =============================================================================
@@ -2,14 +2,350 @@
 MySQL database connector with methods for CRUD operations.
 """
 import mysql.connector
-from mysql.connector import Error
-from typing import List, Dict, Optional, Any
+from mysql.connector import Error, pooling
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+from typing import List, Dict, Optional, Any, Iterator
 from datetime import datetime, date
+from itertools import chain
 import logging
 import json
+import re
+import threading
+import time
+
+# orjson is optional - fetch_all_json() falls back to json without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Max rows per multi-row INSERT. Keeps each statement far below MySQL's
+# max_allowed_packet even for wide tables like players.
+BULK_CHUNK_SIZE = 500
+
+# Connections kept open in the pool. Each call borrows one, so up to this
+# many threads (e.g. Flask request handlers) can query at the same time.
+POOL_SIZE = 10
+
+# Names whose hometown_cache row (or miss) get_hometown_cache() keeps in
+# memory. Several lookup sources probe the same names in one run.
+HOMETOWN_MEMO_SIZE = 8192
+
+# Matches "INSERT ... VALUES (<row template>) [ON DUPLICATE KEY UPDATE ...]".
+# execute_many() repeats the row template to send many rows in one statement.
+_INSERT_VALUES_RE = re.compile(
+    r'^(\s*INSERT\s.+?\sVALUES\s*)(\(.+?\))(\s*(?:ON\s+DUPLICATE\s.+)?)$',
+    re.IGNORECASE | re.DOTALL
+)
+
+# ========================================
+# UPSERT COLUMNS
+# ========================================
+# Column order matches the parameter tuples built by the _*_params() methods.
+# Each table also has a *_DEFAULTS dict for keys that may be missing from
+# the scraped dicts; everything else defaults to NULL.
+
+_TEAM_COLUMNS = (
+    'team_id', 'league_id', 'team_name', 'team_name_normalized',
+    'team_code', 'team_slug', 'city', 'country', 'arena', 'arena_capacity',
+    'logo_url', 'website_url', 'source_team_id', 'is_active',
+)
+
+_TEAM_DEFAULTS = {'league_id': 'EUROLEAGUE', 'is_active': True}
+
+# Columns returned by get_all_teams()/get_team_by_id() - what rosters and
+# exports actually use, without the bookkeeping columns
+_TEAM_SUMMARY_COLUMNS = (
+    "team_id, team_name, team_code, team_slug, city, country, arena, logo_url"
+)
+
+_TEAM_UPDATE = """
+    team_name = VALUES(team_name),
+    team_name_normalized = VALUES(team_name_normalized),
+    team_code = VALUES(team_code),
+    team_slug = VALUES(team_slug),
+    city = VALUES(city),
+    country = VALUES(country),
+    arena = VALUES(arena),
+    arena_capacity = VALUES(arena_capacity),
+    logo_url = VALUES(logo_url),
+    website_url = VALUES(website_url),
+    is_active = VALUES(is_active),
+    updated_at = CURRENT_TIMESTAMP
+"""
+
+# birth_year isn't listed: it's a generated column (see _GENERATED_COLUMNS)
+_PLAYER_COLUMNS = (
+    'player_id', 'team_id', 'league_id',
+    'first_name', 'last_name', 'full_name', 'full_name_normalized',
+    'jersey_number', 'position',
+    'height_cm', 'height_display', 'weight_kg', 'weight_display',
+    'birth_date', 'birth_country', 'birth_city',
+    'is_american',
+    'hometown_city', 'hometown_state', 'hometown_source', 'hometown_lookup_date',
+    'high_school', 'high_school_city', 'high_school_state',
+    'college', 'college_years',
+    'photo_url', 'photo_url_16x9', 'photo_url_square', 'photo_source',
+    'euroleague_profile_url', 'basketball_ref_url', 'wikipedia_url',
+    'source_player_id', 'needs_hometown_lookup', 'needs_manual_review', 'is_active',
+)
+
+_PLAYER_DEFAULTS = {
+    'league_id': 'EUROLEAGUE',
+    'is_american': False,
+    'needs_hometown_lookup': False,
+    'needs_manual_review': False,
+    'is_active': True,
+}
+
+# ON DUPLICATE KEY UPDATE expression per column. Columns not listed
+# (hometown, education, review flags) are never overwritten by an upsert.
+_PLAYER_UPDATE_EXPRS = {
+    'team_id': 'VALUES(team_id)',
+    'first_name': 'VALUES(first_name)',
+    'last_name': 'VALUES(last_name)',
+    'full_name': 'VALUES(full_name)',
+    'full_name_normalized': 'VALUES(full_name_normalized)',
+    'jersey_number': 'VALUES(jersey_number)',
+    'position': 'VALUES(position)',
+    'height_cm': 'VALUES(height_cm)',
+    'height_display': 'VALUES(height_display)',
+    'weight_kg': 'VALUES(weight_kg)',
+    'weight_display': 'VALUES(weight_display)',
+    'birth_date': 'VALUES(birth_date)',
+    'birth_country': 'VALUES(birth_country)',
+    'birth_city': 'VALUES(birth_city)',
+    'is_american': 'VALUES(is_american)',
+    'photo_url': 'COALESCE(VALUES(photo_url), photo_url)',
+    'photo_url_16x9': 'COALESCE(VALUES(photo_url_16x9), photo_url_16x9)',
+    'photo_url_square': 'COALESCE(VALUES(photo_url_square), photo_url_square)',
+    'photo_source': 'COALESCE(VALUES(photo_source), photo_source)',
+    'euroleague_profile_url': 'VALUES(euroleague_profile_url)',
+    'source_player_id': 'VALUES(source_player_id)',
+    'needs_hometown_lookup': 'VALUES(needs_hometown_lookup)',
+    'is_active': 'VALUES(is_active)',
+}
+
+_PLAYER_UPDATE = ",\n".join(
+    [f"{column} = {expr}" for column, expr in _PLAYER_UPDATE_EXPRS.items()]
+    + ["updated_at = CURRENT_TIMESTAMP"]
+)
+
+_GAME_COLUMNS = (
+    'game_id', 'league_id', 'season', 'season_code',
+    'round_number', 'round_name', 'phase',
+    'home_team_id', 'away_team_id',
+    'game_date', 'game_time', 'game_datetime', 'timezone', 'game_date_utc',
+    'venue', 'city', 'country',
+    'status',
+    'home_score', 'away_score',
+    'source_game_id', 'game_url',
+)
+
+_GAME_DEFAULTS = {
+    'league_id': 'EUROLEAGUE',
+    'timezone': 'Europe/Madrid',
+    'status': 'scheduled',
+}
+
+_GAME_UPDATE = """
+    round_number = VALUES(round_number),
+    round_name = VALUES(round_name),
+    phase = VALUES(phase),
+    game_date = VALUES(game_date),
+    game_time = VALUES(game_time),
+    game_datetime = VALUES(game_datetime),
+    venue = VALUES(venue),
+    status = VALUES(status),
+    home_score = VALUES(home_score),
+    away_score = VALUES(away_score),
+    game_url = VALUES(game_url),
+    updated_at = CURRENT_TIMESTAMP
+"""
+
+_STAT_COLUMNS = (
+    'game_id', 'player_id', 'team_id',
+    'is_home_team', 'is_starter', 'did_not_play', 'dnp_reason',
+    'minutes_played', 'minutes_decimal',
+    'points', 'rebounds_total', 'rebounds_offensive', 'rebounds_defensive',
+    'assists', 'steals', 'blocks', 'blocks_against',
+    'turnovers', 'fouls_personal', 'fouls_drawn',
+    'fg_made', 'fg_attempted', 'fg_percentage',
+    'two_pt_made', 'two_pt_attempted', 'two_pt_percentage',
+    'three_pt_made', 'three_pt_attempted', 'three_pt_percentage',
+    'ft_made', 'ft_attempted', 'ft_percentage',
+    'plus_minus', 'efficiency_rating',
+)
+
+# Counting stats default to 0; percentages, minutes and ratings to NULL
+_STAT_DEFAULTS = {
+    'did_not_play': False,
+    **dict.fromkeys((
+        'points', 'rebounds_total', 'rebounds_offensive', 'rebounds_defensive',
+        'assists', 'steals', 'blocks', 'blocks_against',
+        'turnovers', 'fouls_personal', 'fouls_drawn',
+        'fg_made', 'fg_attempted', 'two_pt_made', 'two_pt_attempted',
+        'three_pt_made', 'three_pt_attempted', 'ft_made', 'ft_attempted',
+    ), 0),
+}
+
+_STAT_UPDATE = """
+    minutes_played = VALUES(minutes_played),
+    minutes_decimal = VALUES(minutes_decimal),
+    points = VALUES(points),
+    rebounds_total = VALUES(rebounds_total),
+    assists = VALUES(assists),
+    updated_at = CURRENT_TIMESTAMP
+"""
+
+_MARK_STATS_SCRAPED_SQL = """
+    UPDATE schedule SET
+        stats_scraped = TRUE,
+        stats_scraped_at = CURRENT_TIMESTAMP,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE game_id = %s
+"""
+
+# (column, default) pairs, resolved once here instead of on every row
+_TEAM_FIELDS = tuple((c, _TEAM_DEFAULTS.get(c)) for c in _TEAM_COLUMNS)
+_PLAYER_FIELDS = tuple((c, _PLAYER_DEFAULTS.get(c)) for c in _PLAYER_COLUMNS)
+_GAME_FIELDS = tuple((c, _GAME_DEFAULTS.get(c)) for c in _GAME_COLUMNS)
+# game_id comes from the caller, not the stat dict
+_STAT_FIELDS = tuple((c, _STAT_DEFAULTS.get(c)) for c in _STAT_COLUMNS[1:])
+
+
+def _row_params(data: Dict, fields: tuple) -> tuple:
+    """Pull one row's parameters out of a dict, in column order."""
+    return tuple([data.get(column, default) for column, default in fields])
+
+
+@lru_cache(maxsize=64)
+def _player_upsert_sql(columns: tuple) -> str:
+    """
+    Build a one-row player upsert that only writes the given columns.
+
+    Cached per column set - the scrapers only produce a few dict shapes.
+    """
+    updates = [f"{column} = {_PLAYER_UPDATE_EXPRS[column]}"
+               for column in columns if column in _PLAYER_UPDATE_EXPRS]
+    updates.append("updated_at = CURRENT_TIMESTAMP")
+    return (
+        f"INSERT INTO players ({', '.join(columns)}) "
+        f"VALUES ({', '.join(['%s'] * len(columns))}) "
+        f"ON DUPLICATE KEY UPDATE {', '.join(updates)}"
+    )
+
+
+# ========================================
+# INDEXES
+# ========================================
+# Composite indexes for the filters used by the lookup/dashboard queries.
+# They're also in schema.sql; ensure_indexes() adds them to databases
+# created before they existed. (table, index name, columns)
+_INDEXES = (
+    ('players', 'idx_players_hometown_lookup',
+     'is_american, is_active, needs_hometown_lookup, hometown_state'),
+    ('schedule', 'idx_schedule_upcoming',
+     'has_american_player, status, game_date, game_time'),
+    ('players', 'idx_players_state',
+     'is_american, is_active, hometown_state, team_id'),
+)
+
+# Unique keys older databases may be missing: (table, name, columns,
+# statement that first deletes the duplicate rows the key would reject)
+_UNIQUE_INDEXES = (
+    ('hometown_cache', 'uk_name_source', 'player_name_search, lookup_source', """
+        DELETE older FROM hometown_cache older
+        JOIN hometown_cache newer
+          ON newer.player_name_search = older.player_name_search
+         AND newer.lookup_source = older.lookup_source
+         AND (newer.lookup_successful > older.lookup_successful
+              OR (newer.lookup_successful = older.lookup_successful
+                  AND newer.cache_id > older.cache_id))
+    """),
+)
+
+# Columns MySQL computes from other columns: (table, column, definition).
+# ensure_generated_columns() converts them on databases created before.
+# full_name_normalized and is_american stay in Python - normalize_name()
+# strips accents and is_american matches nationality aliases, which plain
+# SQL expressions can't reproduce.
+_GENERATED_COLUMNS = (
+    ('players', 'birth_year', 'SMALLINT GENERATED ALWAYS AS (YEAR(birth_date)) STORED'),
+)
+
+# Shared by get_schedule_with_americans() and iter_schedule_with_americans()
+_SCHEDULE_WITH_AMERICANS_SQL = """
+    SELECT
+        s.*,
+        ht.team_name AS home_team_name,
+        at.team_name AS away_team_name
+    FROM schedule s
+    JOIN teams ht ON s.home_team_id = ht.team_id
+    JOIN teams at ON s.away_team_id = at.team_id
+    WHERE s.has_american_player = TRUE
+    ORDER BY s.game_date, s.game_time
+"""
+
+
+def _logs_db_errors(message: str, default=None, log_query: bool = False):
+    """
+    Log a method's database errors and return `default` instead of raising.
+
+    This is the error boundary for the public execute/fetch methods, whose
+    callers check for None/[]. Internal batch code uses the raising helpers
+    (_cursor(), _execute(), bulk_cursor()) so one failed statement fails
+    the whole batch instead of being skipped.
+
+    Args:
+        message: Log message prefix
+        default: Value returned on error; a callable (e.g. list) is called
+            so every caller gets a fresh value
+        log_query: Also log the query (the method's first argument)
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return fn(self, *args, **kwargs)
+            except Error as e:
+                logger.error(f"{message}: {e}")
+                if log_query and args:
+                    logger.error(f"Query: {args[0]}")
+                return default() if callable(default) else default
+        return wrapper
+    return decorator
+
+
+def _cached(ttl: int):
+    """
+    Cache a read method's result on the connector for `ttl` seconds.
+
+    Keyed by method name + arguments. Write methods drop stale entries
+    with self._invalidate(). Empty results aren't cached, since fetch_*
+    also returns empty on errors. Callers must not modify the returned
+    rows - they're shared until the entry expires.
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            key = (fn.__name__, args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            hit = self._read_cache.get(key)
+            if hit and hit[0] > now:
+                return hit[1]
+
+            result = fn(self, *args, **kwargs)
+            if result:
+                self._read_cache[key] = (now + ttl, result)
+            return result
+        return wrapper
+    return decorator
+
 
 class MySQLConnector:
     """MySQL database connector for EuroLeague tracker."""
@@ -22,12 +358,27 @@ class MySQLConnector:
             config: Dict with host, port, user, password, database
         """
         self.config = config
-        self.connection = None
+        self.pool = None
+        # Results of @_cached read methods: key -> (expires_at, result)
+        self._read_cache = {}
+        # Prepared cursors: (connection id, query) -> cursor
+        self._prep_cursors = {}
+        # Per-thread state: .conn is the connection of an open transaction()
+        self._local = threading.local()
+        # get_hometown_cache() results, least recently used first
+        self._hometown_memo = OrderedDict()
+        self._hometown_memo_lock = threading.Lock()
 
     def connect(self):
-        """Establish database connection."""
+        """Create the connection pool (opens POOL_SIZE connections)."""
         try:
-            self.connection = mysql.connector.connect(
+            self.pool = pooling.MySQLConnectionPool(
+                pool_name='euroleague',
+                pool_size=POOL_SIZE,
+                # Keep the session (and its prepared statements) when a
+                # connection goes back to the pool; _connection() rolls
+                # back instead, so no stale read snapshot is carried over
+                pool_reset_session=False,
                 host=self.config['host'],
                 port=self.config['port'],
                 user=self.config['user'],
@@ -36,141 +387,475 @@ class MySQLConnector:
                 charset='utf8mb4',
                 collation='utf8mb4_unicode_ci'
             )
-            logger.info("Connected to MySQL database")
+            logger.info(f"Connected to MySQL database (pool of {POOL_SIZE})")
             return True
         except Error as e:
             logger.error(f"Error connecting to MySQL: {e}")
             return False
 
     def disconnect(self):
-        """Close database connection."""
-        if self.connection and self.connection.is_connected():
-            self.connection.close()
+        """Close all pooled connections."""
+        for cursor in self._prep_cursors.values():
+            try:
+                cursor.close()
+            except Error:
+                pass
+        self._prep_cursors.clear()
+
+        if self.pool:
+            self.pool._remove_connections()
+            self.pool = None
             logger.info("Disconnected from MySQL database")
 
     def ensure_connected(self):
-        """Ensure connection is active, reconnect if needed."""
-        if not self.connection or not self.connection.is_connected():
+        """Create the pool if it doesn't exist yet (e.g. connect() failed earlier)."""
+        if not self.pool:
             self.connect()
 
-    def execute(self, query: str, params: tuple = None) -> Optional[int]:
+    def ensure_indexes(self) -> bool:
         """
-        Execute a query (INSERT, UPDATE, DELETE).
+        Create any indexes from _INDEXES and _UNIQUE_INDEXES that the database is missing.
+
+        MySQL has no CREATE INDEX IF NOT EXISTS, so existing indexes are
+        looked up in information_schema first. Tables that got a new index
+        are analyzed so the planner starts using it right away.
 
         Returns:
-            Number of affected rows or None on error
+            True if all indexes exist afterwards
+        """
+        existing = {
+            (row['table_name'], row['index_name'])
+            for row in self.fetch_all("""
+                SELECT DISTINCT TABLE_NAME AS table_name, INDEX_NAME AS index_name
+                FROM information_schema.statistics
+                WHERE TABLE_SCHEMA = DATABASE()
+            """)
+        }
+
+        ok = True
+        created_on = set()
+        for table, name, columns in _INDEXES:
+            if (table, name) in existing:
+                continue
+            if self.execute(f"CREATE INDEX {name} ON {table} ({columns})") is None:
+                ok = False
+                continue
+            logger.info(f"Created index {name} on {table}")
+            created_on.add(table)
+
+        for table, name, columns, dedupe_sql in _UNIQUE_INDEXES:
+            if (table, name) in existing:
+                continue
+            if (self.execute(dedupe_sql) is None
+                    or self.execute(f"CREATE UNIQUE INDEX {name} ON {table} ({columns})") is None):
+                ok = False
+                continue
+            logger.info(f"Created index {name} on {table}")
+            created_on.add(table)
+
+        if created_on:
+            self.fetch_all(f"ANALYZE TABLE {', '.join(sorted(created_on))}")
+        return ok
+
+    def ensure_generated_columns(self) -> bool:
+        """
+        Turn the columns in _GENERATED_COLUMNS into generated columns.
+
+        Older databases have them as plain columns that the upserts filled
+        in. Upserts no longer send them, so they must be generated for the
+        values to stay filled in.
+
+        Returns:
+            True if all columns are generated afterwards
+        """
+        generated = {
+            (row['table_name'], row['column_name'])
+            for row in self.fetch_all("""
+                SELECT TABLE_NAME AS table_name, COLUMN_NAME AS column_name
+                FROM information_schema.columns
+                WHERE TABLE_SCHEMA = DATABASE()
+                  AND EXTRA LIKE '%GENERATED%'
+            """)
+        }
+
+        ok = True
+        for table, column, definition in _GENERATED_COLUMNS:
+            if (table, column) in generated:
+                continue
+            if self.execute(f"ALTER TABLE {table} MODIFY COLUMN {column} {definition}") is None:
+                ok = False
+                continue
+            logger.info(f"Made {table}.{column} a generated column")
+        return ok
+
+    @contextmanager
+    def _connection(self):
         """
+        Borrow a connection from the pool for the length of a with-block.
+
+        Closing a pooled connection hands it back to the pool instead of
+        closing the socket. The connection is rolled back first: the pool
+        keeps sessions alive, and autocommit is off, so an open read would
+        otherwise pin its REPEATABLE READ snapshot for the next borrower.
+        """
+        # Inside transaction(), every call in this thread shares its connection
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            yield conn
+            return
+
         self.ensure_connected()
+        if not self.pool:
+            raise Error("No database connection pool")
+        conn = self.pool.get_connection()
         try:
-            cursor = self.connection.cursor()
+            yield conn
+        finally:
+            try:
+                conn.rollback()
+            except Error:
+                pass
+            conn.close()
+
+    def _commit(self, conn):
+        """Commit, unless an open transaction() will commit everything at its end."""
+        if getattr(self._local, 'conn', None) is None:
+            conn.commit()
+
+    @contextmanager
+    def transaction(self):
+        """
+        Run a block of writes as one transaction on one connection.
+
+        Inside the block, execute() and everything built on it skip their
+        per-statement commit. The block is committed once at the end, or
+        rolled back if it raises. A nested transaction() joins the outer one.
+
+        Example:
+            with db.transaction():
+                for photo in photos:
+                    db.execute(query, params)
+        """
+        if getattr(self._local, 'conn', None) is not None:
+            yield
+            return
+
+        with self._connection() as conn:
+            self._local.conn = conn
+            try:
+                yield
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+            finally:
+                self._local.conn = None
+
+    def _prepared_cursor(self, conn, query: str):
+        """
+        Get this connection's prepared cursor for a query, creating it once.
+
+        MySQL parses and plans a prepared statement once; later executions
+        only send the parameters. The cursors stay open until disconnect(),
+        so only use this for fixed-shape statements - every distinct query
+        text holds a server-side statement per connection.
+        """
+        key = (conn.connection_id, query)
+        cursor = self._prep_cursors.get(key)
+        if cursor is None:
+            cursor = self._prep_cursors[key] = conn.cursor(prepared=True)
+        return cursor
+
+    @contextmanager
+    def _cursor(self, commit: bool = False, **cursor_args):
+        """
+        Open a cursor on a pooled connection for the length of a with-block.
+
+        The cursor is always closed and the connection handed back. Errors
+        are not caught here - they propagate to the caller.
+
+        Args:
+            commit: Commit when the block finishes without an error
+            **cursor_args: Passed to conn.cursor(), e.g. dictionary=True
+        """
+        with self._connection() as conn:
+            cursor = conn.cursor(**cursor_args)
+            try:
+                yield cursor
+                if commit:
+                    self._commit(conn)
+            finally:
+                cursor.close()
+
+    @contextmanager
+    def bulk_cursor(self):
+        """
+        Yield one reusable cursor for a loop of write statements.
+
+        Everything executed on it shares one transaction, committed once
+        when the block ends. If the block raises, nothing is committed and
+        the error propagates.
+
+        Example:
+            with db.bulk_cursor() as cursor:
+                for params in rows:
+                    cursor.execute(query, params)
+        """
+        with self.transaction(), self._cursor() as cursor:
+            yield cursor
+
+    def _execute(self, query: str, params: tuple = None, prepared: bool = True) -> int:
+        """
+        Same as execute(), but raises Error instead of returning None.
+
+        Pass prepared=False for statements whose text varies (multi-row
+        INSERTs), so they don't each leave a prepared statement behind.
+        """
+        if params is None or not prepared:
+            # DDL, parameterless and variable-width statements: plain one-off cursor
+            with self._cursor(commit=True) as cursor:
+                cursor.execute(query, params)
+                return cursor.rowcount
+
+        with self._connection() as conn:
+            cursor = self._prepared_cursor(conn, query)
             cursor.execute(query, params)
-            self.connection.commit()
-            affected = cursor.rowcount
-            cursor.close()
-            return affected
-        except Error as e:
-            logger.error(f"Query execution error: {e}")
-            logger.error(f"Query: {query}")
-            return None
+            self._commit(conn)
+            return cursor.rowcount
+
+    @_logs_db_errors("Query execution error", log_query=True)
+    def execute(self, query: str, params: tuple = None) -> Optional[int]:
+        """
+        Execute a query (INSERT, UPDATE, DELETE).
+
+        Returns:
+            Number of affected rows or None on error
+        """
+        return self._execute(query, params)
 
+    @_logs_db_errors("Batch execution error")
     def execute_many(self, query: str, params_list: List[tuple]) -> Optional[int]:
-        """Execute a query with multiple parameter sets."""
-        self.ensure_connected()
-        try:
-            cursor = self.connection.cursor()
-            cursor.executemany(query, params_list)
-            self.connection.commit()
-            affected = cursor.rowcount
-            cursor.close()
+        """
+        Execute a query with multiple parameter sets.
+
+        INSERT ... VALUES (...) queries are rewritten into multi-row
+        INSERTs (BULK_CHUNK_SIZE rows per statement), so the rows go over
+        in a few round-trips instead of one per row. Other queries use
+        cursor.executemany().
+        """
+        with self._cursor(commit=True) as cursor:
+            match = _INSERT_VALUES_RE.match(query)
+            if not (match and params_list):
+                cursor.executemany(query, params_list)
+                return cursor.rowcount
+
+            head, row_template, tail = match.groups()
+            affected = 0
+            for start in range(0, len(params_list), BULK_CHUNK_SIZE):
+                batch = params_list[start:start + BULK_CHUNK_SIZE]
+                rewritten = head + ", ".join([row_template] * len(batch)) + tail
+                cursor.execute(rewritten, tuple(chain.from_iterable(batch)))
+                affected += cursor.rowcount
             return affected
-        except Error as e:
-            logger.error(f"Batch execution error: {e}")
-            return None
 
+    @_logs_db_errors("Fetch one error")
     def fetch_one(self, query: str, params: tuple = None) -> Optional[Dict]:
         """Fetch single row as dictionary."""
-        self.ensure_connected()
-        try:
-            cursor = self.connection.cursor(dictionary=True)
+        with self._cursor(dictionary=True) as cursor:
             cursor.execute(query, params)
-            result = cursor.fetchone()
-            cursor.close()
-            return result
-        except Error as e:
-            logger.error(f"Fetch one error: {e}")
-            return None
+            return cursor.fetchone()
 
+    @_logs_db_errors("Fetch all error", default=list)
     def fetch_all(self, query: str, params: tuple = None) -> List[Dict]:
         """Fetch all rows as list of dictionaries."""
-        self.ensure_connected()
-        try:
-            cursor = self.connection.cursor(dictionary=True)
+        with self._cursor(dictionary=True) as cursor:
+            cursor.execute(query, params)
+            return cursor.fetchall()
+
+    @_logs_db_errors("Fetch all (JSON) error")
+    def fetch_all_json(self, query: str, params: tuple = None) -> Optional[bytes]:
+        """
+        Fetch all rows and return them already encoded as a JSON array.
+
+        Uses a plain tuple cursor and zips each row with the column names
+        once, instead of a dictionary cursor, then encodes with orjson when
+        it's installed. Meant for results that go straight out as JSON.
+        Dates and decimals are written as strings, like json's default=str.
+
+        Returns:
+            UTF-8 JSON bytes, or None on error
+        """
+        with self._cursor() as cursor:
             cursor.execute(query, params)
-            results = cursor.fetchall()
-            cursor.close()
-            return results
+            rows = cursor.fetchall()
+            columns = [d[0] for d in cursor.description]
+
+        records = [dict(zip(columns, row)) for row in rows]
+        if orjson is not None:
+            return orjson.dumps(records, default=str,
+                                option=orjson.OPT_PASSTHROUGH_DATETIME)
+        return json.dumps(records, default=str).encode('utf-8')
+
+    def iter_all(self, query: str, params: tuple = None, batch: int = 500) -> Iterator[Dict]:
+        """
+        Yield rows as dictionaries, fetching `batch` rows at a time.
+
+        Uses an unbuffered cursor, so only one batch is in memory at once.
+        Meant for large results that are written out row by row. The
+        pooled connection stays checked out until iteration finishes.
+        """
+        try:
+            with self._connection() as conn:
+                cursor = conn.cursor(dictionary=True, buffered=False)
+                try:
+                    cursor.execute(query, params)
+                    while True:
+                        rows = cursor.fetchmany(batch)
+                        if not rows:
+                            break
+                        yield from rows
+                finally:
+                    # Drop unread rows if the caller stopped early, so the
+                    # connection goes back to the pool clean
+                    conn.consume_results()
+                    cursor.close()
+        except Error as e:
+            logger.error(f"Iterate error: {e}")
+
+    def _invalidate(self, *method_names: str):
+        """Drop cached results of the given @_cached methods."""
+        for key in list(self._read_cache):
+            if key[0] in method_names:
+                self._read_cache.pop(key, None)
+
+    @staticmethod
+    def _bulk_upsert_statements(table: str, columns: tuple, update_sql: str,
+                                rows: List[tuple], chunk: int = BULK_CHUNK_SIZE):
+        """
+        Yield (query, params) for multi-row INSERT ... ON DUPLICATE KEY UPDATE.
+
+        One statement per `chunk` rows; see _bulk_upsert().
+        """
+        row_placeholders = "(" + ", ".join(["%s"] * len(columns)) + ")"
+        head = f"INSERT INTO {table} ({', '.join(columns)}) VALUES "
+        tail = f" ON DUPLICATE KEY UPDATE {update_sql}"
+
+        for start in range(0, len(rows), chunk):
+            batch = rows[start:start + chunk]
+            query = head + ", ".join([row_placeholders] * len(batch)) + tail
+            yield query, tuple(chain.from_iterable(batch))
+
+    def _bulk_upsert(self, table: str, columns: tuple, update_sql: str,
+                     rows: List[tuple], chunk: int = BULK_CHUNK_SIZE) -> Optional[int]:
+        """
+        Insert or update many rows with multi-row INSERT ... ON DUPLICATE KEY UPDATE.
+
+        Sends one statement (one round-trip) per `chunk` rows instead of
+        one per row.
+
+        Args:
+            table: Table to write to
+            columns: Column names, in the same order as each row's values
+            update_sql: Body of the ON DUPLICATE KEY UPDATE clause
+            rows: One parameter tuple per row
+            chunk: Max rows per statement
+
+        Returns:
+            Total affected rows or None on error
+        """
+        # All chunks commit together, so a failed chunk leaves nothing half-saved
+        total = 0
+        try:
+            with self.transaction():
+                for query, params in self._bulk_upsert_statements(table, columns, update_sql, rows, chunk):
+                    total += self._execute(query, params, prepared=False)
         except Error as e:
-            logger.error(f"Fetch all error: {e}")
-            return []
+            logger.error(f"Bulk upsert into {table} failed: {e}")
+            return None
+        return total
 
     # ========================================
     # TEAM OPERATIONS
     # ========================================
 
+    @staticmethod
+    def _team_params(team: Dict) -> tuple:
+        """Build the upsert parameter tuple for one team (order of _TEAM_COLUMNS)."""
+        return _row_params(team, _TEAM_FIELDS)
+
     def upsert_team(self, team: Dict) -> bool:
         """Insert or update a team."""
-        query = """
-            INSERT INTO teams (
-                team_id, league_id, team_name, team_name_normalized,
-                team_code, team_slug, city, country, arena, arena_capacity,
-                logo_url, website_url, source_team_id, is_active
-            ) VALUES (
-                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-            )
-            ON DUPLICATE KEY UPDATE
-                team_name = VALUES(team_name),
-                team_name_normalized = VALUES(team_name_normalized),
-                team_code = VALUES(team_code),
-                team_slug = VALUES(team_slug),
-                city = VALUES(city),
-                country = VALUES(country),
-                arena = VALUES(arena),
-                arena_capacity = VALUES(arena_capacity),
-                logo_url = VALUES(logo_url),
-                website_url = VALUES(website_url),
-                is_active = VALUES(is_active),
-                updated_at = CURRENT_TIMESTAMP
-        """
-        params = (
-            team.get('team_id'),
-            team.get('league_id', 'EUROLEAGUE'),
-            team.get('team_name'),
-            team.get('team_name_normalized'),
-            team.get('team_code'),
-            team.get('team_slug'),
-            team.get('city'),
-            team.get('country'),
-            team.get('arena'),
-            team.get('arena_capacity'),
-            team.get('logo_url'),
-            team.get('website_url'),
-            team.get('source_team_id'),
-            team.get('is_active', True)
-        )
-        result = self.execute(query, params)
+        return self.upsert_teams([team])
+
+    def upsert_teams(self, teams: List[Dict]) -> bool:
+        """Insert or update many teams with batched multi-row statements."""
+        rows = [self._team_params(team) for team in teams]
+        result = self._bulk_upsert('teams', _TEAM_COLUMNS, _TEAM_UPDATE, rows)
+        self._invalidate('get_all_teams', 'get_team_by_id', 'get_american_players_with_hometown')
         return result is not None
 
+    @_cached(ttl=300)
     def get_all_teams(self, league_id: str = 'EUROLEAGUE') -> List[Dict]:
-        """Get all active teams for a league."""
-        query = """
-            SELECT * FROM teams
+        """Get all active teams for a league (display columns only)."""
+        query = f"""
+            SELECT {_TEAM_SUMMARY_COLUMNS} FROM teams
             WHERE league_id = %s AND is_active = TRUE
             ORDER BY team_name
         """
         return self.fetch_all(query, (league_id,))
 
+    @_cached(ttl=600)
     def get_team_by_id(self, team_id: str) -> Optional[Dict]:
-        """Get team by ID."""
+        """Get team by ID (display columns only - see get_team_full)."""
+        query = f"SELECT {_TEAM_SUMMARY_COLUMNS} FROM teams WHERE team_id = %s"
+        return self.fetch_one(query, (team_id,))
+
+    def get_dashboard_payload(self, league_id: str = 'EUROLEAGUE') -> List[Dict]:
+        """
+        Get every active team with its active American players nested inside.
+
+        MySQL builds the nested players list (JSON_ARRAYAGG) so the whole
+        thing comes back in one query instead of one query per team.
+
+        Returns:
+            Team dicts (display columns) each with an 'american_players' list
+        """
+        team_columns = ", ".join(f"t.{c.strip()}" for c in _TEAM_SUMMARY_COLUMNS.split(","))
+        query = f"""
+            SELECT
+                {team_columns},
+                JSON_ARRAYAGG(
+                    CASE WHEN p.player_id IS NULL THEN NULL ELSE JSON_OBJECT(
+                        'player_id', p.player_id,
+                        'full_name', p.full_name,
+                        'position', p.position,
+                        'jersey_number', p.jersey_number,
+                        'hometown_city', p.hometown_city,
+                        'hometown_state', p.hometown_state,
+                        'high_school', p.high_school,
+                        'college', p.college,
+                        'photo_url_16x9', p.photo_url_16x9
+                    ) END
+                ) AS american_players
+            FROM teams t
+            LEFT JOIN players p
+                ON p.team_id = t.team_id AND p.is_american = TRUE AND p.is_active = TRUE
+            WHERE t.league_id = %s AND t.is_active = TRUE
+            GROUP BY t.team_id
+            ORDER BY t.team_name
+        """
+        rows = self.fetch_all(query, (league_id,))
+        for row in rows:
+            # The driver hands JSON columns back as text; teams without
+            # Americans come back as [null]
+            players = row['american_players']
+            if isinstance(players, (str, bytes)):
+                players = json.loads(players)
+            row['american_players'] = [p for p in players or [] if p]
+        return rows
+
+    def get_team_full(self, team_id: str) -> Optional[Dict]:
+        """Get every column of a team's row."""
         query = "SELECT * FROM teams WHERE team_id = %s"
         return self.fetch_one(query, (team_id,))
 
@@ -178,94 +863,30 @@ class MySQLConnector:
     # PLAYER OPERATIONS
     # ========================================
 
+    @staticmethod
+    def _player_params(player: Dict) -> tuple:
+        """Build the upsert parameter tuple for one player (order of _PLAYER_COLUMNS)."""
+        return _row_params(player, _PLAYER_FIELDS)
+
     def upsert_player(self, player: Dict) -> bool:
-        """Insert or update a player."""
-        query = """
-            INSERT INTO players (
-                player_id, team_id, league_id,
-                first_name, last_name, full_name, full_name_normalized,
-                jersey_number, position,
-                height_cm, height_display, weight_kg, weight_display,
-                birth_date, birth_year, birth_country, birth_city,
-                is_american,
-                hometown_city, hometown_state, hometown_source, hometown_lookup_date,
-                high_school, high_school_city, high_school_state,
-                college, college_years,
-                photo_url, photo_url_16x9, photo_url_square, photo_source,
-                euroleague_profile_url, basketball_ref_url, wikipedia_url,
-                source_player_id, needs_hometown_lookup, needs_manual_review, is_active
-            ) VALUES (
-                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-            )
-            ON DUPLICATE KEY UPDATE
-                team_id = VALUES(team_id),
-                first_name = VALUES(first_name),
-                last_name = VALUES(last_name),
-                full_name = VALUES(full_name),
-                full_name_normalized = VALUES(full_name_normalized),
-                jersey_number = VALUES(jersey_number),
-                position = VALUES(position),
-                height_cm = VALUES(height_cm),
-                height_display = VALUES(height_display),
-                weight_kg = VALUES(weight_kg),
-                weight_display = VALUES(weight_display),
-                birth_date = VALUES(birth_date),
-                birth_year = VALUES(birth_year),
-                birth_country = VALUES(birth_country),
-                birth_city = VALUES(birth_city),
-                is_american = VALUES(is_american),
-                photo_url = COALESCE(VALUES(photo_url), photo_url),
-                photo_url_16x9 = COALESCE(VALUES(photo_url_16x9), photo_url_16x9),
-                photo_url_square = COALESCE(VALUES(photo_url_square), photo_url_square),
-                photo_source = COALESCE(VALUES(photo_source), photo_source),
-                euroleague_profile_url = VALUES(euroleague_profile_url),
-                source_player_id = VALUES(source_player_id),
-                needs_hometown_lookup = VALUES(needs_hometown_lookup),
-                is_active = VALUES(is_active),
-                updated_at = CURRENT_TIMESTAMP
         """
-        params = (
-            player.get('player_id'),
-            player.get('team_id'),
-            player.get('league_id', 'EUROLEAGUE'),
-            player.get('first_name'),
-            player.get('last_name'),
-            player.get('full_name'),
-            player.get('full_name_normalized'),
-            player.get('jersey_number'),
-            player.get('position'),
-            player.get('height_cm'),
-            player.get('height_display'),
-            player.get('weight_kg'),
-            player.get('weight_display'),
-            player.get('birth_date'),
-            player.get('birth_year'),
-            player.get('birth_country'),
-            player.get('birth_city'),
-            player.get('is_american', False),
-            player.get('hometown_city'),
-            player.get('hometown_state'),
-            player.get('hometown_source'),
-            player.get('hometown_lookup_date'),
-            player.get('high_school'),
-            player.get('high_school_city'),
-            player.get('high_school_state'),
-            player.get('college'),
-            player.get('college_years'),
-            player.get('photo_url'),
-            player.get('photo_url_16x9'),
-            player.get('photo_url_square'),
-            player.get('photo_source'),
-            player.get('euroleague_profile_url'),
-            player.get('basketball_ref_url'),
-            player.get('wikipedia_url'),
-            player.get('source_player_id'),
-            player.get('needs_hometown_lookup', False),
-            player.get('needs_manual_review', False),
-            player.get('is_active', True)
-        )
-        result = self.execute(query, params)
+        Insert or update a player.
+
+        Only the columns present in the dict are sent. Missing columns get
+        their schema default on insert and keep their value on update, so
+        this also works for partial updates.
+        """
+        columns = tuple(column for column in _PLAYER_COLUMNS if column in player)
+        params = tuple(player[column] for column in columns)
+        result = self.execute(_player_upsert_sql(columns), params)
+        self._invalidate('get_american_players_with_hometown')
+        return result is not None
+
+    def upsert_players(self, players: List[Dict]) -> bool:
+        """Insert or update many players with batched multi-row statements."""
+        rows = [self._player_params(player) for player in players]
+        result = self._bulk_upsert('players', _PLAYER_COLUMNS, _PLAYER_UPDATE, rows)
+        self._invalidate('get_american_players_with_hometown')
         return result is not None
 
     def get_players_needing_hometown_lookup(self) -> List[Dict]:
@@ -309,6 +930,7 @@ class MySQLConnector:
             player_id
         )
         result = self.execute(query, params)
+        self._invalidate('get_american_players_with_hometown')
         return result is not None
 
     def mark_player_for_review(self, player_id: str) -> bool:
@@ -321,8 +943,10 @@ class MySQLConnector:
             WHERE player_id = %s
         """
         result = self.execute(query, (player_id,))
+        self._invalidate('get_american_players_with_hometown')
         return result is not None
 
+    @_cached(ttl=120)
     def get_american_players_with_hometown(self) -> List[Dict]:
         """Get all American players with their hometown data."""
         query = """
@@ -345,61 +969,19 @@ class MySQLConnector:
     # SCHEDULE OPERATIONS
     # ========================================
 
+    @staticmethod
+    def _game_params(game: Dict) -> tuple:
+        """Build the upsert parameter tuple for one game (order of _GAME_COLUMNS)."""
+        return _row_params(game, _GAME_FIELDS)
+
     def upsert_game(self, game: Dict) -> bool:
         """Insert or update a game in the schedule."""
-        query = """
-            INSERT INTO schedule (
-                game_id, league_id, season, season_code,
-                round_number, round_name, phase,
-                home_team_id, away_team_id,
-                game_date, game_time, game_datetime, timezone, game_date_utc,
-                venue, city, country,
-                status,
-                home_score, away_score,
-                source_game_id, game_url
-            ) VALUES (
-                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-            )
-            ON DUPLICATE KEY UPDATE
-                round_number = VALUES(round_number),
-                round_name = VALUES(round_name),
-                phase = VALUES(phase),
-                game_date = VALUES(game_date),
-                game_time = VALUES(game_time),
-                game_datetime = VALUES(game_datetime),
-                venue = VALUES(venue),
-                status = VALUES(status),
-                home_score = VALUES(home_score),
-                away_score = VALUES(away_score),
-                game_url = VALUES(game_url),
-                updated_at = CURRENT_TIMESTAMP
-        """
-        params = (
-            game.get('game_id'),
-            game.get('league_id', 'EUROLEAGUE'),
-            game.get('season'),
-            game.get('season_code'),
-            game.get('round_number'),
-            game.get('round_name'),
-            game.get('phase'),
-            game.get('home_team_id'),
-            game.get('away_team_id'),
-            game.get('game_date'),
-            game.get('game_time'),
-            game.get('game_datetime'),
-            game.get('timezone', 'Europe/Madrid'),
-            game.get('game_date_utc'),
-            game.get('venue'),
-            game.get('city'),
-            game.get('country'),
-            game.get('status', 'scheduled'),
-            game.get('home_score'),
-            game.get('away_score'),
-            game.get('source_game_id'),
-            game.get('game_url')
-        )
-        result = self.execute(query, params)
-        return result is not None
+        return self.upsert_games([game])
+
+    def upsert_games(self, games: List[Dict]) -> bool:
+        """Insert or update many games with batched multi-row statements."""
+        rows = [self._game_params(game) for game in games]
+        return self._bulk_upsert('schedule', _GAME_COLUMNS, _GAME_UPDATE, rows) is not None
 
     def get_games_needing_stats(self, days_back: int = 7) -> List[Dict]:
         """Get completed games that need stats scraped."""
@@ -431,20 +1013,16 @@ class MySQLConnector:
                 updated_at = CURRENT_TIMESTAMP
             WHERE game_id = %s
         """
-        home_q = quarter_scores.get('home', [None]*4) if quarter_scores else [None]*4
-        away_q = quarter_scores.get('away', [None]*4) if quarter_scores else [None]*4
+        # Pad each side to exactly 4 quarters (missing quarters -> NULL)
+        quarter_scores = quarter_scores or {}
+        home_q = (list(quarter_scores.get('home') or []) + [None] * 4)[:4]
+        away_q = (list(quarter_scores.get('away') or []) + [None] * 4)[:4]
 
         params = (
             final_score.get('home'),
             final_score.get('away'),
-            home_q[0] if len(home_q) > 0 else None,
-            home_q[1] if len(home_q) > 1 else None,
-            home_q[2] if len(home_q) > 2 else None,
-            home_q[3] if len(home_q) > 3 else None,
-            away_q[0] if len(away_q) > 0 else None,
-            away_q[1] if len(away_q) > 1 else None,
-            away_q[2] if len(away_q) > 2 else None,
-            away_q[3] if len(away_q) > 3 else None,
+            *home_q,
+            *away_q,
             game_id
         )
         result = self.execute(query, params)
@@ -452,30 +1030,16 @@ class MySQLConnector:
 
     def mark_game_stats_scraped(self, game_id: str) -> bool:
         """Mark game as having stats scraped."""
-        query = """
-            UPDATE schedule SET
-                stats_scraped = TRUE,
-                stats_scraped_at = CURRENT_TIMESTAMP,
-                updated_at = CURRENT_TIMESTAMP
-            WHERE game_id = %s
-        """
-        result = self.execute(query, (game_id,))
+        result = self.execute(_MARK_STATS_SCRAPED_SQL, (game_id,))
         return result is not None
 
     def get_schedule_with_americans(self) -> List[Dict]:
         """Get full schedule with American player info."""
-        query = """
-            SELECT
-                s.*,
-                ht.team_name AS home_team_name,
-                at.team_name AS away_team_name
-            FROM schedule s
-            JOIN teams ht ON s.home_team_id = ht.team_id
-            JOIN teams at ON s.away_team_id = at.team_id
-            WHERE s.has_american_player = TRUE
-            ORDER BY s.game_date, s.game_time
-        """
-        return self.fetch_all(query)
+        return self.fetch_all(_SCHEDULE_WITH_AMERICANS_SQL)
+
+    def iter_schedule_with_americans(self) -> Iterator[Dict]:
+        """Stream the schedule with American player info, one game at a time."""
+        return self.iter_all(_SCHEDULE_WITH_AMERICANS_SQL)
 
     def get_upcoming_american_games(self, days_ahead: int = 14) -> List[Dict]:
         """Get upcoming games with American players."""
@@ -524,78 +1088,76 @@ class MySQLConnector:
     # GAME STATS OPERATIONS
     # ========================================
 
+    @staticmethod
+    def _stat_params(game_id: str, stat: Dict) -> tuple:
+        """Build the parameter tuple for one player's game stats (order of _STAT_COLUMNS)."""
+        return (game_id,) + _row_params(stat, _STAT_FIELDS)
+
     def insert_game_stat(self, game_id: str, stat: Dict) -> bool:
         """Insert player game statistics."""
-        query = """
-            INSERT INTO game_stats (
-                game_id, player_id, team_id,
-                is_home_team, is_starter, did_not_play, dnp_reason,
-                minutes_played, minutes_decimal,
-                points, rebounds_total, rebounds_offensive, rebounds_defensive,
-                assists, steals, blocks, blocks_against,
-                turnovers, fouls_personal, fouls_drawn,
-                fg_made, fg_attempted, fg_percentage,
-                two_pt_made, two_pt_attempted, two_pt_percentage,
-                three_pt_made, three_pt_attempted, three_pt_percentage,
-                ft_made, ft_attempted, ft_percentage,
-                plus_minus, efficiency_rating
-            ) VALUES (
-                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-            )
-            ON DUPLICATE KEY UPDATE
-                minutes_played = VALUES(minutes_played),
-                minutes_decimal = VALUES(minutes_decimal),
-                points = VALUES(points),
-                rebounds_total = VALUES(rebounds_total),
-                assists = VALUES(assists),
-                updated_at = CURRENT_TIMESTAMP
+        return self.insert_game_stats(game_id, [stat])
+
+    def insert_game_stats(self, game_id: str, stats: List[Dict]) -> bool:
+        """Insert or update every player's stats for a game in one statement."""
+        rows = [self._stat_params(game_id, stat) for stat in stats]
+        return self._bulk_upsert('game_stats', _STAT_COLUMNS, _STAT_UPDATE, rows) is not None
+
+    def finalize_game_stats(self, game_id: str, stats: List[Dict]) -> bool:
         """
-        params = (
-            game_id,
-            stat.get('player_id'),
-            stat.get('team_id'),
-            stat.get('is_home_team'),
-            stat.get('is_starter'),
-            stat.get('did_not_play', False),
-            stat.get('dnp_reason'),
-            stat.get('minutes_played'),
-            stat.get('minutes_decimal'),
-            stat.get('points', 0),
-            stat.get('rebounds_total', 0),
-            stat.get('rebounds_offensive', 0),
-            stat.get('rebounds_defensive', 0),
-            stat.get('assists', 0),
-            stat.get('steals', 0),
-            stat.get('blocks', 0),
-            stat.get('blocks_against', 0),
-            stat.get('turnovers', 0),
-            stat.get('fouls_personal', 0),
-            stat.get('fouls_drawn', 0),
-            stat.get('fg_made', 0),
-            stat.get('fg_attempted', 0),
-            stat.get('fg_percentage'),
-            stat.get('two_pt_made', 0),
-            stat.get('two_pt_attempted', 0),
-            stat.get('two_pt_percentage'),
-            stat.get('three_pt_made', 0),
-            stat.get('three_pt_attempted', 0),
-            stat.get('three_pt_percentage'),
-            stat.get('ft_made', 0),
-            stat.get('ft_attempted', 0),
-            stat.get('ft_percentage'),
-            stat.get('plus_minus'),
-            stat.get('efficiency_rating')
-        )
-        result = self.execute(query, params)
-        return result is not None
+        Save a game's player stats and mark the game as scraped.
+
+        The stats upsert and the schedule update run on one connection and
+        share one commit, so the game is only marked scraped if its stats
+        were saved too.
+
+        Returns:
+            True if everything was saved, False on error (nothing is saved)
+        """
+        rows = [self._stat_params(game_id, stat) for stat in stats]
+        try:
+            with self.bulk_cursor() as cursor:
+                for query, params in self._bulk_upsert_statements(
+                    'game_stats', _STAT_COLUMNS, _STAT_UPDATE, rows
+                ):
+                    cursor.execute(query, params)
+                cursor.execute(_MARK_STATS_SCRAPED_SQL, (game_id,))
+            return True
+        except Error as e:
+            logger.error(f"Error saving stats for game {game_id}: {e}")
+            return False
 
     # ========================================
     # CACHE OPERATIONS
     # ========================================
 
     def get_hometown_cache(self, normalized_name: str) -> Optional[Dict]:
-        """Get cached hometown lookup result."""
+        """
+        Get cached hometown lookup result.
+
+        Results, including misses, are kept in an in-memory LRU of
+        HOMETOWN_MEMO_SIZE names, so repeat lookups skip MySQL.
+        cache_hometown_lookup() drops the name's entry. A failed query
+        returns None like a miss, but isn't remembered.
+        """
+        with self._hometown_memo_lock:
+            if normalized_name in self._hometown_memo:
+                self._hometown_memo.move_to_end(normalized_name)
+                return self._hometown_memo[normalized_name]
+
+        try:
+            result = self._get_hometown_cache_db(normalized_name)
+        except Error as e:
+            logger.error(f"Hometown cache read error: {e}")
+            return None
+
+        with self._hometown_memo_lock:
+            self._hometown_memo[normalized_name] = result
+            if len(self._hometown_memo) > HOMETOWN_MEMO_SIZE:
+                self._hometown_memo.popitem(last=False)
+        return result
+
+    def _get_hometown_cache_db(self, normalized_name: str) -> Optional[Dict]:
+        """Read a hometown lookup result from the hometown_cache table. Raises Error."""
         query = """
             SELECT *
             FROM hometown_cache
@@ -604,10 +1166,20 @@ class MySQLConnector:
             ORDER BY lookup_date DESC
             LIMIT 1
         """
-        return self.fetch_one(query, (normalized_name,))
+        # uk_name_source keeps one row per source, so this sorts a few rows at most
+        with self._cursor(dictionary=True) as cursor:
+            cursor.execute(query, (normalized_name,))
+            return cursor.fetchone()
 
     def cache_hometown_lookup(self, normalized_name: str, source: str, result: Dict) -> bool:
-        """Cache a hometown lookup result."""
+        """
+        Cache a hometown lookup result, replacing the name's earlier result from the same source.
+
+        A failed lookup never replaces an earlier successful one - a
+        transient miss would otherwise wipe a known hometown.
+        """
+        # MySQL applies the assignments left to right, so lookup_successful
+        # (which the IF()s read) has to be updated last
         query = """
             INSERT INTO hometown_cache (
                 player_name_search, lookup_source, lookup_successful,
@@ -617,6 +1189,19 @@ class MySQLConnector:
             ) VALUES (
                 %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
             )
+            ON DUPLICATE KEY UPDATE
+                hometown_city = IF(VALUES(lookup_successful), VALUES(hometown_city), hometown_city),
+                hometown_state = IF(VALUES(lookup_successful), VALUES(hometown_state), hometown_state),
+                high_school = IF(VALUES(lookup_successful), VALUES(high_school), high_school),
+                high_school_city = IF(VALUES(lookup_successful), VALUES(high_school_city), high_school_city),
+                high_school_state = IF(VALUES(lookup_successful), VALUES(high_school_state), high_school_state),
+                college = IF(VALUES(lookup_successful), VALUES(college), college),
+                source_url = IF(VALUES(lookup_successful), VALUES(source_url), source_url),
+                profile_url = IF(VALUES(lookup_successful), VALUES(profile_url), profile_url),
+                photo_url = IF(VALUES(lookup_successful), VALUES(photo_url), photo_url),
+                lookup_date = IF(VALUES(lookup_successful) OR NOT lookup_successful,
+                                 CURRENT_TIMESTAMP, lookup_date),
+                lookup_successful = lookup_successful OR VALUES(lookup_successful)
         """
         params = (
             normalized_name,
@@ -632,29 +1217,25 @@ class MySQLConnector:
             result.get('profile_url'),
             result.get('photo_url')
         )
-        return self.execute(query, params) is not None
+        saved = self.execute(query, params) is not None
+        with self._hometown_memo_lock:
+            self._hometown_memo.pop(normalized_name, None)
+        return saved
 
     # ========================================
     # SCRAPE LOG OPERATIONS
     # ========================================
 
+    @_logs_db_errors("Error creating scrape log")
     def start_scrape_log(self, scrape_type: str) -> Optional[int]:
         """Start a scrape log entry."""
         query = """
             INSERT INTO scrape_log (scrape_type, status)
             VALUES (%s, 'running')
         """
-        self.ensure_connected()
-        try:
-            cursor = self.connection.cursor()
+        with self._cursor(commit=True) as cursor:
             cursor.execute(query, (scrape_type,))
-            self.connection.commit()
-            log_id = cursor.lastrowid
-            cursor.close()
-            return log_id
-        except Error as e:
-            logger.error(f"Error creating scrape log: {e}")
-            return None
+            return cursor.lastrowid
 
     def complete_scrape_log(self, log_id: int, items_processed: int,
                            items_success: int, items_failed: int,
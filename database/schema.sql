@@ -79,7 +79,7 @@ CREATE TABLE IF NOT EXISTS players (
 
     -- Birth Info
     birth_date DATE,
-    birth_year INT,
+    birth_year SMALLINT GENERATED ALWAYS AS (YEAR(birth_date)) STORED,
     birth_country VARCHAR(100),
     birth_city VARCHAR(100),
 
@@ -126,7 +126,10 @@ CREATE TABLE IF NOT EXISTS players (
     INDEX idx_high_school (high_school),
     INDEX idx_name_normalized (full_name_normalized),
     INDEX idx_needs_lookup (needs_hometown_lookup),
-    INDEX idx_team (team_id)
+    INDEX idx_team (team_id),
+    -- Composite indexes for the hometown lookup and by-state game queries
+    INDEX idx_players_hometown_lookup (is_american, is_active, needs_hometown_lookup, hometown_state),
+    INDEX idx_players_state (is_american, is_active, hometown_state, team_id)
 ) ENGINE=InnoDB;
 
 -- ============================================
@@ -199,7 +202,9 @@ CREATE TABLE IF NOT EXISTS schedule (
     INDEX idx_status (status),
     INDEX idx_american_games (has_american_player, game_date),
     INDEX idx_season (season, round_number),
-    INDEX idx_needs_stats (status, stats_scraped)
+    INDEX idx_needs_stats (status, stats_scraped),
+    -- Upcoming games with American players, in date/time order
+    INDEX idx_schedule_upcoming (has_american_player, status, game_date, game_time)
 ) ENGINE=InnoDB;
 
 -- ============================================
@@ -304,7 +309,8 @@ CREATE TABLE IF NOT EXISTS hometown_cache (
     -- Meta
     lookup_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
 
-    INDEX idx_player_lookup (player_name_search),
+    -- One row per name and source; also serves lookups by name alone
+    UNIQUE KEY uk_name_source (player_name_search, lookup_source),
     INDEX idx_source (lookup_source),
     INDEX idx_successful (lookup_successful)
 ) ENGINE=InnoDB;
@@ -35,7 +35,11 @@ WHAT IS WIKITEXT?
 
 IMPORTANT NOTES FOR MAINTAINERS:
     - Wikipedia requires a User-Agent header or it will block requests
-    - We add 0.3 second delays between requests to be respectful
+    - Players are looked up LOOKUP_WORKERS at a time, but all threads
+      share a WIKI_RATE requests/second limit to be respectful, and back
+      off when Wikipedia reports replication lag (WIKI_MAXLAG)
+    - API responses are cached in .cache/wiki_cache.sqlite for
+      WIKI_CACHE_DAYS, so re-runs mostly skip the network
     - Not all players have Wikipedia articles (newer/less famous players)
     - Success rate is typically 60-70% of players found
 
@@ -54,6 +58,13 @@ SCHEDULE:
 # json: For reading player data and saving results
 import json
 
+# orjson (optional): A much faster JSON library written in C/Rust
+# Used for reading and writing when installed; falls back to json if not.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # os: For file path operations
 import os
 
@@ -64,15 +75,56 @@ import re
 # requests: For making HTTP requests to Wikipedia API
 # If you get "ModuleNotFoundError", run: pip install requests
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# mwparserfromhell: Real wikitext parser for the infoboxes (optional)
+# parse_infobox() falls back to regexes without it. To install:
+#   pip install mwparserfromhell
+try:
+    import mwparserfromhell
+except ImportError:
+    mwparserfromhell = None
+
+# ijson: Streaming JSON parser (optional)
+# load_american_players() reads just the 'players' list with it, one player
+# at a time, instead of loading the whole export. To install:
+#   pip install ijson
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# rapidfuzz: Fuzzy matching of names against article titles (optional)
+# pick_best_title() falls back to a plain substring check without it.
+# To install: pip install rapidfuzz
+try:
+    from rapidfuzz import fuzz, utils as fuzz_utils
+except ImportError:
+    fuzz = None
 
 # datetime: For timestamps in output files
 from datetime import datetime
 
+# MappingProxyType: Read-only view so the state lookup can't be changed by accident
+from types import MappingProxyType
+
 # logging: For status messages
 import logging
 
-# time: For adding delays between API requests (be nice to Wikipedia!)
+# hashlib, sqlite3, threading, time, urlencode: For the on-disk cache of
+# Wikipedia API responses (see wiki_api_get)
+import hashlib
+import sqlite3
+import threading
 import time
+from urllib.parse import urlencode
+
+# ThreadPoolExecutor: For looking up several players at the same time
+from concurrent.futures import ThreadPoolExecutor
+
+# TokenBucket: Shared rate limiter so the threads don't flood Wikipedia
+from utils.rate_limit import TokenBucket
 
 # =============================================================================
 # LOGGING CONFIGURATION
@@ -94,6 +146,65 @@ WIKI_API = "https://en.wikipedia.org/w/api.php"
 # The format should identify your project and provide contact info.
 HEADERS = {'User-Agent': 'EuroLeagueTracker/1.0 (basketball data collection)'}
 
+# LOOKUP_WORKERS: How many players are looked up at the same time
+# Each lookup mostly waits on the network, so overlapping them saves time.
+LOOKUP_WORKERS = 10
+
+# WIKI_RATE: Max Wikipedia API requests per second, across all workers
+WIKI_RATE = 10
+
+# WIKI_MAXLAG: Sent as maxlag= on every API call (MediaWiki etiquette)
+# When Wikipedia's database replicas lag more than this many seconds, the
+# API answers with a 'maxlag' error and a Retry-After header instead of
+# doing the work; we wait and retry up to MAXLAG_RETRIES times.
+WIKI_MAXLAG = 5
+MAXLAG_RETRIES = 3
+
+# TITLE_MATCH_THRESHOLD: Min fuzzy score (0-100) for a search result title
+# to count as the player's article (only used with rapidfuzz installed)
+TITLE_MATCH_THRESHOLD = 80
+
+# WIKI_BATCH_SIZE: Max article titles per wikitext request
+# The MediaWiki API accepts up to 50 pipe-separated titles in one query.
+WIKI_BATCH_SIZE = 50
+
+# Shared by every Wikipedia API call (be nice to Wikipedia!)
+_wiki_bucket = TokenBucket(WIKI_RATE)
+
+# HTTP session shared by every Wikipedia API call
+# Reusing one session keeps the TLS connection to Wikipedia open between
+# requests, so only the first call pays for the handshake.
+_session = requests.Session()
+_session.headers.update({
+    **HEADERS,
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+})
+
+# WIKI_CACHE_PATH: SQLite file where raw Wikipedia API responses are kept
+# Re-runs within WIKI_CACHE_DAYS answer from this file instead of the
+# network. Delete the file to force fresh lookups.
+WIKI_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'wiki_cache.sqlite')
+WIKI_CACHE_DAYS = 30
+
+# Connection pool + automatic retries
+# - pool_maxsize=20: enough sockets for all LOOKUP_WORKERS threads
+# - Retry: transient errors (429, 5xx) are retried with backoff instead of
+#   counting the player as not found
+_session.mount('https://', HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=20,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+    ),
+))
+
+# The cache connection is opened on first use and shared by all threads
+_wiki_cache = None
+_wiki_cache_lock = threading.Lock()
+
 # =============================================================================
 # MANUAL OVERRIDES
 # =============================================================================
@@ -123,7 +234,7 @@ MANUAL_OVERRIDES = {
 # These sets let us check if a state name is valid.
 
 # Full state names
-US_STATES = {
+US_STATES = frozenset({
     'Alabama', 'Alaska', 'Arizona', 'Arkansas', 'California', 'Colorado',
     'Connecticut', 'Delaware', 'Florida', 'Georgia', 'Hawaii', 'Idaho',
     'Illinois', 'Indiana', 'Iowa', 'Kansas', 'Kentucky', 'Louisiana',
@@ -134,7 +245,7 @@ US_STATES = {
     'Pennsylvania', 'Rhode Island', 'South Carolina', 'South Dakota',
     'Tennessee', 'Texas', 'Utah', 'Vermont', 'Virginia', 'Washington',
     'West Virginia', 'Wisconsin', 'Wyoming', 'District of Columbia', 'D.C.'
-}
+})
 
 # Two-letter abbreviations mapped to full names
 # Used when Wikipedia uses "Chicago, IL" instead of "Chicago, Illinois"
@@ -154,6 +265,65 @@ STATE_ABBREVS = {
     'WI': 'Wisconsin', 'WY': 'Wyoming', 'DC': 'District of Columbia'
 }
 
+# Full names AND abbreviations mapped to the full name
+# "Texas" -> "Texas", "TX" -> "Texas" - one lookup validates and expands
+STATE_CANONICAL = MappingProxyType({
+    **{state: state for state in US_STATES},
+    **STATE_ABBREVS,
+})
+
+
+# =============================================================================
+# REGEX PATTERNS
+# =============================================================================
+# Compiled once here instead of on every call - parse_infobox() runs for
+# every article we download.
+
+# Name suffixes that might interfere with search (see clean_name)
+# \s+ matches one or more whitespace characters, $ means end of string
+_SUFFIX_RE = re.compile(r'\s+(Ii|Iii|Iv|Jr\.?|Sr\.?)$', re.IGNORECASE)
+
+# Infobox fields (see parse_infobox). Pattern explanation:
+# \|           - Match a literal pipe character (fields start with |)
+# \s*          - Match zero or more whitespace characters
+# (?P<key>...) - NAMED GROUP: one of the field names we want
+# \s*=\s*      - Match = sign with optional whitespace around it
+# (?P<val>.+?) - NAMED GROUP: match one or more characters (non-greedy)
+# (?=\n\||\n\}\})  - LOOK AHEAD: stop when we hit newline+pipe or newline+}}
+#
+# The (?=...) is a "look ahead" - it finds the boundary but doesn't include it
+# The (.+?) being non-greedy (?) means it takes the smallest match possible
+# All three fields are in one pattern so the article is scanned once.
+_INFOBOX_FIELDS_RE = re.compile(
+    r'\|\s*(?P<key>birth_place|college|high_school)\s*=\s*(?P<val>.+?)(?=\n\||\n\}\})',
+    re.DOTALL
+)
+
+# Wiki markup
+# [[Link|Display Text]] - group 1 is the link, group 2 the display text
+_LINK_PIPE_RE = re.compile(r'\[\[([^\]|]+)\|([^\]]+)\]\]')
+# [[Simple Link]]
+_LINK_PLAIN_RE = re.compile(r'\[\[([^\]]+)\]\]')
+# {{template|...}}
+_TEMPLATE_RE = re.compile(r'\{\{[^}]+\}\}')
+
+# Templates whose parameters spell out a place; with mwparserfromhell they
+# are kept as text, e.g. {{city-state|Chicago|Illinois}} -> "Chicago, Illinois"
+_PLACE_TEMPLATES = {'city-state', 'city–state', 'city state'}
+
+# List templates used for players with more than one school, e.g.
+# {{ubl|[[Eastern Arizona College|Eastern Arizona]]|[[Lamar Cardinals basketball|Lamar]]}}.
+# With mwparserfromhell they are replaced by their items, one per line, so
+# parse_infobox() still picks the first school's link
+_LIST_TEMPLATES = {
+    'ubl', 'ubil', 'unbulleted list', 'bulleted list', 'blist',
+    'plainlist', 'plain list', 'hlist', 'flatlist', 'flat list',
+}
+
+# Templates that only wrap their text, e.g. {{nowrap|Oak Hill Academy}};
+# kept as text the same way as _LIST_TEMPLATES
+_WRAPPER_TEMPLATES = {'nowrap', 'nobr', 'nowrap begin'}
+
 
 # =============================================================================
 # NAME CLEANING FUNCTION
@@ -192,10 +362,7 @@ def clean_name(name):
     name = name.title()
 
     # Remove common suffixes that might interfere with search
-    # \s+ matches one or more whitespace characters
-    # $ means end of string
-    # flags=re.IGNORECASE makes it case-insensitive
-    name = re.sub(r'\s+(Ii|Iii|Iv|Jr\.?|Sr\.?)$', '', name, flags=re.IGNORECASE)
+    name = _SUFFIX_RE.sub('', name)
 
     return name.strip()
 
@@ -204,6 +371,79 @@ def clean_name(name):
 # WIKIPEDIA API FUNCTIONS
 # =============================================================================
 
+def _open_wiki_cache():
+    """Open (and create if needed) the SQLite response cache. Call with _wiki_cache_lock held."""
+    global _wiki_cache
+    if _wiki_cache is None:
+        os.makedirs(os.path.dirname(WIKI_CACHE_PATH), exist_ok=True)
+        _wiki_cache = sqlite3.connect(WIKI_CACHE_PATH, check_same_thread=False)
+        # WAL + NORMAL sync: each insert is a cheap append instead of a full fsync
+        _wiki_cache.execute('PRAGMA journal_mode=WAL')
+        _wiki_cache.execute('PRAGMA synchronous=NORMAL')
+        _wiki_cache.execute(
+            'CREATE TABLE IF NOT EXISTS wiki_cache (key TEXT PRIMARY KEY, ts INTEGER, body BLOB)'
+        )
+    return _wiki_cache
+
+
+def wiki_api_get(params, timeout):
+    """
+    Call the Wikipedia API, answering from the on-disk cache when possible.
+
+    WHAT IT DOES:
+        Every Wikipedia request goes through here. Responses are stored in
+        WIKI_CACHE_PATH keyed by a hash of the query parameters, and reused
+        for WIKI_CACHE_DAYS. Only real network calls take a rate-limit token.
+
+        Network calls send maxlag=WIKI_MAXLAG. If Wikipedia is busy it answers
+        with a 'maxlag' error; we sleep for its Retry-After and try again
+        (up to MAXLAG_RETRIES times).
+
+    PARAMETERS:
+        params (dict): API query parameters
+        timeout (int): Request timeout in seconds
+
+    RETURNS:
+        dict: The decoded JSON response
+
+    NOTE:
+        Failed responses (HTTP errors or an API 'error' block) are not
+        cached, so they're retried on the next run.
+    """
+    key = hashlib.blake2b(urlencode(sorted(params.items())).encode('utf-8')).hexdigest()
+    fresh_after = int(time.time()) - WIKI_CACHE_DAYS * 86400
+
+    with _wiki_cache_lock:
+        row = _open_wiki_cache().execute(
+            'SELECT body FROM wiki_cache WHERE key = ? AND ts > ?', (key, fresh_after)
+        ).fetchone()
+    if row:
+        return json.loads(row[0])
+
+    for attempt in range(MAXLAG_RETRIES + 1):
+        _wiki_bucket.take()
+        resp = _session.get(WIKI_API, params={**params, 'maxlag': WIKI_MAXLAG}, timeout=timeout)
+        data = resp.json()
+
+        if data.get('error', {}).get('code') != 'maxlag' or attempt == MAXLAG_RETRIES:
+            break
+
+        wait = int(resp.headers.get('Retry-After', WIKI_MAXLAG))
+        logger.warning(f"Wikipedia is lagged, retrying in {wait}s")
+        time.sleep(wait)
+
+    if resp.ok and 'error' not in data:
+        with _wiki_cache_lock:
+            cache = _open_wiki_cache()
+            cache.execute(
+                'INSERT OR REPLACE INTO wiki_cache (key, ts, body) VALUES (?, ?, ?)',
+                (key, int(time.time()), resp.content)
+            )
+            cache.commit()
+
+    return data
+
+
 def search_wikipedia(name):
     """
     Search Wikipedia for a basketball player's article.
@@ -221,9 +461,8 @@ def search_wikipedia(name):
                      or None if no match found
 
     HOW IT CHOOSES THE BEST MATCH:
-        1. First, look for articles where the title contains the player's name
-        2. If no exact match, return the first search result
-        3. If no results at all, return None
+        See pick_best_title() - the result whose title best matches the
+        player's name, or None if no result matches well enough.
 
     EXAMPLE:
         >>> search_wikipedia("LeBron James")
@@ -242,25 +481,12 @@ def search_wikipedia(name):
 
     try:
         # Make the API request
-        # IMPORTANT: Must include headers with User-Agent!
-        resp = requests.get(WIKI_API, params=params, headers=HEADERS, timeout=10)
-        data = resp.json()
+        # IMPORTANT: Must include headers with User-Agent! (set on _session)
+        data = wiki_api_get(params, timeout=10)
 
         # Extract the search results
         results = data.get('query', {}).get('search', [])
-
-        # Try to find an exact name match first
-        # This helps avoid finding the wrong person with a similar name
-        name_lower = name.lower()
-        for result in results:
-            title = result.get('title', '')
-            # If the player's name appears in the article title, that's our match
-            if name_lower in title.lower():
-                return title
-
-        # No exact match - just return the first result if we have any
-        if results:
-            return results[0].get('title')
+        return pick_best_title(name, [r.get('title', '') for r in results])
 
     except Exception as e:
         # Log the error but don't crash - just return None
@@ -269,6 +495,99 @@ def search_wikipedia(name):
     return None
 
 
+def pick_best_title(name, titles):
+    """
+    Pick the article title that best matches a player's name.
+
+    PARAMETERS:
+        name (str): The cleaned player name (e.g., "LeBron James")
+        titles (list): Search result titles, best search rank first
+
+    RETURNS:
+        str or None: The best matching title, or None if none match well
+
+    HOW IT MATCHES:
+        With rapidfuzz installed, every title is scored with
+        token_set_ratio, which ignores word order, case, punctuation and
+        extra words like "(basketball, born 1991)" or "Jr.". The highest
+        score wins (ties go to the better search rank) if it reaches
+        TITLE_MATCH_THRESHOLD; otherwise there's no match.
+
+        Without rapidfuzz: the first title containing the name, else the
+        first title.
+    """
+    if fuzz is not None:
+        if not titles:
+            return None
+        # max() keeps the first of equal scores, i.e. the better search rank
+        scores = [fuzz.token_set_ratio(name, title, processor=fuzz_utils.default_process)
+                  for title in titles]
+        best = max(range(len(titles)), key=scores.__getitem__)
+        return titles[best] if scores[best] >= TITLE_MATCH_THRESHOLD else None
+
+    # Try to find an exact name match first
+    # This helps avoid finding the wrong person with a similar name
+    name_lower = name.lower()
+    for title in titles:
+        # If the player's name appears in the article title, that's our match
+        if name_lower in title.lower():
+            return title
+
+    # No exact match - just return the first result if we have any
+    return titles[0] if titles else None
+
+
+def search_wikipedia_with_wikitext(name):
+    """
+    Search for a player's article and get its wikitext in one request.
+
+    WHAT IT DOES:
+        Uses the search as a "generator" for the revisions query, so one
+        response has both the top search hits and their wikitext. This
+        saves the separate get_wiki_wikitext() request when looking up a
+        single player.
+
+    PARAMETERS:
+        name (str): The cleaned player name (e.g., "LeBron James")
+
+    RETURNS:
+        tuple: (title, wikitext), or (None, None) if nothing was found
+
+    NOTE:
+        The response includes the wikitext of every search hit (up to 5
+        articles). main() looks up many players at once, so it searches
+        first and downloads only the chosen articles in batches instead.
+    """
+    params = {
+        'action': 'query',
+        'generator': 'search',                     # Pages come from a search...
+        'gsrsearch': f'{name} basketball player',
+        'gsrlimit': 5,
+        'prop': 'revisions',                       # ...and we get their content
+        'rvprop': 'content',
+        'rvslots': 'main',
+        'format': 'json'
+    }
+
+    try:
+        data = wiki_api_get(params, timeout=15)
+
+        # Generated pages come back keyed by page id; 'index' is the search rank
+        pages = sorted(data.get('query', {}).get('pages', {}).values(),
+                       key=lambda page: page.get('index', 0))
+        title = pick_best_title(name, [page.get('title', '') for page in pages])
+
+        for page in pages:
+            revisions = page.get('revisions', [])
+            if page.get('title') == title and revisions:
+                return title, revisions[0].get('slots', {}).get('main', {}).get('*', '')
+
+    except Exception as e:
+        logger.debug(f"Wikipedia search error: {e}")
+
+    return None, None
+
+
 def get_wiki_wikitext(title):
     """
     Get the raw wikitext content of a Wikipedia article.
@@ -297,45 +616,168 @@ def get_wiki_wikitext(title):
         doesn't include the structured infobox data. The wikitext lets us
         parse out specific fields like birth_place and college.
     """
-    # Build the API request parameters
-    params = {
-        'action': 'query',       # We're querying Wikipedia
-        'titles': title,         # The specific article we want
-        'prop': 'revisions',     # We want revision content
-        'rvprop': 'content',     # Specifically, the content of the revision
-        'rvslots': 'main',       # Get the main content slot
-        'format': 'json'         # Return as JSON
-    }
+    return get_wiki_wikitext_batch([title]).get(title)
 
-    try:
-        # Make the API request
-        resp = requests.get(WIKI_API, params=params, headers=HEADERS, timeout=15)
-        data = resp.json()
 
-        # The response has a nested structure:
-        # { 'query': { 'pages': { '12345': { 'revisions': [...] } } } }
-        pages = data.get('query', {}).get('pages', {})
+def get_wiki_wikitext_batch(titles):
+    """
+    Get the raw wikitext of many Wikipedia articles, 50 per request.
 
-        # Loop through pages (there should only be one)
-        for page_id, page in pages.items():
-            # page_id of '-1' means the page doesn't exist
-            if page_id != '-1':
-                revisions = page.get('revisions', [])
-                if revisions:
-                    # Get the content from the first (and only) revision
-                    # The content is nested under 'slots' -> 'main' -> '*'
-                    return revisions[0].get('slots', {}).get('main', {}).get('*', '')
+    WHAT IT DOES:
+        Sends the titles to the API in groups of WIKI_BATCH_SIZE
+        (pipe-separated, e.g. 'LeBron James|Kevin Durant'), so 200 articles
+        take 4 requests instead of 200.
 
-    except Exception as e:
-        logger.debug(f"Wiki content error: {e}")
+    PARAMETERS:
+        titles (list): Exact article titles (e.g. from search_wikipedia())
 
-    return None
+    RETURNS:
+        dict: { requested title: wikitext } for every article that exists.
+              Missing articles (and failed requests) are left out.
+
+    TITLE CHANGES:
+        The API may answer under a different title than we asked for:
+        - 'normalized': fixes like 'lebron_james' -> 'Lebron james'
+        - 'redirects': old names like 'Lebron' -> 'LeBron James'
+        We follow both mappings so results are keyed by the title we sent.
+    """
+    texts = {}
+
+    for start in range(0, len(titles), WIKI_BATCH_SIZE):
+        chunk = titles[start:start + WIKI_BATCH_SIZE]
+
+        # Build the API request parameters
+        params = {
+            'action': 'query',          # We're querying Wikipedia
+            'titles': '|'.join(chunk),  # The articles we want
+            'prop': 'revisions',        # We want revision content
+            'rvprop': 'content',        # Specifically, the content of the revision
+            'rvslots': 'main',          # Get the main content slot
+            'redirects': 1,             # Follow redirects to the real article
+            'format': 'json'            # Return as JSON
+        }
+
+        renamed = {}   # requested/normalized title -> title the API used
+        by_title = {}  # final article title -> wikitext
+
+        try:
+            # Long articles can overflow one response; the API then returns
+            # a 'continue' block to send back for the rest of the pages
+            while True:
+                data = wiki_api_get(params, timeout=30)
+                query = data.get('query', {})
+
+                for change in query.get('normalized', []) + query.get('redirects', []):
+                    renamed[change['from']] = change['to']
+
+                # The response has a nested structure:
+                # { 'query': { 'pages': { '12345': { 'title': ..., 'revisions': [...] } } } }
+                # Pages that don't exist have a negative id and no revisions
+                for page in query.get('pages', {}).values():
+                    revisions = page.get('revisions', [])
+                    if revisions:
+                        # The content is nested under 'slots' -> 'main' -> '*'
+                        by_title[page.get('title')] = revisions[0].get('slots', {}).get('main', {}).get('*', '')
+
+                if 'continue' not in data:
+                    break
+                params.update(data['continue'])
+
+        except Exception as e:
+            logger.debug(f"Wiki content error: {e}")
+
+        for title in chunk:
+            # Normalization happens first, then the redirect
+            final = renamed.get(title, title)
+            final = renamed.get(final, final)
+            if final in by_title:
+                texts[title] = by_title[final]
+
+    return texts
 
 
 # =============================================================================
-# WIKITEXT PARSING FUNCTION
+# WIKITEXT PARSING FUNCTIONS
 # =============================================================================
 
+def get_infobox_fields(wikitext):
+    """
+    Get the raw wikitext of the infobox fields parse_infobox() needs.
+
+    WHAT IT DOES:
+        With mwparserfromhell installed, the article is parsed properly:
+        - only the Infobox template's own fields are read
+        - nested templates can't cut a field short
+        - place templates like {{city-state|Chicago|Illinois}} become
+          "Chicago, Illinois"; list templates like {{ubl|...}} and
+          wrappers like {{nowrap|...}} become their items, one per line;
+          other templates, <ref>s and comments are removed
+        Without it (or if there's no {{Infobox ...}}), each field is found
+        in a single pass with _INFOBOX_FIELDS_RE
+
+    PARAMETERS:
+        wikitext (str): The raw wikitext content of the article
+
+    RETURNS:
+        dict: { 'birth_place': ..., 'college': ..., 'high_school': ... }
+              with only the fields that were found. Wiki links are left in.
+    """
+    fields = {}
+
+    infobox = None
+    if mwparserfromhell is not None:
+        wikicode = mwparserfromhell.parse(wikitext)
+        infobox = next((t for t in wikicode.filter_templates()
+                        if t.name.strip().lower().startswith('infobox')), None)
+
+    if infobox is None:
+        # Keep the first value of each field, and stop once we have all three
+        for match in _INFOBOX_FIELDS_RE.finditer(wikitext):
+            fields.setdefault(match.group('key'), match.group('val').strip())
+            if len(fields) == 3:
+                break
+        return fields
+
+    for field in ('birth_place', 'college', 'high_school'):
+        if not infobox.has(field):
+            continue
+        value = infobox.get(field).value
+        _flatten_field(value)
+        fields[field] = str(value).strip()
+
+    return fields
+
+
+def _flatten_field(value):
+    """
+    Reduce a parsed infobox value (mwparserfromhell Wikicode) to linked text, in place.
+
+    Comments and tags are removed. Place, list and wrapper templates are
+    replaced by their positional parameters (cleaned the same way), and
+    every other template is removed.
+    """
+    for node in value.filter_comments(recursive=False) + value.filter_tags(recursive=False):
+        value.remove(node)
+
+    for template in value.filter_templates(recursive=False):
+        name = template.name.strip().lower()
+        if name in _PLACE_TEMPLATES:
+            parts = [str(p.value).strip() for p in template.params if not p.showkey]
+            value.replace(template, ', '.join(parts))
+        elif name in _LIST_TEMPLATES or name in _WRAPPER_TEMPLATES:
+            parts = []
+            for param in template.params:
+                if param.showkey:
+                    continue
+                _flatten_field(param.value)
+                text = str(param.value).strip()
+                if text:
+                    parts.append(text)
+            value.replace(template, '\n'.join(parts))
+        else:
+            value.remove(template)
+
+
 def parse_infobox(wikitext):
     """
     Parse a Wikipedia article's wikitext to extract player information.
@@ -370,7 +812,7 @@ def parse_infobox(wikitext):
         We need to handle all these formats!
 
     PARSING STRATEGY:
-        1. Use regex to find the field (e.g., "| birth_place = ...")
+        1. Find the field (e.g., "| birth_place = ...") - see get_infobox_fields()
         2. Extract everything until the next field or end of infobox
         3. Remove wiki link markup: [[text]] -> text
         4. Remove template markup: {{template}} -> (removed)
@@ -390,38 +832,28 @@ def parse_infobox(wikitext):
     if not wikitext:
         return result
 
+    # Raw text of each infobox field (see get_infobox_fields)
+    fields = get_infobox_fields(wikitext)
+
     # =========================================================================
     # Parse birth_place
     # =========================================================================
-    # Regex pattern explanation:
-    # \|           - Match a literal pipe character (fields start with |)
-    # \s*          - Match zero or more whitespace characters
-    # birth_place  - Match the literal text "birth_place"
-    # \s*=\s*      - Match = sign with optional whitespace around it
-    # (.+?)        - CAPTURE GROUP: match one or more characters (non-greedy)
-    # (?=\n\||\n\}\})  - LOOK AHEAD: stop when we hit newline+pipe or newline+}}
-    #
-    # The (?=...) is a "look ahead" - it finds the boundary but doesn't include it
-    # The (.+?) being non-greedy (?) means it takes the smallest match possible
-
-    birth_match = re.search(r'\|\s*birth_place\s*=\s*(.+?)(?=\n\||\n\}\})', wikitext, re.DOTALL)
-
-    if birth_match:
-        # Get the raw birth_place text
-        birth_text = birth_match.group(1).strip()
+    birth_text = fields.get('birth_place')
+
+    if birth_text:
 
         # Clean up wiki markup
         # Pattern 1: [[Link|Display Text]] -> Display Text
         # Example: [[United States|U.S.]] -> U.S.
-        birth_text = re.sub(r'\[\[([^\]|]+)\|[^\]]+\]\]', r'\1', birth_text)
+        birth_text = _LINK_PIPE_RE.sub(r'\1', birth_text)
 
         # Pattern 2: [[Simple Link]] -> Simple Link
         # Example: [[Chicago, Illinois]] -> Chicago, Illinois
-        birth_text = re.sub(r'\[\[([^\]]+)\]\]', r'\1', birth_text)
+        birth_text = _LINK_PLAIN_RE.sub(r'\1', birth_text)
 
         # Pattern 3: Remove templates like {{birth date|1990|5|15}}
         # We don't need these for location data
-        birth_text = re.sub(r'\{\{[^}]+\}\}', '', birth_text)
+        birth_text = _TEMPLATE_RE.sub('', birth_text)
 
         # Remove "U.S." and "USA" since we already know they're American
         birth_text = birth_text.replace('U.S.', '').replace('USA', '').strip().rstrip(',')
@@ -435,61 +867,56 @@ def parse_infobox(wikitext):
             state = parts[1]
 
             # Validate the state - make sure it's a real US state
-            if state in US_STATES:
+            # (abbreviations come back as the full name)
+            canonical = STATE_CANONICAL.get(state)
+            if canonical:
                 result['hometown_city'] = city
-                result['hometown_state'] = state
-            elif state in STATE_ABBREVS:
-                # Convert abbreviation to full name
-                result['hometown_city'] = city
-                result['hometown_state'] = STATE_ABBREVS[state]
+                result['hometown_state'] = canonical
 
     # =========================================================================
     # Parse college
     # =========================================================================
-    # Same pattern as birth_place but looking for "college" field
-    college_match = re.search(r'\|\s*college\s*=\s*(.+?)(?=\n\||\n\}\})', wikitext, re.DOTALL)
+    college_text = fields.get('college')
 
-    if college_match:
-        college_text = college_match.group(1).strip()
+    if college_text:
 
         # College links often look like:
         # [[Duke Blue Devils men's basketball|Duke]]
         # We want "Duke" not "Duke Blue Devils men's basketball"
 
         # First try to extract from [[Full Name|Short Name]] format
-        college_link = re.search(r'\[\[([^\]|]+)\|([^\]]+)\]\]', college_text)
+        college_link = _LINK_PIPE_RE.search(college_text)
         if college_link:
             result['college'] = college_link.group(2).strip()
         else:
             # Try simple [[College Name]] format
-            college_link = re.search(r'\[\[([^\]]+)\]\]', college_text)
+            college_link = _LINK_PLAIN_RE.search(college_text)
             if college_link:
                 result['college'] = college_link.group(1).strip()
             else:
                 # No wiki links - just clean up templates and use the text
-                college_text = re.sub(r'\{\{[^}]+\}\}', '', college_text).strip()
+                college_text = _TEMPLATE_RE.sub('', college_text).strip()
                 if college_text and len(college_text) > 2:
                     result['college'] = college_text
 
     # =========================================================================
     # Parse high_school
     # =========================================================================
-    # Same pattern as college
-    hs_match = re.search(r'\|\s*high_school\s*=\s*(.+?)(?=\n\||\n\}\})', wikitext, re.DOTALL)
+    # Same cleanup as college
+    hs_text = fields.get('high_school')
 
-    if hs_match:
-        hs_text = hs_match.group(1).strip()
+    if hs_text:
 
         # Extract from wiki links
-        hs_link = re.search(r'\[\[([^\]|]+)\|([^\]]+)\]\]', hs_text)
+        hs_link = _LINK_PIPE_RE.search(hs_text)
         if hs_link:
             result['high_school'] = hs_link.group(2).strip()
         else:
-            hs_link = re.search(r'\[\[([^\]]+)\]\]', hs_text)
+            hs_link = _LINK_PLAIN_RE.search(hs_text)
             if hs_link:
                 result['high_school'] = hs_link.group(1).strip()
             else:
-                hs_text = re.sub(r'\{\{[^}]+\}\}', '', hs_text).strip()
+                hs_text = _TEMPLATE_RE.sub('', hs_text).strip()
                 if hs_text and len(hs_text) > 2:
                     result['high_school'] = hs_text
 
@@ -508,26 +935,27 @@ def parse_infobox(wikitext):
 # MAIN LOOKUP FUNCTION
 # =============================================================================
 
-def lookup_player(name):
+def lookup_player(clean):
     """
     Look up a player's hometown and college information.
 
     WHAT IT DOES:
         This is the main function that combines all the steps:
-        1. Clean the player's name
-        2. Search Wikipedia for their article
-        3. Download the article's wikitext
-        4. Parse the infobox for hometown/college
-        5. Return the results
+        1. Search Wikipedia for their article and get its wikitext
+           (one request - see search_wikipedia_with_wikitext())
+        2. Parse the infobox for hometown/college
+        3. Return the results
 
     PARAMETERS:
-        name (str): The player's name (can be "Last, First" format)
+        clean (str): The player's name already run through clean_name()
+                     ("First Last"). Callers clean it once and reuse it,
+                     like the 'clean_name' field from new_player_result().
 
     RETURNS:
         dict or None: The lookup results, or None if player not found
 
     EXAMPLE:
-        >>> lookup_player("James, LeBron")
+        >>> lookup_player(clean_name("James, LeBron"))
         {
             'hometown_city': 'Akron',
             'hometown_state': 'Ohio',
@@ -537,22 +965,13 @@ def lookup_player(name):
             'lookup_successful': True
         }
     """
-    # Step 1: Clean the name for searching
-    clean = clean_name(name)
-
-    # Step 2: Search Wikipedia
-    title = search_wikipedia(clean)
-    if not title:
-        # No Wikipedia article found
-        return None
-
-    # Step 3: Get the wikitext
-    wikitext = get_wiki_wikitext(title)
+    # Step 1: Search Wikipedia and get the article's wikitext
+    title, wikitext = search_wikipedia_with_wikitext(clean)
     if not wikitext:
-        # Couldn't get the article content
+        # No Wikipedia article found (or couldn't get its content)
         return None
 
-    # Step 4: Parse the infobox
+    # Step 2: Parse the infobox
     result = parse_infobox(wikitext)
 
     # Add the Wikipedia title to the result (useful for debugging)
@@ -589,33 +1008,39 @@ def load_american_players():
     output_dir = os.path.join(os.path.dirname(__file__), 'output', 'json')
 
     # File prefixes that contain source player data
-    valid_prefixes = ['american_players_full_', 'american_players_2026']
-
-    # Find matching files
-    files = []
-    for f in os.listdir(output_dir):
-        for prefix in valid_prefixes:
-            # Check if file matches our criteria
-            if (f.startswith(prefix) and
-                'hometown' not in f and
-                'wiki' not in f and
-                'performance' not in f and
-                'stats' not in f):
-                files.append(f)
-                break  # Don't add same file twice
-
-    if not files:
+    valid_prefixes = ('american_players_full_', 'american_players_2026')
+
+    # Find the most recent matching file
+    # Timestamps in the names sort chronologically, so the highest name is
+    # the newest - max() finds it in one pass without sorting the list
+    latest = max(
+        (f for f in os.listdir(output_dir)
+         # Check if file matches our criteria
+         if (f.startswith(valid_prefixes) and
+             'hometown' not in f and
+             'wiki' not in f and
+             'performance' not in f and
+             'stats' not in f)),
+        default=None
+    )
+
+    if latest is None:
         return []
 
-    # Sort to get most recent (timestamps sort chronologically)
-    files = sorted(files)
-
     # Load the most recent file
-    filepath = os.path.join(output_dir, files[-1])
+    filepath = os.path.join(output_dir, latest)
     logger.info(f"Loading from: {filepath}")
 
-    with open(filepath, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    with open(filepath, 'rb') as f:
+        if ijson is not None:
+            # Stream just the 'players' array - the rest of the export is
+            # never built in memory
+            # use_float=True: numbers come back as float, same as json.loads
+            return list(ijson.items(f, 'players.item', use_float=True))
+
+        # Read as bytes - both orjson and json parse UTF-8 bytes directly
+        raw = f.read()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
     return data.get('players', [])
 
@@ -635,12 +1060,71 @@ def save_json(data, filename):
     os.makedirs(output_dir, exist_ok=True)
     filepath = os.path.join(output_dir, filename)
 
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, default=str, ensure_ascii=False)
+    if orjson is not None:
+        # Fast path: orjson writes UTF-8 bytes directly
+        # OPT_PASSTHROUGH_DATETIME sends datetimes to default=str, so the
+        # output matches the json.dump path below
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(
+                data,
+                default=str,
+                option=(orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                        | orjson.OPT_PASSTHROUGH_DATETIME),
+            ))
+    else:
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, default=str, ensure_ascii=False)
 
     logger.info(f"Saved: {filepath}")
 
 
+# =============================================================================
+# PER-PLAYER RECORDS
+# =============================================================================
+
+def new_player_result(player):
+    """
+    Start a player's result record from their exported player data.
+
+    PARAMETERS:
+        player (dict): Player from load_american_players()
+
+    RETURNS:
+        dict: The player's basic info plus 'clean_name' for searching
+    """
+    return {
+        'code': player.get('code'),
+        'name': player.get('name', ''),
+        'clean_name': clean_name(player.get('name', '')),
+        'team_code': player.get('team_code'),
+        'team_name': player.get('team_name', 'Unknown'),
+        'nationality': player.get('nationality'),
+        'birth_date': player.get('birth_date'),
+    }
+
+
+def apply_override(player_result):
+    """
+    Fill in a player's hometown from MANUAL_OVERRIDES, if they have one.
+
+    Overrides handle name collisions with more famous players.
+
+    RETURNS:
+        bool: True if an override was applied (no Wikipedia lookup needed)
+    """
+    override = MANUAL_OVERRIDES.get(player_result['name'].upper())
+    if not override:
+        return False
+
+    player_result['hometown_city'] = override.get('hometown_city')
+    player_result['hometown_state'] = override.get('hometown_state')
+    player_result['college'] = override.get('college')
+    player_result['high_school'] = override.get('high_school')
+    player_result['lookup_successful'] = True
+    player_result['source'] = 'manual_override'
+    return True
+
+
 # =============================================================================
 # MAIN FUNCTION
 # =============================================================================
@@ -652,7 +1136,8 @@ def main():
     WHAT IT DOES:
         1. Load American players from JSON
         2. Deduplicate the list (some players appear twice)
-        3. For each player, look up their hometown on Wikipedia
+        3. Look up every player's hometown on Wikipedia (searches run
+           several at a time, articles are downloaded 50 per request)
         4. Save all results to JSON
         5. Save successful lookups to a separate JSON file
         6. Print a summary of what was found
@@ -689,59 +1174,44 @@ def main():
     # =========================================================================
     # Step 3: Look Up Each Player
     # =========================================================================
-    results = []
-    success = 0
-    failed = 0
-
-    for i, player in enumerate(unique):
-        name = player.get('name', '')
-        team = player.get('team_name', 'Unknown')
-        clean = clean_name(name)
-
-        # Show progress
-        logger.info(f"[{i+1}/{len(unique)}] {clean} ({team})")
-
-        # Build the result record (includes original player data)
-        player_result = {
-            'code': player.get('code'),
-            'name': name,
-            'clean_name': clean,
-            'team_code': player.get('team_code'),
-            'team_name': team,
-            'nationality': player.get('nationality'),
-            'birth_date': player.get('birth_date'),
-        }
-
-        # Check for manual override first (handles name collisions with famous players)
-        if name.upper() in MANUAL_OVERRIDES:
-            override = MANUAL_OVERRIDES[name.upper()]
-            player_result['hometown_city'] = override.get('hometown_city')
-            player_result['hometown_state'] = override.get('hometown_state')
-            player_result['college'] = override.get('college')
-            player_result['high_school'] = override.get('high_school')
-            player_result['lookup_successful'] = True
-            player_result['source'] = 'manual_override'
-            success += 1
-            logger.info(f"  OVERRIDE: {override.get('hometown_city')}, {override.get('hometown_state')} | College: {override.get('college')}")
+    # Three passes instead of two requests per player:
+    #   a. Search for every player's article title (LOOKUP_WORKERS at a time)
+    #   b. Download all the articles, WIKI_BATCH_SIZE titles per request
+    #   c. Parse each player's infobox locally
+    total = len(unique)
+    results = [new_player_result(p) for p in unique]
+    to_look_up = [r for r in results if not apply_override(r)]
+
+    # Pass a: article titles, in the same order as to_look_up
+    logger.info(f"Searching Wikipedia for {len(to_look_up)} players...")
+    with ThreadPoolExecutor(max_workers=LOOKUP_WORKERS) as executor:
+        titles = list(executor.map(search_wikipedia, [r['clean_name'] for r in to_look_up]))
+
+    # Pass b: wikitext for every distinct title found
+    found_titles = sorted({title for title in titles if title})
+    logger.info(f"Downloading {len(found_titles)} articles...")
+    wikitexts = get_wiki_wikitext_batch(found_titles)
+
+    # Pass c: parse and merge into the player records
+    for player_result, title in zip(to_look_up, titles):
+        info = parse_infobox(wikitexts.get(title)) if title else None
+        if info and info['lookup_successful']:
+            info['wiki_title'] = title
+            player_result.update(info)
         else:
-            # Look up on Wikipedia
-            info = lookup_player(name)
-
-            if info and info.get('lookup_successful'):
-                # Merge the lookup results into our record
-                player_result.update(info)
-                success += 1
-                logger.info(f"  FOUND: {info.get('hometown_city')}, {info.get('hometown_state')} | College: {info.get('college')}")
-            else:
-                player_result['lookup_successful'] = False
-                failed += 1
-                logger.info(f"  Not found")
-
-            # IMPORTANT: Rate limiting!
-            # Be respectful to Wikipedia's servers - wait between requests
-            time.sleep(0.3)
+            player_result['lookup_successful'] = False
+
+    for i, p in enumerate(results, start=1):
+        progress = f"[{i}/{total}] {p['clean_name']} ({p['team_name']})"
+        if p.get('source') == 'manual_override':
+            logger.info(f"{progress} OVERRIDE: {p.get('hometown_city')}, {p.get('hometown_state')} | College: {p.get('college')}")
+        elif p['lookup_successful']:
+            logger.info(f"{progress} FOUND: {p.get('hometown_city')}, {p.get('hometown_state')} | College: {p.get('college')}")
+        else:
+            logger.info(f"{progress} Not found")
 
-        results.append(player_result)
+    success = sum(1 for p in results if p.get('lookup_successful'))
+    failed = total - success
 
     # =========================================================================
     # Step 4: Save Results
@@ -28,6 +28,10 @@ WHAT THE OUTPUT LOOKS LIKE:
 OUTPUT FILES:
     - unified_american_players_TIMESTAMP.json: Full data with all games
     - american_players_summary_TIMESTAMP.json: Summary without game logs
+    (with COMPRESS_OUTPUT=true both are written gzip-compressed as .json.gz)
+    - american_player_games_TIMESTAMP.jsonl: Only with WRITE_GAMES_JSONL=true -
+      one line per player with their full game log, for readers that want
+      to stream the games instead of loading the whole unified file
 
 USE CASES:
     - Website display: Show player profiles with stats and hometown
@@ -43,9 +47,19 @@ SCHEDULE:
 # =============================================================================
 # IMPORTS
 # =============================================================================
+# gzip: For optionally compressing the dashboard's output files
+import gzip
+
 # json: For reading input files and writing output
 import json
 
+# orjson (optional): A much faster JSON library written in C/Rust
+# Used for reading and writing when installed; falls back to json if not.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # os: For file path operations
 import os
 
@@ -55,8 +69,15 @@ from datetime import datetime
 # logging: For status messages
 import logging
 
-# glob: For finding files matching a pattern (e.g., "clubs_*.json")
-from glob import glob
+# fnmatch: For matching file names against a pattern (e.g., "clubs_*.json")
+from fnmatch import fnmatch
+
+# ThreadPoolExecutor: For loading the input files at the same time
+from concurrent.futures import ThreadPoolExecutor
+
+# defaultdict, heapq: For grouping players by state and picking the top states
+from collections import defaultdict
+import heapq
 
 # =============================================================================
 # LOGGING CONFIGURATION
@@ -67,22 +88,56 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# =============================================================================
+# OUTPUT SETTINGS
+# =============================================================================
+# Set COMPRESS_OUTPUT=true to write the unified/summary files as .json.gz.
+# JSON shrinks several times over, so the dashboard reads far fewer bytes
+# from disk (dashboard.py reads .json and .json.gz files the same way).
+COMPRESS_OUTPUT = os.environ.get('COMPRESS_OUTPUT', 'false').lower() == 'true'
+
+# Fast gzip level - nearly the same size as level 9 at a fraction of the time
+GZIP_LEVEL = 3
+
+# Set WRITE_GAMES_JSONL=true to also write every player's game log as a
+# JSON Lines sidecar file (see save_jsonl)
+WRITE_GAMES_JSONL = os.environ.get('WRITE_GAMES_JSONL', 'false').lower() == 'true'
+
 
 # =============================================================================
 # FILE LOADING FUNCTIONS
 # =============================================================================
 
-def load_latest_json(pattern):
+def list_output_files():
+    """
+    List the file names in output/json/ (one directory scan).
+
+    RETURNS:
+        list: File names (not full paths), or an empty list if the
+              directory doesn't exist yet
+    """
+    output_dir = os.path.join(os.path.dirname(__file__), 'output', 'json')
+    try:
+        with os.scandir(output_dir) as it:
+            return [entry.name for entry in it]
+    except FileNotFoundError:
+        return []
+
+
+def load_latest_json(pattern, entries=None):
     """
     Load the most recent JSON file matching a pattern.
 
     WHAT IT DOES:
-        Finds all files in output/json/ matching the pattern, sorts them
-        (which puts them in chronological order since filenames have timestamps),
-        and loads the most recent one.
+        Finds all files in output/json/ matching the pattern and loads the
+        one whose name sorts last (the most recent, since filenames have
+        timestamps).
 
     PARAMETERS:
         pattern (str): A glob pattern like 'clubs_*.json' or 'american_players_2*.json'
+        entries (list): File names from list_output_files(). main() scans
+                        the directory once and passes the same list to every
+                        call; if omitted, the directory is scanned here.
 
     RETURNS:
         dict or None: The parsed JSON data, or None if no files found
@@ -94,41 +149,112 @@ def load_latest_json(pattern):
 
     WHY WE NEED THIS:
         Each scrape creates new files with timestamps. We always want to use
-        the most recent data, so we sort files and take the last one.
+        the most recent data, so we take the highest filename. File
+        modification times aren't used - a fresh git checkout gives every
+        file the same mtime.
     """
     # Build the path to the output directory
     output_dir = os.path.join(os.path.dirname(__file__), 'output', 'json')
 
-    # Find all files matching the pattern
-    # glob() returns a list of full file paths
-    files = sorted(glob(os.path.join(output_dir, pattern)))
+    if entries is None:
+        entries = list_output_files()
 
-    if not files:
+    # Find the most recent file name matching the pattern
+    # max() is one pass - no need to sort the whole list to take the last one
+    latest = max((name for name in entries if fnmatch(name, pattern)), default=None)
+
+    if latest is None:
         return None
 
-    # Load and return the most recent file (last in sorted list)
-    with open(files[-1], 'r', encoding='utf-8') as f:
-        return json.load(f)
+    # Load and return the most recent file
+    # Read as bytes - both orjson and json parse UTF-8 bytes directly
+    with open(os.path.join(output_dir, latest), 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
 
 
-def save_json(data, filename):
+def save_json(data, filename, compress=False):
     """
     Save data to a JSON file in the output directory.
 
     PARAMETERS:
         data (dict): The data to save
         filename (str): The filename (e.g., 'unified_american_players_20240115.json')
+        compress (bool): Write gzip-compressed JSON to filename + '.gz' instead
 
     This is the same save function used across all scripts for consistency.
     """
     output_dir = os.path.join(os.path.dirname(__file__), 'output', 'json')
     filepath = os.path.join(output_dir, filename)
 
-    with open(filepath, 'w', encoding='utf-8') as f:
+    if orjson is not None:
+        # Fast path: orjson builds the UTF-8 bytes directly
+        # OPT_PASSTHROUGH_DATETIME sends datetimes to default=str, so the
+        # output matches the json.dumps path below
+        content = orjson.dumps(
+            data,
+            default=str,
+            option=(orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                    | orjson.OPT_PASSTHROUGH_DATETIME),
+        )
+    else:
         # indent=2: Pretty-print with 2-space indentation
         # default=str: Convert non-JSON types (like datetime) to strings
         # ensure_ascii=False: Keep non-ASCII characters (European names)
-        json.dump(data, f, indent=2, default=str, ensure_ascii=False)
+        content = json.dumps(data, indent=2, default=str, ensure_ascii=False).encode('utf-8')
+
+    if compress:
+        filepath += '.gz'
+        f = gzip.open(filepath, 'wb', compresslevel=GZIP_LEVEL)
+    else:
+        f = open(filepath, 'wb')
+
+    with f:
+        f.write(content)
+
+    logger.info(f"Saved: {filepath}")
+
+
+def _dumps_line(obj):
+    """Serialize one value to a single line of compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            default=str,
+            option=(orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+                    | orjson.OPT_APPEND_NEWLINE),
+        )
+    return (json.dumps(obj, default=str, ensure_ascii=False, separators=(',', ':'))
+            + '\n').encode('utf-8')
+
+
+def save_jsonl(rows, filename, compress=False):
+    """
+    Save rows to a JSON Lines file (one JSON object per line).
+
+    WHAT IT DOES:
+        Writes each row as its own line, serializing one row at a time,
+        so neither this script nor the reader has to hold the whole file
+        as one giant string. Readers can go line by line:
+            for line in f: row = json.loads(line)
+
+    PARAMETERS:
+        rows (iterable): The rows (dicts) to save
+        filename (str): The filename (e.g., 'american_player_games_20240115.jsonl')
+        compress (bool): Write gzip-compressed output to filename + '.gz' instead
+    """
+    output_dir = os.path.join(os.path.dirname(__file__), 'output', 'json')
+    filepath = os.path.join(output_dir, filename)
+
+    if compress:
+        filepath += '.gz'
+        f = gzip.open(filepath, 'wb', compresslevel=GZIP_LEVEL)
+    else:
+        f = open(filepath, 'wb')
+
+    with f:
+        for row in rows:
+            f.write(_dumps_line(row))
 
     logger.info(f"Saved: {filepath}")
 
@@ -197,25 +323,38 @@ def main():
     # =========================================================================
     logger.info("Loading data sources...")
 
-    # Load player data - the core list of American players
-    # Pattern explanation: '2*' matches files starting with '2' (year 2024, 2025, etc.)
-    players_data = load_latest_json('american_players_2*.json')
+    patterns = [
+        # Player data - the core list of American players
+        # Pattern explanation: '2*' matches files starting with '2' (year 2024, 2025, etc.)
+        'american_players_2*.json',
+
+        # Hometown data from Wikipedia lookups
+        # The '_found_' version only has successful lookups
+        'american_hometowns_found_*.json',
 
-    # Load hometown data from Wikipedia lookups
-    # The '_found_' version only has successful lookups
-    hometowns_data = load_latest_json('american_hometowns_found_*.json')
+        # Season statistics (aggregated from all games)
+        'american_player_stats_*.json',
 
-    # Load season statistics (aggregated from all games)
-    stats_data = load_latest_json('american_player_stats_*.json')
+        # Individual game performances
+        'american_performances_*.json',
 
-    # Load individual game performances
-    performances_data = load_latest_json('american_performances_*.json')
+        # Schedule for total games count
+        'schedule_*.json',
 
-    # Load schedule for total games count
-    schedule_data = load_latest_json('schedule_*.json')
+        # Clubs for team information
+        'clubs_*.json',
+    ]
 
-    # Load clubs for team information
-    clubs_data = load_latest_json('clubs_*.json')
+    # Scan output/json/ once and match every pattern against the same list
+    entries = list_output_files()
+
+    # Load all files at the same time - reading one doesn't wait on the others
+    # executor.map() returns the results in the same order as the patterns
+    with ThreadPoolExecutor(max_workers=len(patterns)) as executor:
+        (players_data, hometowns_data, stats_data,
+         performances_data, schedule_data, clubs_data) = executor.map(
+            lambda pattern: load_latest_json(pattern, entries), patterns
+        )
 
     # Check that we have the essential player data
     if not players_data:
@@ -271,30 +410,36 @@ def main():
     # Performances Lookup
     # ---------------------------------------------------------------------
     # Structure: { 'PJTU': [game1, game2, game3, ...] }
-    # Each player has a list of their game performances
+    # Each player has a list of their game performances, most recent first.
+    # Sorting all performances once up front puts every player's list in
+    # order as it's built, instead of sorting each player's games later.
     perf_lookup = {}
     if performances_data:
-        for p in performances_data.get('performances', []):
+        performances = sorted(
+            performances_data.get('performances', []),
+            key=lambda p: p.get('date') or '',
+            reverse=True
+        )
+        for p in performances:
             code = p.get('player_code')
             if code:
-                # Initialize the list if this is the first game for this player
-                if code not in perf_lookup:
-                    perf_lookup[code] = []
-
-                # Determine opponent and home/away status
+                # Determine opponent and home/away status once per game
                 # If player's team is the local team, opponent is the road team
-                is_home = p.get('team') == p.get('local_team')
-                opponent = p.get('road_team') if is_home else p.get('local_team')
-                team_score = p.get('local_score') if is_home else p.get('road_score')
-                opp_score = p.get('road_score') if is_home else p.get('local_score')
-
-                # Determine if their team won
-                # Win if: home and local_score > road_score, or away and road_score > local_score
-                won = ((is_home and p.get('local_score', 0) > p.get('road_score', 0)) or
-                       (not is_home and p.get('road_score', 0) > p.get('local_score', 0)))
+                local_team = p.get('local_team')
+                is_home = p.get('team') == local_team
+                local_score = p.get('local_score')
+                road_score = p.get('road_score')
+                if is_home:
+                    opponent, team_score, opp_score = p.get('road_team'), local_score, road_score
+                else:
+                    opponent, team_score, opp_score = local_team, road_score, local_score
+
+                # Their team won if it outscored the opponent (missing scores count as 0)
+                won = (team_score or 0) > (opp_score or 0)
 
                 # Build the game record
-                perf_lookup[code].append({
+                # setdefault() starts the list on this player's first game
+                perf_lookup.setdefault(code, []).append({
                     'date': p.get('date'),
                     'opponent': opponent,
                     'home_away': 'home' if is_home else 'away',
@@ -328,10 +473,7 @@ def main():
         # Get data from lookup tables (empty dict if not found)
         hometown = hometown_lookup.get(code, {})
         stats = stats_lookup.get(code, {})
-        games = perf_lookup.get(code, [])
-
-        # Sort games by date (most recent first)
-        games = sorted(games, key=lambda x: x.get('date', ''), reverse=True)
+        games = perf_lookup.get(code, [])  # Already most recent first
 
         # Clean up the player's name
         # API format: "James, LeBron" -> "LeBron James"
@@ -443,7 +585,16 @@ def main():
         'clubs': clubs_data.get('clubs', []) if clubs_data else [],
         'players': unified_players,
     }
-    save_json(full_export, f'unified_american_players_{timestamp}.json')
+    save_json(full_export, f'unified_american_players_{timestamp}.json', compress=COMPRESS_OUTPUT)
+
+    # Optional sidecar: one line per player with just their game log
+    if WRITE_GAMES_JSONL:
+        save_jsonl(
+            ({'code': p['code'], 'name': p['name'], 'all_games': p['all_games']}
+             for p in unified_players),
+            f'american_player_games_{timestamp}.jsonl',
+            compress=COMPRESS_OUTPUT,
+        )
 
     # =========================================================================
     # Step 5: Save Summary Version (without full game logs)
@@ -463,7 +614,7 @@ def main():
         'total_players': len(summary_players),
         'players': summary_players,
     }
-    save_json(summary_export, f'american_players_summary_{timestamp}.json')
+    save_json(summary_export, f'american_players_summary_{timestamp}.json', compress=COMPRESS_OUTPUT)
 
     # =========================================================================
     # Step 6: Print Statistics
@@ -483,17 +634,16 @@ def main():
     logger.info("=" * 60)
 
     # Build a dictionary: { 'California': ['Player 1', 'Player 2'], ... }
-    by_state = {}
+    by_state = defaultdict(list)
     for p in unified_players:
         state = p.get('hometown_state')
         if state:
-            if state not in by_state:
-                by_state[state] = []
             by_state[state].append(p['name'])
 
-    # Sort states by number of players (most first) and show top 10
-    for state in sorted(by_state.keys(), key=lambda s: len(by_state[s]), reverse=True)[:10]:
-        logger.info(f"  {state}: {len(by_state[state])} players")
+    # Show the top 10 states by number of players (most first)
+    # nlargest() keeps only 10 as it goes instead of sorting every state
+    for state, names in heapq.nlargest(10, by_state.items(), key=lambda kv: len(kv[1])):
+        logger.info(f"  {state}: {len(names)} players")
 
 
 # =============================================================================
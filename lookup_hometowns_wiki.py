@@ -7,13 +7,35 @@ Uses the Wikipedia API to look up hometown data for American players.
 Faster and more reliable than web scraping.
 """
 
+import argparse
+import hashlib
 import json
 import os
 import re
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import sqlite3
+import threading
+import time
 from datetime import datetime
 import logging
-import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote, urlencode
+
+from utils.rate_limit import TokenBucket
+
+# orjson (optional): much faster JSON writing; falls back to json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ijson (optional): stream just the 'players' list out of the export
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 # Set up logging
 logging.basicConfig(
@@ -24,9 +46,42 @@ logger = logging.getLogger(__name__)
 
 # Wikipedia API
 WIKI_API = "https://en.wikipedia.org/w/api.php"
+WIKI_SUMMARY_API = "https://en.wikipedia.org/api/rest_v1/page/summary/"
+
+# Players looked up at the same time; all threads share WIKI_RATE requests/second
+LOOKUP_WORKERS = 10
+WIKI_RATE = 10
+_wiki_bucket = TokenBucket(WIKI_RATE)
+
+# One keep-alive session for every API call (Wikimedia asks for a real
+# User-Agent), pooled for the LOOKUP_WORKERS threads, retrying 429/5xx
+_session = requests.Session()
+_session.headers['User-Agent'] = 'EuroLeagueTracker/1.0 (basketball data collection)'
+_session.mount('https://', HTTPAdapter(
+    pool_connections=LOOKUP_WORKERS,
+    pool_maxsize=LOOKUP_WORKERS,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]),
+))
+
+# Titles per extracts request (TextExtracts returns at most 20 intros per query)
+EXTRACT_BATCH_SIZE = 20
+
+# Results are appended to this file (one JSON object per line) as each round
+# of ROUND_SIZE players finishes, so an interrupted run picks up where it
+# left off. It's deleted once the final exports are written.
+PROGRESS_FILE = 'american_players_wiki_progress.ndjson'
+ROUND_SIZE = 100
+
+# On-disk cache of API responses, reused for CACHE_TTL seconds.
+# Run with --refresh to ignore cached responses (they are still rewritten).
+CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'wiki_hometowns_cache.sqlite')
+CACHE_TTL = 86400
+REFRESH_CACHE = False
+_cache = None
+_cache_lock = threading.Lock()
 
 # US States for validation
-US_STATES = {
+US_STATES = frozenset({
     'Alabama', 'Alaska', 'Arizona', 'Arkansas', 'California', 'Colorado',
     'Connecticut', 'Delaware', 'Florida', 'Georgia', 'Hawaii', 'Idaho',
     'Illinois', 'Indiana', 'Iowa', 'Kansas', 'Kentucky', 'Louisiana',
@@ -37,8 +92,64 @@ US_STATES = {
     'Pennsylvania', 'Rhode Island', 'South Carolina', 'South Dakota',
     'Tennessee', 'Texas', 'Utah', 'Vermont', 'Virginia', 'Washington',
     'West Virginia', 'Wisconsin', 'Wyoming', 'District of Columbia'
+})
+
+# Abbreviations some intros use ("Chicago, IL"), mapped to the full name
+_STATE_ABBR = {
+    'AL': 'Alabama', 'AK': 'Alaska', 'AZ': 'Arizona', 'AR': 'Arkansas',
+    'CA': 'California', 'CO': 'Colorado', 'CT': 'Connecticut', 'DE': 'Delaware',
+    'FL': 'Florida', 'GA': 'Georgia', 'HI': 'Hawaii', 'ID': 'Idaho',
+    'IL': 'Illinois', 'IN': 'Indiana', 'IA': 'Iowa', 'KS': 'Kansas',
+    'KY': 'Kentucky', 'LA': 'Louisiana', 'ME': 'Maine', 'MD': 'Maryland',
+    'MA': 'Massachusetts', 'MI': 'Michigan', 'MN': 'Minnesota', 'MS': 'Mississippi',
+    'MO': 'Missouri', 'MT': 'Montana', 'NE': 'Nebraska', 'NV': 'Nevada',
+    'NH': 'New Hampshire', 'NJ': 'New Jersey', 'NM': 'New Mexico', 'NY': 'New York',
+    'NC': 'North Carolina', 'ND': 'North Dakota', 'OH': 'Ohio', 'OK': 'Oklahoma',
+    'OR': 'Oregon', 'PA': 'Pennsylvania', 'RI': 'Rhode Island', 'SC': 'South Carolina',
+    'SD': 'South Dakota', 'TN': 'Tennessee', 'TX': 'Texas', 'UT': 'Utah',
+    'VT': 'Vermont', 'VA': 'Virginia', 'WA': 'Washington', 'WV': 'West Virginia',
+    'WI': 'Wisconsin', 'WY': 'Wyoming', 'DC': 'District of Columbia'
 }
 
+# Regexes, compiled once at import instead of on every call
+_SUFFIX_RX = re.compile(r'\s+(Ii|Iii|Iv|Jr\.?|Sr\.?)$', re.IGNORECASE)
+
+# Each category is one pattern with an outer named group per phrasing. It is
+# only tried where one of the phrasings' keywords appears (see _first_match),
+# and the phrasings keep their old priority order: e.g. 'born in' wins over
+# 'from' wherever it appears.
+
+# The state is a 2-letter uppercase abbreviation (case-sensitive, so a word
+# like "in" isn't read as Indiana) or one or two words
+_PLACE = r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?),\s*((?-i:[A-Z]{2})\b|[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)'
+_SCHOOL = r'([A-Z][a-zA-Z\s]+(?:University|College|State))'
+_HIGH_SCHOOL = r'([A-Z][a-zA-Z\s]+High School)'
+
+# Birthplace (case-insensitive)
+_BIRTH_ORDER = ('born', 'from', 'grew')
+_BIRTH_KEYWORDS = ('born', 'from', 'grew up in')  # what each phrasing starts with
+_BIRTH_RX = re.compile(
+    r'(?P<born>born\s+(?:\w+\s+\d+,?\s+\d{4}(?:,?\s+)?)?(?:in\s+)?' + _PLACE + ')'
+    r'|(?P<from>from\s+' + _PLACE + ')'
+    r'|(?P<grew>grew up in\s+' + _PLACE + ')',
+    re.IGNORECASE
+)
+
+# College and high school (case-sensitive: names must be capitalized)
+_COLLEGE_ORDER = ('played', 'attended', 'went')
+_COLLEGE_KEYWORDS = ('played', 'attended', 'went to')
+_COLLEGE_RX = re.compile(
+    r'(?P<played>played\s+(?:college\s+)?basketball\s+(?:at|for)\s+(?:the\s+)?' + _SCHOOL + ')'
+    r'|(?P<attended>attended\s+(?:the\s+)?' + _SCHOOL + ')'
+    r'|(?P<went>went to\s+(?:the\s+)?' + _SCHOOL + ')'
+)
+_HS_ORDER = ('attended', 'played')
+_HS_KEYWORDS = ('attended', 'played')
+_HS_RX = re.compile(
+    r'(?P<attended>attended\s+' + _HIGH_SCHOOL + ')'
+    r'|(?P<played>played\s+(?:at|for)\s+' + _HIGH_SCHOOL + ')'
+)
+
 
 def load_american_players():
     """Load the most recent American players JSON file."""
@@ -49,7 +160,10 @@ def load_american_players():
     latest_file = sorted(files)[-1]
     filepath = os.path.join(output_dir, latest_file)
 
-    with open(filepath, 'r', encoding='utf-8') as f:
+    with open(filepath, 'rb') as f:
+        if ijson is not None:
+            # One player at a time - the rest of the file is never loaded
+            return list(ijson.items(f, 'players.item', use_float=True))
         data = json.load(f)
     return data.get('players', [])
 
@@ -59,22 +173,100 @@ def save_json(data, filename):
     output_dir = os.path.join(os.path.dirname(__file__), 'output', 'json')
     os.makedirs(output_dir, exist_ok=True)
     filepath = os.path.join(output_dir, filename)
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, default=str, ensure_ascii=False)
+    if orjson is not None:
+        # OPT_PASSTHROUGH_DATETIME sends datetimes to default=str, matching json
+        content = orjson.dumps(
+            data,
+            default=str,
+            option=(orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                    | orjson.OPT_PASSTHROUGH_DATETIME),
+        )
+    else:
+        content = json.dumps(data, indent=2, default=str, ensure_ascii=False).encode('utf-8')
+    with open(filepath, 'wb') as f:
+        f.write(content)
     logger.info(f"Saved: {filepath}")
     return filepath
 
 
+def _dumps_line(obj):
+    """One JSON object as a line of UTF-8 bytes (for the progress file)."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, default=str, ensure_ascii=False) + '\n').encode('utf-8')
+
+
+def load_progress(filepath):
+    """Load results saved by an interrupted run: {code: player_result}."""
+    done = {}
+    if not os.path.exists(filepath):
+        return done
+    with open(filepath, 'rb') as f:
+        for line in f:
+            try:
+                row = json.loads(line)
+            except ValueError:
+                continue  # Half-written last line from a crash
+            done[row['code']] = row
+    return done
+
+
+def _open_cache():
+    """Open (and create if needed) the response cache. Call with _cache_lock held."""
+    global _cache
+    if _cache is None:
+        os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+        _cache = sqlite3.connect(CACHE_PATH, check_same_thread=False)
+        _cache.execute('PRAGMA journal_mode=WAL')
+        _cache.execute(
+            'CREATE TABLE IF NOT EXISTS wiki_cache (key TEXT PRIMARY KEY, ts INTEGER, body BLOB)'
+        )
+    return _cache
+
+
+def wiki_get(params, timeout):
+    """
+    GET the Wikipedia API and return the decoded JSON, using the on-disk cache.
+
+    Responses are keyed by a hash of the query parameters (which include the
+    player name or titles). HTTP errors raise, and error responses aren't cached.
+    """
+    key = hashlib.blake2b(urlencode(sorted(params.items())).encode('utf-8')).hexdigest()
+
+    if not REFRESH_CACHE:
+        with _cache_lock:
+            row = _open_cache().execute(
+                'SELECT body FROM wiki_cache WHERE key = ? AND ts > ?',
+                (key, int(time.time()) - CACHE_TTL)
+            ).fetchone()
+        if row:
+            return json.loads(row[0])
+
+    _wiki_bucket.take()
+    resp = _session.get(WIKI_API, params=params, timeout=timeout)
+    resp.raise_for_status()
+    data = resp.json()
+
+    if 'error' not in data:
+        with _cache_lock:
+            cache = _open_cache()
+            cache.execute(
+                'INSERT OR REPLACE INTO wiki_cache (key, ts, body) VALUES (?, ?, ?)',
+                (key, int(time.time()), resp.content)
+            )
+            cache.commit()
+
+    return data
+
+
 def clean_player_name(name):
     """Clean up player name for searching."""
-    if ', ' in name:
-        parts = name.split(', ', 1)
-        name = f"{parts[1]} {parts[0]}"
-    # Title case and clean suffixes
-    name = name.title()
-    # Remove Roman numerals at end
-    name = re.sub(r'\s+(Ii|Iii|Iv|Jr\.?|Sr\.?)$', '', name, flags=re.IGNORECASE)
-    return name.strip()
+    # "Last, First" -> "First Last" (partition: no list to build)
+    last, sep, first = name.partition(', ')
+    if sep:
+        name = first + ' ' + last
+    # Title case, then remove Roman numerals/suffixes at the end
+    return _SUFFIX_RX.sub('', name.title()).strip()
 
 
 def search_wikipedia(name):
@@ -88,11 +280,12 @@ def search_wikipedia(name):
     }
 
     try:
-        resp = requests.get(WIKI_API, params=params, timeout=10)
-        resp.raise_for_status()
-        data = resp.json()
+        data = wiki_get(params, timeout=10)
 
-        results = data.get('query', {}).get('search', [])
+        try:
+            results = data['query']['search']
+        except KeyError:
+            results = []
         if results:
             # Return the title of best match
             return results[0].get('title')
@@ -114,11 +307,12 @@ def get_wikipedia_page(title):
     }
 
     try:
-        resp = requests.get(WIKI_API, params=params, timeout=10)
-        resp.raise_for_status()
-        data = resp.json()
+        data = wiki_get(params, timeout=10)
 
-        pages = data.get('query', {}).get('pages', {})
+        try:
+            pages = data['query']['pages']
+        except KeyError:
+            pages = {}
         for page_id, page in pages.items():
             if page_id != '-1':
                 return page.get('extract', '')
@@ -128,6 +322,145 @@ def get_wikipedia_page(title):
     return None
 
 
+def _get_pages_chunk(chunk):
+    """Fetch the intros for one chunk of titles; returns {requested title: extract}."""
+    params = {
+        'action': 'query',
+        'titles': '|'.join(chunk),
+        'prop': 'extracts',
+        'exintro': True,
+        'explaintext': True,
+        'exlimit': 'max',
+        'redirects': 1,
+        'format': 'json'
+    }
+
+    renamed = {}
+    by_title = {}
+
+    try:
+        # The API sends a 'continue' block if not every extract fit
+        while True:
+            data = wiki_get(params, timeout=30)
+            try:
+                query = data['query']
+            except KeyError:
+                query = {}
+
+            for change in query.get('normalized', []) + query.get('redirects', []):
+                renamed[change['from']] = change['to']
+
+            for page in query.get('pages', {}).values():
+                if 'extract' in page:
+                    by_title[page.get('title')] = page['extract']
+
+            if 'continue' not in data:
+                break
+            params.update(data['continue'])
+    except Exception as e:
+        logger.debug(f"Batch page fetch error: {e}")
+
+    extracts = {}
+    for title in chunk:
+        # Normalization happens first, then the redirect
+        final = renamed.get(title, title)
+        final = renamed.get(final, final)
+        if final in by_title:
+            extracts[title] = by_title[final]
+    return extracts
+
+
+def get_wikipedia_pages_batch(titles):
+    """
+    Get the intro text of many Wikipedia pages, EXTRACT_BATCH_SIZE per request.
+
+    Returns {requested title: extract} for every page that exists. The API's
+    'normalized' and 'redirects' mappings are followed so results are keyed
+    by the title we asked for. Chunks are fetched LOOKUP_WORKERS at a time.
+    """
+    chunks = [titles[i:i + EXTRACT_BATCH_SIZE] for i in range(0, len(titles), EXTRACT_BATCH_SIZE)]
+
+    extracts = {}
+    with ThreadPoolExecutor(max_workers=LOOKUP_WORKERS) as executor:
+        for chunk_extracts in executor.map(_get_pages_chunk, chunks):
+            extracts.update(chunk_extracts)
+    return extracts
+
+
+def build_info(title, content):
+    """Parse a page's intro; returns the info dict, or None if nothing useful."""
+    info = parse_hometown_from_text(content)
+
+    # Check if we found useful data
+    if info.get('hometown_state') or info.get('college'):
+        info['wiki_title'] = title
+        info['lookup_successful'] = True
+        return info
+
+    return None
+
+
+def _keyword_positions(haystack, keywords):
+    """Every index where one of the keywords starts, in order."""
+    positions = []
+    for kw in keywords:
+        i = haystack.find(kw)
+        while i >= 0:
+            positions.append(i)
+            i = haystack.find(kw, i + 1)
+    return sorted(positions)
+
+
+def _first_match(rx, order, text, keywords, haystack, accept=None):
+    """
+    Find the winning match of a combined pattern.
+
+    Keeps the first match of each phrasing, then returns the first one in
+    `order` that passes `accept` (like trying each phrasing separately).
+
+    Every phrasing starts with one of `keywords`, so instead of running the
+    regex over the whole intro we find the keywords with str.find (in
+    `haystack`: the text itself, or its lowercase copy for case-insensitive
+    patterns) and only try rx.match() where one starts.
+    """
+    first = {}
+    for pos in _keyword_positions(haystack, keywords):
+        m = rx.match(text, pos)
+        if m:
+            first.setdefault(m.lastgroup, m)
+            if len(first) == len(order):
+                break
+
+    for kind in order:
+        m = first.get(kind)
+        if m and (accept is None or accept(m)):
+            return m
+    return None
+
+
+def fetch_summary(name):
+    """
+    Get a page's summary straight from its title, skipping the search.
+
+    Returns (title, extract) only if the page exists, isn't a disambiguation
+    page and is described as a basketball player; otherwise None.
+    """
+    try:
+        _wiki_bucket.take()
+        resp = _session.get(WIKI_SUMMARY_API + quote(name.replace(' ', '_'), safe=''),
+                            timeout=10)
+        if resp.status_code != 200:
+            return None
+        data = resp.json()
+    except Exception as e:
+        logger.debug(f"Summary error for {name}: {e}")
+        return None
+
+    if data.get('type') != 'standard' or 'basketball' not in (data.get('description') or '').lower():
+        return None
+    return data.get('title'), data.get('extract')
+
+
 def parse_hometown_from_text(text):
     """Extract hometown info from Wikipedia text."""
     result = {
@@ -140,47 +473,42 @@ def parse_hometown_from_text(text):
     if not text:
         return result
 
-    # Patterns for birthplace
-    birth_patterns = [
-        r'born\s+(?:\w+\s+\d+,?\s+\d{4}(?:,?\s+)?)?(?:in\s+)?([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?),\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)',
-        r'from\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?),\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)',
-        r'grew up in\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?),\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)',
-    ]
-
-    for pattern in birth_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            city = match.group(1).strip()
-            state = match.group(2).strip()
-            if state in US_STATES:
-                result['hometown_city'] = city
-                result['hometown_state'] = state
-                break
+    # Intros sometimes use non-breaking spaces (e.g. in dates); make them
+    # plain spaces so captured names come out clean
+    text = text.replace('\xa0', ' ')
+
+    # Lowercase copy to find the case-insensitive birthplace keywords in.
+    # A few characters change length when lowercased, which would shift the
+    # positions; then just try every position.
+    text_lower = text.lower()
+    if len(text_lower) != len(text):
+        text_lower = None
+
+    # Look for birthplace (the state has to be a real US state)
+    # Each phrasing has 3 groups: the whole phrase, city, state
+    def state_of(m):
+        state = m.group(m.lastindex + 2).strip()
+        return _STATE_ABBR.get(state, state)
+
+    if text_lower is None:
+        match = _first_match(_BIRTH_RX, _BIRTH_ORDER, text, [''], text,
+                             accept=lambda m: state_of(m) in US_STATES)
+    else:
+        match = _first_match(_BIRTH_RX, _BIRTH_ORDER, text, _BIRTH_KEYWORDS, text_lower,
+                             accept=lambda m: state_of(m) in US_STATES)
+    if match:
+        result['hometown_city'] = match.group(match.lastindex + 1).strip()
+        result['hometown_state'] = state_of(match)
 
     # Look for college
-    college_patterns = [
-        r'played\s+(?:college\s+)?basketball\s+(?:at|for)\s+(?:the\s+)?([A-Z][a-zA-Z\s]+(?:University|College|State))',
-        r'attended\s+(?:the\s+)?([A-Z][a-zA-Z\s]+(?:University|College|State))',
-        r'went to\s+(?:the\s+)?([A-Z][a-zA-Z\s]+(?:University|College|State))',
-    ]
-
-    for pattern in college_patterns:
-        match = re.search(pattern, text)
-        if match:
-            result['college'] = match.group(1).strip()
-            break
+    match = _first_match(_COLLEGE_RX, _COLLEGE_ORDER, text, _COLLEGE_KEYWORDS, text)
+    if match:
+        result['college'] = match.group(match.lastindex + 1).strip()
 
     # Look for high school
-    hs_patterns = [
-        r'attended\s+([A-Z][a-zA-Z\s]+High School)',
-        r'played\s+(?:at|for)\s+([A-Z][a-zA-Z\s]+High School)',
-    ]
-
-    for pattern in hs_patterns:
-        match = re.search(pattern, text)
-        if match:
-            result['high_school'] = match.group(1).strip()
-            break
+    match = _first_match(_HS_RX, _HS_ORDER, text, _HS_KEYWORDS, text)
+    if match:
+        result['high_school'] = match.group(match.lastindex + 1).strip()
 
     return result
 
@@ -189,6 +517,14 @@ def lookup_player_hometown(name):
     """Look up a single player's hometown."""
     clean_name = clean_player_name(name)
 
+    # Most players' pages are titled with their name: try that first (one
+    # request), and only search if it isn't their page or has nothing useful
+    summary = fetch_summary(clean_name)
+    if summary and summary[1]:
+        info = build_info(*summary)
+        if info:
+            return info
+
     # Search Wikipedia
     title = search_wikipedia(clean_name)
     if not title:
@@ -200,18 +536,13 @@ def lookup_player_hometown(name):
         return None
 
     # Parse hometown info
-    info = parse_hometown_from_text(content)
+    return build_info(title, content)
 
-    # Check if we found useful data
-    if info.get('hometown_state') or info.get('college'):
-        info['wiki_title'] = title
-        info['lookup_successful'] = True
-        return info
-
-    return None
 
+def main(refresh=False):
+    global REFRESH_CACHE
+    REFRESH_CACHE = refresh
 
-def main():
     logger.info("=" * 60)
     logger.info("HOMETOWN LOOKUP USING WIKIPEDIA API")
     logger.info("=" * 60)
@@ -224,53 +555,83 @@ def main():
         logger.error("No players found")
         return
 
-    # Deduplicate
-    seen_codes = set()
-    unique_players = []
+    # Deduplicate by code, keeping each player's first record (in order)
+    by_code = {}
     for player in players:
-        code = player.get('code')
-        if code and code not in seen_codes:
-            seen_codes.add(code)
-            unique_players.append(player)
+        if player.get('code'):
+            by_code.setdefault(player['code'], player)
+    unique_players = list(by_code.values())
 
     logger.info(f"Processing {len(unique_players)} unique players")
 
-    results = []
-    success_count = 0
-    failed_count = 0
-
-    for i, player in enumerate(unique_players):
-        player_name = player.get('name', '')
-        team = player.get('team_name', 'Unknown')
-        clean_name = clean_player_name(player_name)
-
-        logger.info(f"[{i+1}/{len(unique_players)}] {clean_name} ({team})")
-
-        info = lookup_player_hometown(player_name)
-
-        player_result = {
-            'code': player.get('code'),
-            'name': player_name,
-            'clean_name': clean_name,
-            'team_code': player.get('team_code'),
-            'team_name': team,
-            'nationality': player.get('nationality'),
-            'birth_date': player.get('birth_date'),
-            'height': player.get('height'),
-            'position': player.get('position'),
-        }
-
-        if info and info.get('lookup_successful'):
-            player_result.update(info)
-            success_count += 1
-            logger.info(f"  FOUND: {info.get('hometown_city')}, {info.get('hometown_state')} | College: {info.get('college')}")
-        else:
-            player_result['lookup_successful'] = False
-            failed_count += 1
-            logger.info(f"  Not found on Wikipedia")
-
-        results.append(player_result)
-        time.sleep(0.3)  # Rate limiting
+    # Pick up results from an interrupted run (unless refreshing)
+    output_dir = os.path.join(os.path.dirname(__file__), 'output', 'json')
+    os.makedirs(output_dir, exist_ok=True)
+    progress_path = os.path.join(output_dir, PROGRESS_FILE)
+    if refresh and os.path.exists(progress_path):
+        os.remove(progress_path)
+    done = load_progress(progress_path)
+    if done:
+        logger.info(f"Resuming: {len(done)} players already looked up")
+
+    todo = [p for p in unique_players if p['code'] not in done]
+    total = len(unique_players)
+    n = total - len(todo)
+
+    with open(progress_path, 'ab') as progress:
+        for start in range(0, len(todo), ROUND_SIZE):
+            round_players = todo[start:start + ROUND_SIZE]
+
+            # Clean every name once; used for searching and logging
+            clean_names = [clean_player_name(p.get('name', '')) for p in round_players]
+
+            # Pass 1: search for every player's page title, LOOKUP_WORKERS at a time
+            logger.info(f"Searching Wikipedia for {len(round_players)} players...")
+            with ThreadPoolExecutor(max_workers=LOOKUP_WORKERS) as executor:
+                titles = list(executor.map(search_wikipedia, clean_names))
+
+            # Pass 2: fetch the intros of all the pages found, in batches
+            found_titles = sorted({t for t in titles if t})
+            logger.info(f"Fetching {len(found_titles)} pages...")
+            extracts = get_wikipedia_pages_batch(found_titles)
+
+            infos = [build_info(t, extracts[t]) if extracts.get(t) else None for t in titles]
+
+            for player, clean_name, info in zip(round_players, clean_names, infos):
+                player_name = player.get('name', '')
+                team = player.get('team_name', 'Unknown')
+
+                n += 1
+                logger.info(f"[{n}/{total}] {clean_name} ({team})")
+
+                player_result = {
+                    'code': player.get('code'),
+                    'name': player_name,
+                    'clean_name': clean_name,
+                    'team_code': player.get('team_code'),
+                    'team_name': team,
+                    'nationality': player.get('nationality'),
+                    'birth_date': player.get('birth_date'),
+                    'height': player.get('height'),
+                    'position': player.get('position'),
+                }
+
+                if info and info.get('lookup_successful'):
+                    player_result.update(info)
+                    logger.info(f"  FOUND: {info.get('hometown_city')}, {info.get('hometown_state')} | College: {info.get('college')}")
+                else:
+                    player_result['lookup_successful'] = False
+                    logger.info(f"  Not found on Wikipedia")
+
+                done[player_result['code']] = player_result
+                progress.write(_dumps_line(player_result))
+
+            # Make sure the finished round is on disk before starting the next
+            progress.flush()
+
+    results = [done[p['code']] for p in unique_players]
+    success_count = sum(1 for p in results if p.get('lookup_successful'))
+    failed_count = len(results) - success_count
 
     # Save all results
     export_data = {
@@ -295,6 +656,9 @@ def main():
     }
     save_json(success_export, f'american_players_hometowns_{timestamp}.json')
 
+    # Everything is in the exports now; the next run starts fresh
+    os.remove(progress_path)
+
     # Summary
     logger.info("\n" + "=" * 60)
     logger.info("SUMMARY")
@@ -311,4 +675,8 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    parser = argparse.ArgumentParser(description='Wikipedia hometown lookup')
+    parser.add_argument('--refresh', action='store_true',
+                        help='Ignore cached Wikipedia responses and fetch fresh ones')
+    args = parser.parse_args()
+    main(refresh=args.refresh)
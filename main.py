@@ -85,6 +85,9 @@ import argparse
 # logging for tracking what the program is doing
 import logging
 
+# ThreadPoolExecutor for running independent database queries at the same time
+from concurrent.futures import ThreadPoolExecutor
+
 # datetime for timestamps on exports and date calculations
 from datetime import datetime, date, timedelta
 
@@ -263,6 +266,9 @@ class EuroLeaguePipeline:
         # Test the connection
         if self.db.connect():
             logger.info("Database connection successful")
+            # Bring older databases up to date with schema.sql
+            self.db.ensure_indexes()
+            self.db.ensure_generated_columns()
         else:
             logger.warning("Could not connect to database - some features may not work")
             logger.warning("Make sure MySQL is running and credentials are correct in .env")
@@ -390,6 +396,9 @@ class EuroLeaguePipeline:
         success_count = 0
         error_count = 0
 
+        # Valid teams are collected here and saved together below
+        valid_teams = []
+
         # Process each team
         for team in teams:
             try:
@@ -401,19 +410,21 @@ class EuroLeaguePipeline:
                     error_count += 1
                     continue
 
-                # Save to database
-                # upsert_team will INSERT if team doesn't exist, UPDATE if it does
-                if self.db.upsert_team(team):
-                    logger.debug(f"Saved team: {team['team_name']}")
-                    success_count += 1
-                else:
-                    logger.warning(f"Failed to save team: {team['team_name']}")
-                    error_count += 1
+                valid_teams.append(team)
 
             except Exception as e:
                 logger.error(f"Error processing team {team.get('team_name', 'Unknown')}: {e}")
                 error_count += 1
 
+        # Save to database in one batched statement instead of one per team
+        # upsert_teams will INSERT teams that don't exist, UPDATE those that do
+        if valid_teams:
+            if self.db.upsert_teams(valid_teams):
+                success_count += len(valid_teams)
+            else:
+                logger.warning(f"Failed to save {len(valid_teams)} teams")
+                error_count += len(valid_teams)
+
         logger.info(f"Teams sync complete: {success_count} saved, {error_count} errors")
 
     def sync_rosters(self):
@@ -455,50 +466,72 @@ class EuroLeaguePipeline:
         total_players = 0
         american_players = 0
 
-        # Process each team
-        for team in teams:
-            team_name = team['team_name']
-            team_id = team['team_id']
-            team_slug = team.get('team_slug', '')
+        # Roster writes go to a single background writer thread, so saving one
+        # team's roster overlaps with scraping the next one. One worker keeps
+        # the writes in order, one batch at a time.
+        pending_writes = []
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix='db-writes') as writer:
+            # Process each team
+            for team in teams:
+                team_name = team['team_name']
+                team_id = team['team_id']
+                team_slug = team.get('team_slug', '')
 
-            logger.info(f"Processing roster for: {team_name}")
+                logger.info(f"Processing roster for: {team_name}")
 
-            try:
-                # Scrape the roster
-                # We pass team_slug for URL building and team_id for player assignment
-                players = self.scraper.scrape_roster(team_slug, team_id)
+                try:
+                    # Scrape the roster
+                    # We pass team_slug for URL building and team_id for player assignment
+                    players = self.scraper.scrape_roster(team_slug, team_id)
 
-                logger.info(f"  Found {len(players)} players")
+                    logger.info(f"  Found {len(players)} players")
 
-                # Process each player
-                for player in players:
-                    # Ensure team assignment
-                    player['team_id'] = team_id
-                    player['league_id'] = 'EUROLEAGUE'
+                    # Valid players are saved together once the roster is processed
+                    valid_players = []
 
-                    # Check if American and needs hometown lookup
-                    if player.get('is_american'):
-                        american_players += 1
+                    # Process each player
+                    for player in players:
+                        # Ensure team assignment
+                        player['team_id'] = team_id
+                        player['league_id'] = 'EUROLEAGUE'
 
-                        # If we don't have hometown data, flag for lookup
-                        if not player.get('hometown_state') or not player.get('high_school'):
-                            player['needs_hometown_lookup'] = True
-                            logger.debug(f"    Flagged for hometown lookup: {player['full_name']}")
+                        # Check if American and needs hometown lookup
+                        if player.get('is_american'):
+                            american_players += 1
 
-                    # Validate player data
-                    is_valid, errors = self.validator.validate_player(player)
-                    if not is_valid:
-                        logger.warning(f"    Invalid player data: {player.get('full_name', 'Unknown')}: {errors}")
-                        continue
+                            # If we don't have hometown data, flag for lookup
+                            if not player.get('hometown_state') or not player.get('high_school'):
+                                player['needs_hometown_lookup'] = True
+                                logger.debug(f"    Flagged for hometown lookup: {player['full_name']}")
 
-                    # Save to database
-                    if self.db.upsert_player(player):
-                        total_players += 1
-                    else:
-                        logger.warning(f"    Failed to save player: {player['full_name']}")
+                        # Validate player data
+                        is_valid, errors = self.validator.validate_player(player)
+                        if not is_valid:
+                            logger.warning(f"    Invalid player data: {player.get('full_name', 'Unknown')}: {errors}")
+                            continue
+
+                        valid_players.append(player)
 
+                    # Hand the roster to the writer thread and move straight on
+                    # to scraping the next team
+                    if valid_players:
+                        pending_writes.append(
+                            (team_name, len(valid_players),
+                             writer.submit(self.db.upsert_players, valid_players))
+                        )
+
+                except Exception as e:
+                    logger.error(f"Error processing roster for {team_name}: {e}")
+
+        # Leaving the with-block waited for every write; collect the results
+        for team_name, count, future in pending_writes:
+            try:
+                if future.result():
+                    total_players += count
+                else:
+                    logger.warning(f"  Failed to save roster for {team_name}")
             except Exception as e:
-                logger.error(f"Error processing roster for {team_name}: {e}")
+                logger.error(f"Error saving roster for {team_name}: {e}")
 
         logger.info(f"Rosters sync complete: {total_players} players saved")
         logger.info(f"American players found: {american_players}")
@@ -538,6 +571,9 @@ class EuroLeaguePipeline:
             # Track counts
             saved_count = 0
 
+            # Valid games are collected here and saved together below
+            valid_games = []
+
             for game in schedule:
                 try:
                     # Validate game data
@@ -546,15 +582,19 @@ class EuroLeaguePipeline:
                         logger.warning(f"Invalid game data: {game.get('game_id', 'Unknown')}: {errors}")
                         continue
 
-                    # Save to database
-                    if self.db.upsert_game(game):
-                        saved_count += 1
-                    else:
-                        logger.warning(f"Failed to save game: {game.get('game_id', 'Unknown')}")
+                    valid_games.append(game)
 
                 except Exception as e:
                     logger.error(f"Error processing game: {e}")
 
+            # Save to database in batched statements (500 games each)
+            # instead of one round-trip per game
+            if valid_games:
+                if self.db.upsert_games(valid_games):
+                    saved_count = len(valid_games)
+                else:
+                    logger.warning(f"Failed to save {len(valid_games)} games")
+
             logger.info(f"Schedule sync complete: {saved_count} games saved")
 
         except Exception as e:
@@ -768,21 +808,23 @@ class EuroLeaguePipeline:
                             stats.get('quarter_scores', {})
                         )
 
-                    # Insert player stats
+                    # Validate player stats
+                    valid_stats = []
                     for player_stat in stats.get('player_stats', []):
-                        # Validate stat data
                         is_valid, errors = self.validator.validate_game_stat(player_stat)
                         if not is_valid:
                             logger.warning(f"Invalid stat data: {errors}")
                             continue
 
-                        self.db.insert_game_stat(game_id, player_stat)
-
-                    # Mark game as scraped
-                    self.db.mark_game_stats_scraped(game_id)
+                        valid_stats.append(player_stat)
 
-                    success_count += 1
-                    logger.info(f"  Saved {len(stats.get('player_stats', []))} player stats")
+                    # Save the stats and mark the game as scraped together
+                    if self.db.finalize_game_stats(game_id, valid_stats):
+                        success_count += 1
+                        logger.info(f"  Saved {len(valid_stats)} player stats")
+                    else:
+                        logger.warning(f"  Failed to save stats for game {game_id}")
+                        error_count += 1
 
                 else:
                     logger.warning(f"  No stats found for game {game_id}")
@@ -809,7 +851,7 @@ class EuroLeaguePipeline:
         --------------
         output/json/
         ├── american_players_{date}.json    - All American players with hometown data
-        ├── teams_{date}.json               - All teams
+        ├── teams_{date}.json               - All teams with their American players
         ├── schedule_{date}.json            - Full schedule with American player info
         └── upcoming_games_{date}.json      - Games in the next 14 days
 
@@ -834,13 +876,22 @@ class EuroLeaguePipeline:
         # Use today's date in filenames
         timestamp = datetime.now().strftime('%Y%m%d')
 
+        # Start the independent queries together. Each one borrows its own
+        # pooled connection, so the wait is the slowest query rather than
+        # the sum of all of them. Errors come out of .result() below and
+        # are handled by each export's own try/except.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            players_future = executor.submit(self.db.get_american_players_with_hometown)
+            teams_future = executor.submit(self.db.get_dashboard_payload)
+            upcoming_future = executor.submit(self.db.get_upcoming_american_games, days_ahead=14)
+
         # =====================================================================
         # EXPORT 1: AMERICAN PLAYERS
         # =====================================================================
         logger.info("Exporting American players...")
 
         try:
-            american_players = self.db.get_american_players_with_hometown()
+            american_players = players_future.result()
 
             # Build the export structure
             export_data = {
@@ -868,7 +919,7 @@ class EuroLeaguePipeline:
         logger.info("Exporting teams...")
 
         try:
-            teams = self.db.get_all_teams()
+            teams = teams_future.result()
 
             export_data = {
                 'export_date': datetime.now().isoformat(),
@@ -892,20 +943,26 @@ class EuroLeaguePipeline:
         logger.info("Exporting schedule...")
 
         try:
-            schedule = self.db.get_schedule_with_americans()
-
-            export_data = {
-                'export_date': datetime.now().isoformat(),
-                'league': 'EuroLeague',
-                'game_count': len(schedule),
-                'games': schedule
-            }
-
+            # The schedule is the biggest export, so games are streamed from
+            # the database cursor straight into the file instead of being
+            # loaded into one big list first. game_count is written last
+            # because it's only known once every game has been written.
             filepath = os.path.join(output_dir, f'schedule_{timestamp}.json')
+            game_count = 0
             with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, default=str)
-
-            logger.info(f"  Saved {len(schedule)} games to {filepath}")
+                f.write('{\n')
+                f.write(f'  "export_date": {json.dumps(datetime.now().isoformat())},\n')
+                f.write('  "league": "EuroLeague",\n')
+                f.write('  "games": [')
+                for game in self.db.iter_schedule_with_americans():
+                    f.write(',\n    ' if game_count else '\n    ')
+                    f.write(json.dumps(game, default=str))
+                    game_count += 1
+                f.write('\n  ],\n' if game_count else '],\n')
+                f.write(f'  "game_count": {game_count}\n')
+                f.write('}\n')
+
+            logger.info(f"  Saved {game_count} games to {filepath}")
 
         except Exception as e:
             logger.error(f"Error exporting schedule: {e}")
@@ -916,7 +973,7 @@ class EuroLeaguePipeline:
         logger.info("Exporting upcoming games...")
 
         try:
-            upcoming = self.db.get_upcoming_american_games(days_ahead=14)
+            upcoming = upcoming_future.result()
 
             export_data = {
                 'export_date': datetime.now().isoformat(),
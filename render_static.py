@@ -0,0 +1,79 @@
+"""
+=============================================================================
+RENDER STATIC DASHBOARD PAGES
+=============================================================================
+
+PURPOSE:
+    Pre-render the dashboard's pages to plain HTML files.
+    The data only changes when the scrapers run, so there's no need to
+    render the same pages again for every visitor.
+
+HOW TO USE:
+    Run it after join_data.py has written fresh summary files:
+        python render_static.py
+
+OUTPUT FILES (saved to output/html/):
+    - index.html: The full player list (default sort, no filters)
+    - player/<code>.html: One page per player with their game log
+
+HOW THE FILES ARE USED:
+    dashboard.py serves these files directly when they are at least as new
+    as the JSON they were rendered from. Filtered/sorted views of the list
+    are still rendered per request. The files can also be served by any
+    static web server.
+
+DEPENDENCIES:
+    pip install flask   (uses the templates in dashboard.py)
+"""
+
+import logging
+import os
+
+from dashboard import (
+    PLAYER_TPL,
+    STATIC_HTML_DIR,
+    load_latest_data,
+    load_unified_players,
+    render_home,
+)
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def write_page(relative_path, html):
+    """
+    Write one rendered page into output/html.
+
+    PARAMETERS:
+        relative_path (str): Path inside output/html, e.g. 'player/ABC.html'
+        html (str): The rendered page
+    """
+    path = os.path.join(STATIC_HTML_DIR, relative_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(html)
+
+
+def main():
+    """Render the home page and every player page."""
+    write_page('index.html', render_home(load_latest_data()))
+    logger.info(f"Rendered: {os.path.join(STATIC_HTML_DIR, 'index.html')}")
+
+    count = 0
+    for player in load_unified_players():
+        code = player.get('code')
+        if not code:
+            continue
+        write_page(os.path.join('player', f'{code}.html'), PLAYER_TPL.render(player=player))
+        count += 1
+
+    logger.info(f"Rendered {count} player pages to {os.path.join(STATIC_HTML_DIR, 'player')}")
+
+
+if __name__ == '__main__':
+    main()
@@ -251,36 +251,42 @@ class PhotoProcessor:
             photos: List of photo metadata dicts
             db: Database connector
         """
-        for i, photo in enumerate(photos):
-            try:
-                query = """
-                    INSERT INTO player_photos (
-                        player_id, photo_url, photo_source,
-                        width, height, aspect_ratio, aspect_ratio_decimal,
-                        is_primary, is_16x9, is_square, url_valid
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    ON DUPLICATE KEY UPDATE
-                        width = VALUES(width),
-                        height = VALUES(height),
-                        url_valid = VALUES(url_valid),
-                        last_validated = CURRENT_TIMESTAMP
-                """
-                params = (
-                    player_id,
-                    photo['url'],
-                    photo.get('source', 'unknown'),
-                    photo.get('width'),
-                    photo.get('height'),
-                    photo.get('aspect_ratio_label'),
-                    photo.get('aspect_ratio'),
-                    i == 0,  # First photo is primary
-                    photo.get('is_16x9', False),
-                    photo.get('is_square', False),
-                    photo.get('is_valid', False)
-                )
-                db.execute(query, params)
-            except Exception as e:
-                self.logger.error(f"Error saving photo for {player_id}: {e}")
+        # One transaction for all of this player's photos - a single commit
+        # instead of one per photo
+        try:
+            with db.transaction():
+                for i, photo in enumerate(photos):
+                    try:
+                        query = """
+                            INSERT INTO player_photos (
+                                player_id, photo_url, photo_source,
+                                width, height, aspect_ratio, aspect_ratio_decimal,
+                                is_primary, is_16x9, is_square, url_valid
+                            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                            ON DUPLICATE KEY UPDATE
+                                width = VALUES(width),
+                                height = VALUES(height),
+                                url_valid = VALUES(url_valid),
+                                last_validated = CURRENT_TIMESTAMP
+                        """
+                        params = (
+                            player_id,
+                            photo['url'],
+                            photo.get('source', 'unknown'),
+                            photo.get('width'),
+                            photo.get('height'),
+                            photo.get('aspect_ratio_label'),
+                            photo.get('aspect_ratio'),
+                            i == 0,  # First photo is primary
+                            photo.get('is_16x9', False),
+                            photo.get('is_square', False),
+                            photo.get('is_valid', False)
+                        )
+                        db.execute(query, params)
+                    except Exception as e:
+                        self.logger.error(f"Error saving photo for {player_id}: {e}")
+        except Exception as e:
+            self.logger.error(f"Error saving photos for {player_id}: {e}")
 
     def find_best_photos_for_player(self, player_id: str, db) -> Dict:
         """
@@ -35,7 +35,10 @@ import os
 # This lets us run tests from the tests/ directory
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from daily_scraper import is_american, process_games, extract_american_performances
+from daily_scraper import (
+    is_american, process_games, extract_american_performances, summarize_player_stats
+)
+from utils.rate_limit import TokenBucket
 
 
 # =============================================================================
@@ -225,6 +228,7 @@ class TestExtractAmericanPerformances:
         assert perf['rebounds'] == 5
         assert perf['assists'] == 8
         assert perf['minutes'] == 30.0  # Should be converted from seconds
+        assert perf['opponent'] == 'FC Barcelona'  # Home player faces the road team
 
     def test_extract_american_performances_no_americans(self, sample_game):
         """
@@ -251,6 +255,39 @@ class TestExtractAmericanPerformances:
         result = extract_american_performances(sample_game, stats)
         assert len(result) == 0
 
+    def test_extract_american_performances_with_american_codes(
+        self, sample_game, sample_stats_with_american
+    ):
+        """
+        Test that players outside american_codes are skipped.
+
+        main() passes the codes of known Americans so the box score scan
+        can skip everyone else with a set lookup.
+        """
+        result = extract_american_performances(
+            sample_game, sample_stats_with_american, american_codes={'PJTU'}
+        )
+        assert len(result) == 1
+
+        result = extract_american_performances(
+            sample_game, sample_stats_with_american, american_codes={'OTHER'}
+        )
+        assert result == []
+
+    def test_extract_american_performances_with_empty_american_codes(
+        self, sample_game, sample_stats_with_american
+    ):
+        """
+        Test that an empty american_codes set doesn't skip everyone.
+
+        If the player fetch fails there are no known codes; the box score
+        scan should then fall back to the country checks.
+        """
+        result = extract_american_performances(
+            sample_game, sample_stats_with_american, american_codes=set()
+        )
+        assert len(result) == 1
+
     def test_extract_american_performances_with_none_stats(self, sample_game):
         """
         Test that None stats input returns empty list.
@@ -259,6 +296,97 @@ class TestExtractAmericanPerformances:
         assert result == []
 
 
+# =============================================================================
+# TESTS FOR summarize_player_stats()
+# =============================================================================
+
+class TestSummarizePlayerStats:
+    """Tests for the summarize_player_stats() function."""
+
+    @staticmethod
+    def make_perf(code, points, rebounds=0, assists=0):
+        """Build a minimal performance row like extract_american_performances()."""
+        return {
+            'player_code': code,
+            'player_name': f'Player, {code}',
+            'team': 'Real Madrid',
+            'opponent': 'FC Barcelona',
+            'nationality': 'United States',
+            'date': '2025-01-15T19:00:00',
+            'local_team': 'Real Madrid',
+            'road_team': 'FC Barcelona',
+            'points': points,
+            'rebounds': rebounds,
+            'assists': assists,
+            'minutes': 30.0,
+        }
+
+    def test_summarize_player_stats_averages(self):
+        """
+        Test that totals and per-game averages are calculated per player.
+        """
+        perfs = [self.make_perf('A', 10, 4, 2), self.make_perf('A', 21, 5, None)]
+        result = summarize_player_stats(perfs)
+
+        assert len(result) == 1
+        ps = result[0]
+        assert ps['games_played'] == 2
+        assert ps['total_points'] == 31
+        assert ps['ppg'] == 15.5
+        assert ps['rpg'] == 4.5
+        assert ps['apg'] == 1.0  # None counts as 0
+        assert ps['performances'][0]['opponent'] == 'FC Barcelona'
+
+    def test_summarize_player_stats_sorted_by_ppg(self):
+        """
+        Test that players come back sorted by PPG, highest first.
+        """
+        perfs = [self.make_perf('LOW', 5), self.make_perf('HIGH', 25)]
+        result = summarize_player_stats(perfs)
+        assert [ps['player_code'] for ps in result] == ['HIGH', 'LOW']
+
+    def test_summarize_player_stats_empty(self):
+        """
+        Test that no performances gives an empty summary.
+        """
+        assert summarize_player_stats([]) == []
+
+
+# =============================================================================
+# TESTS FOR TokenBucket
+# =============================================================================
+
+class TestTokenBucket:
+    """Tests for the TokenBucket rate limiter."""
+
+    def test_token_bucket_burst_does_not_wait(self, monkeypatch):
+        """
+        Test that calls within the burst size never sleep.
+        """
+        sleeps = []
+        monkeypatch.setattr('utils.rate_limit.time.sleep', sleeps.append)
+
+        bucket = TokenBucket(5)
+        for _ in range(5):
+            bucket.take()
+
+        assert sleeps == []
+
+    def test_token_bucket_waits_when_over_rate(self, monkeypatch):
+        """
+        Test that going past the burst size sleeps for about 1/rate seconds.
+        """
+        sleeps = []
+        monkeypatch.setattr('utils.rate_limit.time.sleep', sleeps.append)
+
+        bucket = TokenBucket(5)
+        for _ in range(6):
+            bucket.take()
+
+        assert len(sleeps) == 1
+        assert 0 < sleeps[0] <= 0.2
+
+
 # =============================================================================
 # RUN TESTS
 # =============================================================================
@@ -15,7 +15,9 @@ import os
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from hometown_lookup_fixed import clean_name, parse_infobox, US_STATES, STATE_ABBREVS
+from hometown_lookup_fixed import (
+    clean_name, parse_infobox, pick_best_title, US_STATES, STATE_ABBREVS
+)
 
 
 # =============================================================================
@@ -178,6 +180,100 @@ class TestParseInfobox:
         # Ontario is not a US state, so should not be extracted
         assert result['hometown_state'] is None
 
+    def test_parse_infobox_place_template(self):
+        """
+        Test that {{city-state|...}} birthplaces and <ref> tags are handled.
+
+        Needs mwparserfromhell; the regex fallback drops templates.
+        """
+        pytest.importorskip('mwparserfromhell')
+        wikitext = """
+{{Infobox basketball biography
+| birth_place = {{city-state|Chicago|Illinois}}<ref>{{cite web|url=x}}</ref>
+| birth_date = {{birth date and age|1990|5|15}}
+| high_school = Simeon<!-- Career Academy -->
+}}
+"""
+        result = parse_infobox(wikitext)
+
+        assert result['hometown_city'] == 'Chicago'
+        assert result['hometown_state'] == 'Illinois'
+        assert result['high_school'] == 'Simeon'
+
+    def test_parse_infobox_ubl_college(self):
+        """
+        Test that {{ubl|...}} lists (players with several schools) keep
+        their first school instead of being dropped.
+
+        Needs mwparserfromhell; the regex fallback reads the raw links.
+        """
+        pytest.importorskip('mwparserfromhell')
+        wikitext = """
+{{Infobox basketball biography
+| high_school = {{ubl|[[Benson High School (Arizona)|Benson]] (Benson, Arizona)|[[Findlay Prep]] (Henderson, Nevada)}}
+| college = {{ubl|[[Eastern Arizona College|Eastern Arizona]] (2009–2010)|[[Lamar Cardinals basketball|Lamar]] (2010–2012)}}
+}}
+"""
+        result = parse_infobox(wikitext)
+
+        assert result['college'] == 'Eastern Arizona'
+        assert result['high_school'] == 'Benson'
+
+    def test_parse_infobox_plainlist_college(self):
+        """
+        Test that {{plainlist|...}} college lists keep their first school.
+        """
+        pytest.importorskip('mwparserfromhell')
+        wikitext = """
+{{Infobox basketball biography
+| college = {{plainlist|
+* [[Chipola College|Chipola]] (2011–2012)<ref>{{cite web|url=x}}</ref>
+* [[Oregon Ducks men's basketball|Oregon]] (2012–2014)
+}}
+}}
+"""
+        result = parse_infobox(wikitext)
+
+        assert result['college'] == 'Chipola'
+
+
+# =============================================================================
+# TESTS FOR pick_best_title()
+# =============================================================================
+
+class TestPickBestTitle:
+    """Tests for the pick_best_title() function."""
+
+    def test_pick_best_title_prefers_matching_title(self):
+        """
+        Test that the title matching the player's name wins over a
+        higher-ranked search result that doesn't.
+        """
+        titles = ['Booker T. Washington', 'Devin Booker (basketball, born 1991)']
+        assert pick_best_title('Devin Booker', titles) == 'Devin Booker (basketball, born 1991)'
+
+    def test_pick_best_title_ignores_suffix(self):
+        """
+        Test that a 'Jr.' in the article title still matches.
+        """
+        titles = ['Porter Moser', 'Michael Porter Jr.']
+        assert pick_best_title('Michael Porter', titles) == 'Michael Porter Jr.'
+
+    def test_pick_best_title_no_titles(self):
+        """
+        Test that no search results gives None.
+        """
+        assert pick_best_title('Devin Booker', []) is None
+
+    def test_pick_best_title_rejects_poor_match(self):
+        """
+        Test that unrelated titles are rejected instead of taking the first.
+
+        Needs rapidfuzz; without it the first result is used.
+        """
+        pytest.importorskip('rapidfuzz')
+        assert pick_best_title('Devin Booker', ['Jalen Brunson', 'Chicago Bulls']) is None
+
 
 # =============================================================================
 # TESTS FOR STATE DATA
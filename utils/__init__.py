@@ -2,3 +2,4 @@
 from .name_normalizer import NameNormalizer
 from .date_utils import DateUtils
 from .image_utils import ImageUtils
+from .rate_limit import TokenBucket
@@ -0,0 +1,47 @@
+"""
+Rate limiting shared by the scrapers' worker threads.
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+
+    Allows up to `rate` calls per second on average, with bursts of up to
+    `rate` calls. take() only sleeps when callers get ahead of the rate -
+    time already spent waiting on the API counts toward it, so slow
+    responses are never padded with an extra fixed delay.
+
+    Example:
+        bucket = TokenBucket(8)
+        bucket.take()  # Returns immediately while tokens are left
+    """
+
+    def __init__(self, rate: float):
+        """
+        Args:
+            rate: Calls per second (also the burst size)
+        """
+        self.rate = rate
+        self.tokens = rate
+        self.last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def take(self):
+        """Take one token, sleeping until one is available if needed."""
+        with self._lock:
+            now = time.monotonic()
+            # Refill for the time since the last call, capped at the burst size
+            self.tokens = min(self.rate, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+
+            # Claim a token now; if that leaves us in debt, wait it off
+            # outside the lock so other threads can queue up behind us
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+
+        if wait:
+            time.sleep(wait)